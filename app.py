@@ -1,62 +1,145 @@
 import streamlit as st
-from bs4 import BeautifulSoup
+from streamlit.errors import StreamlitAPIException
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime
-import time
+import os
+import uuid
 
-# 구글시트 연동을 위한 import
-try:
-    from streamlit_gsheets import GSheetsConnection
-    GSHEETS_AVAILABLE = True
-except ImportError:
-    GSHEETS_AVAILABLE = False
-    st.warning("⚠️ streamlit-gsheets가 설치되지 않았습니다. 'pip install st-gsheets-connection' 명령으로 설치해주세요.")
+from keyword_core.cache import SheetCache, load_with_edits
+from keyword_core.dedupe import KeywordIndex
+from keyword_core.extraction import extract_keywords, filter_new_keywords, split_manual_keywords
+from keyword_core.filters import FilterEngine, compile_filters, stats_query
+from keyword_core.frame import display_date
+from keyword_core.instrumentation import METRICS, instrumented, span
+from keyword_core.profiles import AUTO_PROFILE, load_profiles
+from keyword_core.similarity import DEFAULT_THRESHOLD, find_near_duplicates
+from keyword_core.storage import GSheetsStore, SQLiteStore, TOMBSTONE, new_keyword_rows, to_sheet_value, usage_changes
+from keyword_core.write_queue import WriteBehindQueue
+
+# ---------------- 설정 & 공유 캐시 ----------------
+
+def get_app_setting(key, default):
+    """앱 설정 조회 (환경변수 KEYWORD_<KEY> → secrets.toml [app] 섹션 → 기본값)"""
+    env_value = os.environ.get(f"KEYWORD_{key.upper()}")
+    if env_value is not None:
+        return type(default)(env_value)
+    
+    try:
+        return type(default)(st.secrets.get("app", {}).get(key, default))
+    except Exception:
+        return default
+
+@st.cache_resource
+def get_sheet_cache():
+    """프로세스 전체에서 공유하는 키워드 캐시"""
+    return SheetCache(ttl=get_app_setting("sheet_cache_ttl", 30.0))
+
+def get_session_id():
+    """브라우저 세션 식별자 (공유 캐시 변경 기록에서 내 변경과 다른 세션의 변경을 구분)"""
+    if 'session_id' not in st.session_state:
+        st.session_state['session_id'] = uuid.uuid4().hex
+    return st.session_state['session_id']
+
+def invalidate_sheet_cache():
+    """앱에서 저장소에 쓴 뒤 공유 캐시 무효화"""
+    get_sheet_cache().invalidate()
+
+@st.cache_resource
+def get_filter_engine():
+    """프로세스 전체에서 공유하는 관리 화면 필터 엔진 (조건별 마스크 캐시)"""
+    return FilterEngine()
+
+@st.cache_resource
+def get_write_queue(_store):
+    """프로세스 전체에서 공유하는 키워드 수정 쓰기 지연 큐
+    
+    삭제 표시가 compact_threshold개 이상 쌓이면 큐가 빈 뒤에 백그라운드에서 정리합니다(0이면 자동 정리 안 함).
+    반영을 포기한 수정이 생기면 화면에 먼저 반영해 둔 값을 버리도록 공유 캐시를 무효화합니다.
+    """
+    cache = get_sheet_cache()
+    compact_threshold = get_app_setting("compact_threshold", 50)
+    
+    def compact_if_needed():
+        if compact_threshold and cache.tombstone_count >= compact_threshold:
+            _store.compact()
+            cache.mark_compacted()
+    
+    return WriteBehindQueue(
+        _store.patch,
+        interval=get_app_setting("write_flush_interval", 3.0),
+        batch_size=get_app_setting("write_batch_size", 200),
+        on_drained=compact_if_needed,
+        on_dropped=lambda entries: cache.invalidate()
+    )
+
+@st.cache_resource
+def get_extraction_profiles():
+    """secrets.toml [extraction_profiles]의 추출 프로필을 한 번만 컴파일해 공유 ({이름: 프로필})"""
+    try:
+        config = st.secrets.get("extraction_profiles", {})
+    except Exception:
+        config = {}
+    return load_profiles({name: dict(options) for name, options in config.items()})
+
+def finish_run_metrics(record):
+    """실행 기록을 끝내고 디버그 패널용으로 보관, 설정된 경로가 있으면 파일로 내보내기
+    
+    metrics_jsonl: 실행 기록을 한 줄씩 추가할 JSON lines 파일
+    metrics_prometheus: 누적 값을 덮어쓸 Prometheus 텍스트 파일 (node_exporter textfile 수집용)
+    """
+    METRICS.end_run(record)
+    st.session_state['last_run_metrics'] = record.to_dict()
+    try:
+        jsonl_path = get_app_setting("metrics_jsonl", "")
+        if jsonl_path:
+            METRICS.append_jsonl(jsonl_path, record)
+        prometheus_path = get_app_setting("metrics_prometheus", "")
+        if prometheus_path:
+            METRICS.write_prometheus(prometheus_path)
+    except OSError as e:
+        st.session_state['metrics_export_error'] = str(e)
+
+@contextmanager
+def fragment_run_metrics(label):
+    """조각만 다시 실행될 때는 따로 실행 기록을 남기고, 앱 전체 실행 중이면 그 기록에 합침"""
+    if METRICS.current is not None:
+        yield
+        return
+    record = METRICS.begin_run(label, session=get_session_id())
+    try:
+        yield
+    finally:
+        finish_run_metrics(record)
 
 # ---------------- 유틸리티 함수들 ----------------
 
-def parse_keywords_from_html(html_content, existing_keywords=None):
-    """HTML에서 키워드 추출 (중복 제거 포함)"""
+@instrumented('app.parse_html')
+def parse_keywords_from_html(html_content, existing_keywords=None, profile=None):
+    """HTML에서 키워드 추출 (중복 제거 포함, profile이 'auto'면 프로필 자동 감지)"""
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        selector = '.keyword, .keyword-blur, .end-board-td-blur'
-        keyword_tags = soup.select(selector)
-        
-        if existing_keywords is None:
-            existing_keywords = set()
-        
-        seen = set()
-        unique_keywords = []
-        duplicate_count = 0
-        
-        for tag in keyword_tags:
-            text = tag.get_text(strip=True)
-            if text and len(text) >= 2:
-                # 기존 키워드와 중복 체크
-                if text in existing_keywords:
-                    duplicate_count += 1
-                    continue
-                
-                # 이번 추출에서 중복 체크
-                if text not in seen:
-                    seen.add(text)
-                    unique_keywords.append(text)
+        profiles = get_extraction_profiles()
+        if profile is None:
+            profile = get_app_setting("extraction_profile", "default")
+        unique_keywords, extraction_info = extract_keywords(
+            html_content, existing_keywords, profile=profile, profiles=profiles
+        )
         
         # 중복 제거 정보를 세션에 저장
-        st.session_state['extraction_info'] = {
-            'total_found': len(keyword_tags),
-            'duplicates_removed': duplicate_count,
-            'new_keywords': len(unique_keywords)
-        }
+        st.session_state['extraction_info'] = extraction_info
         
-        return unique_keywords[:100]  # 최대 100개
+        return unique_keywords  # 프로필의 최대 개수까지
         
     except Exception as e:
         st.error(f"HTML 분석 중 오류: {e}")
         return []
 
 def get_google_sheet_connection():
-    """구글시트 연결"""
-    if not GSHEETS_AVAILABLE:
+    """구글시트 연결 (구글시트 저장소를 쓸 때만 streamlit-gsheets를 불러옴)"""
+    try:
+        from streamlit_gsheets import GSheetsConnection
+    except ImportError:
+        st.warning("⚠️ streamlit-gsheets가 설치되지 않았습니다. 'pip install st-gsheets-connection' 명령으로 설치해주세요.")
         return None
     
     try:
@@ -66,211 +149,150 @@ def get_google_sheet_connection():
         st.error(f"구글시트 연결 실패: {e}")
         return None
 
-def save_keywords_to_sheet(conn, project_name, keywords_list):
-    """키워드를 구글시트에 저장"""
-    if not conn:
+@st.cache_resource
+def _get_gsheets_store(_conn):
+    """구글시트 저장소 (ID → 행 번호 인덱스를 모든 세션이 공유)"""
+    return GSheetsStore(_conn)
+
+@st.cache_resource
+def _get_sqlite_store(path):
+    """로컬 SQLite 저장소"""
+    return SQLiteStore(path)
+
+@st.cache_resource
+def get_fake_sheet_connection():
+    """구글시트 대신 쓰는 로컬 가짜 연결 (오프라인 프로파일링·부하 테스트용, 지연/할당량/일관성 지연 설정 가능)"""
+    from keyword_core.fake_sheets import FakeSheetsConnection
+    
+    path = get_app_setting("fake_sheets_path", "fake_sheets.json")
+    rate_limit = get_app_setting("fake_sheets_rate_limit", 0)
+    return FakeSheetsConnection(
+        path or None,
+        worksheets={"키워드관리": []},
+        latency=get_app_setting("fake_sheets_latency", 0.0),
+        row_latency=get_app_setting("fake_sheets_row_latency", 0.0),
+        rate_limit=rate_limit or None,
+        error_rate=get_app_setting("fake_sheets_error_rate", 0.0),
+        consistency_delay=get_app_setting("fake_sheets_consistency_delay", 0.0),
+    )
+
+def get_keyword_store():
+    """설정(storage_backend)에 맞는 키워드 저장소 (gsheets 기본, sqlite·fake_gsheets 선택 가능)"""
+    backend = get_app_setting("storage_backend", "gsheets")
+    if backend == "sqlite":
+        try:
+            return _get_sqlite_store(get_app_setting("sqlite_path", "keywords.db"))
+        except Exception as e:
+            st.error(f"SQLite 저장소 열기 실패: {e}")
+            return None
+    
+    conn = get_fake_sheet_connection() if backend == "fake_gsheets" else get_google_sheet_connection()
+    return _get_gsheets_store(conn) if conn else None
+
+def save_keywords_to_sheet(store, project_name, keywords_list):
+    """키워드를 저장소에 저장 (새 행만 추가)"""
+    if not store:
         return False
     
     try:
         # 새로운 데이터 준비
-        new_data = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        for keyword in keywords_list:
-            new_data.append({
-                '날짜': current_time,
-                '프로젝트명': project_name,
-                '키워드': keyword,
-                '사용여부': '❌',
-                '티스토리작성': '❌',
-                '블로그스팟작성': '❌',
-                '메모': ''
-            })
-        
-        # 데이터프레임으로 변환
-        new_df = pd.DataFrame(new_data)
-        
-        # 기존 데이터 읽기 시도
-        existing_df = pd.DataFrame()
-        sheet_names = ["키워드관리", "Sheet1", "시트1", None]
-        used_sheet_name = None
-        
-        for sheet_name in sheet_names:
-            try:
-                if sheet_name:
-                    existing_df = conn.read(worksheet=sheet_name)
-                else:
-                    existing_df = conn.read()
-                
-                if not existing_df.empty:
-                    used_sheet_name = sheet_name
-                    break
-                    
-            except:
-                continue
-        
-        # 기존 데이터와 병합
-        if not existing_df.empty:
-            # 기존 데이터에 새로운 컬럼이 없으면 추가
-            if '티스토리작성' not in existing_df.columns:
-                existing_df['티스토리작성'] = '❌'
-            if '블로그스팟작성' not in existing_df.columns:
-                existing_df['블로그스팟작성'] = '❌'
-            
-            updated_df = pd.concat([existing_df, new_df], ignore_index=True)
-        else:
-            updated_df = new_df
-            used_sheet_name = "Sheet1"  # 기본 시트 이름
+        new_data = new_keyword_rows(project_name, keywords_list)
         
-        # 업데이트
-        if used_sheet_name:
-            conn.update(worksheet=used_sheet_name, data=updated_df)
-            st.session_state['last_saved_sheet'] = used_sheet_name
-        else:
-            conn.update(data=updated_df)
-            st.session_state['last_saved_sheet'] = "기본 시트"
-            
+        used_location = store.append(new_data)
+        st.session_state['last_saved_sheet'] = used_location or "기본 시트"
+        # 다시 읽지 않고 공유 캐시와 중복 검사 인덱스에 새 행만 추가
+        get_sheet_cache().add_rows(new_data, origin=get_session_id())
         return True
         
     except Exception as e:
         st.error(f"키워드 저장 실패: {e}")
         return False
 
-def load_keywords_from_sheet(conn, force_refresh=False):
-    """구글시트에서 키워드 불러오기 (강제 새로고침 옵션)"""
-    if not conn:
+def compact_keyword_sheet(store):
+    """삭제 표시된 행들을 저장소에서 실제로 제거, 제거한 행 수 반환 (쓰기 지연 큐가 빈 뒤에 호출, 실패하면 None)"""
+    if not store:
+        return 0
+    
+    try:
+        removed = store.compact()
+        # 정리한 행은 캐시에서 이미 빠져 있으므로 다시 읽지 않음
+        get_sheet_cache().mark_compacted()
+        return removed
+        
+    except Exception as e:
+        st.error(f"❌ 삭제 정리 실패: {e}")
+        return None
+
+@instrumented('app.load_keywords')
+def load_keywords_from_sheet(store, force_refresh=False):
+    """저장소에서 키워드 불러오기 (공유 캐시 사용, 강제 새로고침 옵션)"""
+    if not store:
         return pd.DataFrame()
     
     try:
-        # 강제 새로고침 시 캐시 완전 클리어
+        # 강제 새로고침 시 세션의 로드 메시지 상태 초기화 (데이터는 세션에 따로 두지 않음)
         if force_refresh:
             for key in list(st.session_state.keys()):
-                if any(cache_key in key for cache_key in ['saved_keywords', 'existing_keywords', 'sheet_load']):
+                if 'sheet_load' in key:
                     del st.session_state[key]
         
-        # 여러 시트 이름 시도
-        sheet_names = ["키워드관리", "Sheet1", "시트1", None]  # None은 첫 번째 시트
+        cache = get_sheet_cache()
+        write_queue = get_write_queue(store)
         
-        for sheet_name in sheet_names:
-            try:
-                if sheet_name:
-                    df = conn.read(worksheet=sheet_name, ttl=0)  # 캐시 무시
-                else:
-                    df = conn.read(ttl=0)  # 캐시 무시하여 첫 번째 시트 읽기
-                
-                # 데이터가 있고 필요한 컬럼이 있는지 확인
-                if not df.empty and '키워드' in df.columns:
-                    # 새로운 컬럼이 없으면 기본값으로 추가
-                    if '티스토리작성' not in df.columns:
-                        df['티스토리작성'] = '❌'
-                    if '블로그스팟작성' not in df.columns:
-                        df['블로그스팟작성'] = '❌'
-                    
-                    # 강제 새로고침이 아닌 경우에만 성공 메시지 저장
-                    if not force_refresh and 'sheet_load_success' not in st.session_state:
-                        st.session_state['sheet_load_success'] = f"시트 '{sheet_name or '첫번째 시트'}'"
-                    return df
-                    
-            except Exception as sheet_error:
-                continue
+        def loader():
+            # 반영 중이거나 대기 중인 수정은 새로 읽은 데이터 위에 다시 덮어씀 (읽는 도중 반영이 끝난 수정 포함)
+            return load_with_edits(store.load, write_queue.pending_edits)
         
-        # 모든 시트에서 실패한 경우
-        if not force_refresh:
-            st.warning("⚠️ 키워드 데이터를 찾을 수 없습니다. 구글시트를 확인해주세요.")
-        return pd.DataFrame()
+        # 우리 쪽 쓰기는 캐시에 바로 반영되므로 ttl이 지난 데이터는 백그라운드에서 다시 읽어 맞춤
+        df = cache.get(loader, force=force_refresh, background=True)
+        # 이 세션이 화면에 그린 데이터 버전 (다른 세션의 변경 알림 기준)
+        st.session_state['seen_cache_version'] = cache.version
+        
+        # 세션당 한번만 성공 메시지 저장
+        if not df.empty and not force_refresh and 'load_notice_shown' not in st.session_state:
+            st.session_state['load_notice_shown'] = True
+            st.session_state['sheet_load_success'] = f"{store.display_name} '{store.location or '첫번째 시트'}'"
+        return df
         
     except Exception as e:
         if not force_refresh:
-            st.error(f"❌ 구글시트 연결 오류: {e}")
+            st.error(f"❌ {store.display_name} 연결 오류: {e}")
         return pd.DataFrame()
 
-def update_keyword_usage(conn, original_index, used_status, tistory_status=False, blogspot_status=False, memo=""):
-    """키워드 사용여부 및 블로그 작성 상태 업데이트"""
-    if not conn:
-        return False
-    
-    try:
-        # 원본 데이터 읽기
-        sheet_names = ["키워드관리", "Sheet1", "시트1", None]
-        
-        for sheet_name in sheet_names:
-            try:
-                if sheet_name:
-                    df = conn.read(worksheet=sheet_name)
-                else:
-                    df = conn.read()
-                
-                if not df.empty and '키워드' in df.columns and original_index < len(df):
-                    # 사용여부 업데이트
-                    df.loc[original_index, '사용여부'] = '✅' if used_status else '❌'
-                    
-                    # 티스토리 작성 상태 업데이트
-                    if '티스토리작성' not in df.columns:
-                        df['티스토리작성'] = '❌'
-                    df.loc[original_index, '티스토리작성'] = '✅' if tistory_status else '❌'
-                    
-                    # 블로그스팟 작성 상태 업데이트
-                    if '블로그스팟작성' not in df.columns:
-                        df['블로그스팟작성'] = '❌'
-                    df.loc[original_index, '블로그스팟작성'] = '✅' if blogspot_status else '❌'
-                    
-                    # 메모 업데이트
-                    if memo:
-                        df.loc[original_index, '메모'] = memo
-                    
-                    # 구글시트에 업데이트
-                    if sheet_name:
-                        conn.update(worksheet=sheet_name, data=df)
-                    else:
-                        conn.update(data=df)
-                    
-                    return True
-                    
-            except Exception as sheet_error:
-                continue
-                
-        return False
-        
-    except Exception as e:
-        st.error(f"❌ 업데이트 실패: {e}")
-        return False
+def queue_keyword_update(store, row_id, used_status=None, tistory_status=None, blogspot_status=None, memo=None):
+    """키워드 수정을 쓰기 지연 큐에 넣고 화면(공유 캐시)에는 바로 반영"""
+    changes = usage_changes(used_status, tistory_status, blogspot_status, memo)
+    if changes:
+        get_write_queue(store).enqueue(row_id, changes)
+        get_sheet_cache().apply_changes(row_id, changes, origin=get_session_id())
 
-def delete_keyword_from_sheet(conn, original_index):
-    """키워드를 구글시트에서 삭제"""
-    if not conn:
-        return False
+def queue_keyword_delete(store, row_id):
+    """키워드 삭제 표시를 쓰기 지연 큐에 넣고 화면(공유 캐시)에서는 바로 제거"""
+    get_write_queue(store).enqueue(row_id, {'삭제여부': TOMBSTONE})
+    get_sheet_cache().discard(row_id, origin=get_session_id())
+
+@instrumented('app.near_duplicates')
+def screen_near_duplicates(keywords):
+    """저장된 키워드와 유사한 키워드 처리 → (남길 키워드, {키워드: (유사한 기존 키워드, 유사도)}, 제외한 수)
+    
+    설정 near_duplicate_mode가 "flag"(기본)면 표시만, "drop"이면 제외, "off"면 검사하지 않습니다.
+    """
+    mode = get_app_setting("near_duplicate_mode", "flag")
+    if mode == "off" or not keywords:
+        return keywords, {}, 0
     
     try:
-        # 원본 데이터 읽기
-        sheet_names = ["키워드관리", "Sheet1", "시트1", None]
-        
-        for sheet_name in sheet_names:
-            try:
-                if sheet_name:
-                    df = conn.read(worksheet=sheet_name)
-                else:
-                    df = conn.read()
-                
-                if not df.empty and '키워드' in df.columns and original_index < len(df):
-                    # 해당 인덱스의 행 삭제
-                    df_updated = df.drop(original_index).reset_index(drop=True)
-                    
-                    # 구글시트에 업데이트
-                    if sheet_name:
-                        conn.update(worksheet=sheet_name, data=df_updated)
-                    else:
-                        conn.update(data=df_updated)
-                    
-                    return True
-                    
-            except Exception as sheet_error:
-                continue
-                
-        return False
-        
+        index = get_sheet_cache().near_duplicate_index()
+        near_duplicates = find_near_duplicates(
+            keywords, index, get_app_setting("near_duplicate_threshold", DEFAULT_THRESHOLD)
+        )
     except Exception as e:
-        st.error(f"❌ 키워드 삭제 실패: {e}")
-        return False
+        st.error(f"❌ 유사 키워드 검사 실패: {e}")
+        return keywords, {}, 0
+    
+    if mode == "drop" and near_duplicates:
+        return [kw for kw in keywords if kw not in near_duplicates], {}, len(near_duplicates)
+    return keywords, near_duplicates, 0
 
 def add_section_divider(title=""):
     """구분선 추가 함수"""
@@ -296,7 +318,6 @@ def initialize_session_state():
     defaults = {
         'keywords_list': [],
         'selected_keywords': [],
-        'saved_keywords_df': pd.DataFrame(),
         'extraction_count': 0,
         'session_start': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
@@ -313,6 +334,11 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# ---------------- 실행 계측 시작 ----------------
+# 이번 재실행의 구간 시간과 저장소 호출 수를 모음 (화면 구간은 METRICS.section으로 위에서부터 차례로 측정)
+run_record = METRICS.begin_run('app', session=get_session_id())
+METRICS.section('render.style')
+
 # ---------------- 스타일 CSS ----------------
 st.markdown("""
 <style>
@@ -422,6 +448,7 @@ st.markdown("""
 initialize_session_state()
 
 # ---------------- 메인 UI 시작 ----------------
+METRICS.section('render.header')
 
 # 헤더 영역 (통계를 오른쪽 상단에 작게 배치)
 header_col1, header_col2 = st.columns([3, 1])
@@ -440,20 +467,17 @@ with header_col1:
     </div>
     """, unsafe_allow_html=True)
 
-# 구글시트 연결하고 저장된 키워드 수 실시간 확인
-conn = get_google_sheet_connection()
-if conn:
-    # 항상 최신 데이터 사용 (캐시 무시)
-    current_saved_df = load_keywords_from_sheet(conn, force_refresh=True)
-    total_saved = len(current_saved_df) if not current_saved_df.empty else 0
-    # 기존 키워드 목록을 세션에 저장 (중복 체크용)
-    if not current_saved_df.empty and '키워드' in current_saved_df.columns:
-        st.session_state['existing_keywords'] = set(current_saved_df['키워드'].tolist())
-    else:
-        st.session_state['existing_keywords'] = set()
+# 저장소(기본: 구글시트)에 연결하고 저장된 키워드 수 실시간 확인
+store = get_keyword_store()
+if store:
+    # 공유 캐시에서 데이터 사용 (우리 쪽 추가/수정/삭제는 다시 읽지 않고 캐시에 바로 반영됨)
+    current_saved_df = load_keywords_from_sheet(store)
+    total_saved = get_sheet_cache().stats.total if not current_saved_df.empty else 0
+    # 중복 체크용 인덱스 (모든 세션이 공유, 저장/삭제 시 해당 키워드만 갱신)
+    st.session_state['existing_keywords'] = get_sheet_cache().keyword_index
 else:
     total_saved = 0
-    st.session_state['existing_keywords'] = set()
+    st.session_state['existing_keywords'] = KeywordIndex()
 
 with header_col2:
     # 통계 정보를 오른쪽 상단에 더 작게 표시 (가로로 배치)
@@ -474,13 +498,13 @@ with header_col2:
     </div>
     """, unsafe_allow_html=True)
 
-# 구글시트 연결 상태 표시 (작게, 한 줄로)
+# 저장소 연결 상태 표시 (작게, 한 줄로)
 connection_status = ""
-if conn:
+if store:
     if not current_saved_df.empty:
-        connection_status = f'<span style="color: #10b981; font-size: 0.85rem;">✅ 구글시트 연결됨 | 시트에서 데이터 로드됨</span>'
+        connection_status = f'<span style="color: #10b981; font-size: 0.85rem;">✅ {store.display_name} 연결됨 | 데이터 로드됨</span>'
     else:
-        connection_status = f'<span style="color: #10b981; font-size: 0.85rem;">✅ 구글시트 연결됨</span>'
+        connection_status = f'<span style="color: #10b981; font-size: 0.85rem;">✅ {store.display_name} 연결됨</span>'
 else:
     connection_status = f'<span style="color: #f59e0b; font-size: 0.85rem;">⚠️ 구글시트 연결 확인 필요</span>'
 
@@ -496,13 +520,14 @@ if st.session_state.get('show_connection_status', True):
     """, unsafe_allow_html=True)
     
     # 5초 후 상태 메시지 숨김 (자동으로는 안되니 수동으로 버튼 제공)
-    if conn and not current_saved_df.empty:
+    if store and not current_saved_df.empty:
         # 성공적으로 연결되고 데이터도 있으면 버튼으로 숨길 수 있게
         if st.button("✖", help="상태 메시지 숨기기", key="hide_status"):
             st.session_state['show_connection_status'] = False
             st.rerun()
 
 # 1. 키워드 추출 섹션
+METRICS.section('render.extraction')
 add_section_divider("🔍 HTML 소스 분석")
 
 html_input = st.text_area(
@@ -512,6 +537,24 @@ html_input = st.text_area(
     help="Ctrl+U → Ctrl+A → Ctrl+C → 여기에 붙여넣기"
 )
 
+# 추가 프로필이 설정된 경우에만 프로필 선택 표시
+selected_profile = None
+try:
+    extraction_profiles = get_extraction_profiles()
+except ValueError as e:
+    st.error(f"❌ 추출 프로필 설정 오류: {e}")
+    extraction_profiles = load_profiles()
+if len(extraction_profiles) > 1:
+    profile_options = [AUTO_PROFILE] + list(extraction_profiles)
+    default_profile = get_app_setting("extraction_profile", "default")
+    selected_profile = st.selectbox(
+        "추출 프로필",
+        profile_options,
+        index=profile_options.index(default_profile) if default_profile in profile_options else 0,
+        format_func=lambda name: "🔎 자동 감지" if name == AUTO_PROFILE else extraction_profiles[name].label,
+        help="키워드 도구 페이지 구조에 맞는 프로필을 고르세요. 자동 감지는 페이지를 한 번 읽으며 모든 프로필을 비교합니다."
+    )
+
 col1, col2 = st.columns([2, 1])
 with col1:
     if st.button("🔍 키워드 추출 시작", type="primary", use_container_width=True):
@@ -519,7 +562,11 @@ with col1:
             with st.spinner("키워드를 추출하고 있습니다..."):
                 # 기존 키워드 목록 가져오기
                 existing_keywords = st.session_state.get('existing_keywords', set())
-                keywords = parse_keywords_from_html(html_input, existing_keywords)
+                keywords = parse_keywords_from_html(html_input, existing_keywords, selected_profile)
+                keywords, near_duplicates, near_removed = screen_near_duplicates(keywords)
+                if near_removed:
+                    st.session_state['extraction_info']['near_duplicates_removed'] = near_removed
+                st.session_state['near_duplicates'] = near_duplicates
                 st.session_state['keywords_list'] = keywords
                 st.session_state['selected_keywords'] = []
                 st.session_state['extraction_count'] += 1
@@ -530,11 +577,19 @@ with col1:
                 success_msg = f"✅ 키워드 추출 완료! (새로운 키워드 {len(st.session_state['keywords_list'])}개)"
                 if extraction_info.get('duplicates_removed', 0) > 0:
                     success_msg += f" | 중복 제거됨: {extraction_info['duplicates_removed']}개"
+                if extraction_info.get('near_duplicates_removed', 0) > 0:
+                    success_msg += f" | 유사 키워드 제외: {extraction_info['near_duplicates_removed']}개"
+                if selected_profile == AUTO_PROFILE and extraction_info.get('profile') in extraction_profiles:
+                    success_msg += f" | 프로필: {extraction_profiles[extraction_info['profile']].label}"
                 st.success(success_msg)
                 st.rerun()
             else:
-                if extraction_info.get('duplicates_removed', 0) > 0:
-                    st.warning(f"⚠️ 추출된 키워드가 모두 기존에 저장된 키워드와 중복됩니다. (중복 제거: {extraction_info['duplicates_removed']}개)")
+                if extraction_info.get('duplicates_removed', 0) > 0 or extraction_info.get('near_duplicates_removed', 0) > 0:
+                    near_removed = extraction_info.get('near_duplicates_removed', 0)
+                    st.warning(
+                        f"⚠️ 추출된 키워드가 모두 기존에 저장된 키워드와 중복됩니다. (중복 제거: {extraction_info.get('duplicates_removed', 0)}개"
+                        + (f", 유사 키워드 제외: {near_removed}개)" if near_removed else ")")
+                    )
                 else:
                     st.warning("⚠️ 키워드를 찾지 못했습니다. HTML 소스를 확인해주세요.")
         else:
@@ -549,6 +604,7 @@ with col2:
         st.info(info_text)
 
 # 2. 수동 키워드 입력 섹션
+METRICS.section('render.manual')
 add_section_divider("✏️ 수동 키워드 입력")
 
 col1, col2 = st.columns([3, 1])
@@ -566,20 +622,15 @@ with col2:
     if st.button("📝 키워드 추가", type="primary", use_container_width=True):
         if manual_keywords_input.strip():
             # 쉼표로 분리하고 정리
-            manual_keywords = [kw.strip() for kw in manual_keywords_input.split(',') if kw.strip()]
+            manual_keywords = split_manual_keywords(manual_keywords_input)
             
             if manual_keywords:
                 # 기존 키워드와 중복 체크
                 existing_keywords = st.session_state.get('existing_keywords', set())
-                new_keywords = []
-                duplicate_count = 0
-                
-                for keyword in manual_keywords:
-                    if len(keyword) >= 2:  # 최소 2글자 이상
-                        if keyword not in existing_keywords:
-                            new_keywords.append(keyword)
-                        else:
-                            duplicate_count += 1
+                new_keywords, duplicate_count = filter_new_keywords(manual_keywords, existing_keywords)
+                new_keywords, near_duplicates, near_removed = screen_near_duplicates(new_keywords)
+                duplicate_count += near_removed
+                st.session_state.setdefault('near_duplicates', {}).update(near_duplicates)
                 
                 if new_keywords:
                     # 기존 추출된 키워드와 합치기
@@ -604,7 +655,7 @@ with col2:
 
 # 입력된 키워드 미리보기 및 바로 저장 옵션
 if manual_keywords_input.strip():
-    preview_keywords = [kw.strip() for kw in manual_keywords_input.split(',') if kw.strip() and len(kw.strip()) >= 2]
+    preview_keywords = split_manual_keywords(manual_keywords_input, min_length=2)
     if preview_keywords:
         st.markdown("#### 🔍 입력 미리보기")
         col1, col2 = st.columns([3, 1])
@@ -625,7 +676,7 @@ if manual_keywords_input.strip():
                 st.info(f"✅ 모두 새로운 키워드")
         
         # 바로 저장 옵션
-        if conn:
+        if store:
             st.markdown("#### 💾 바로 저장하기")
             col1, col2 = st.columns([2, 1])
             
@@ -642,32 +693,16 @@ if manual_keywords_input.strip():
                     if manual_project_name:
                         # 중복 제거된 새로운 키워드만 저장
                         existing_keywords = st.session_state.get('existing_keywords', set())
-                        new_keywords_to_save = [kw for kw in preview_keywords if kw not in existing_keywords]
+                        new_keywords_to_save, _ = filter_new_keywords(preview_keywords, existing_keywords)
                         
                         if new_keywords_to_save:
                             with st.spinner("구글시트에 저장 중..."):
-                                success = save_keywords_to_sheet(conn, manual_project_name, new_keywords_to_save)
+                                success = save_keywords_to_sheet(store, manual_project_name, new_keywords_to_save)
                             
                             if success:
                                 saved_sheet = st.session_state.get('last_saved_sheet', '구글시트')
-                                st.success(f"✅ {len(new_keywords_to_save)}개 키워드가 성공적으로 저장되었습니다! (저장 위치: {saved_sheet})")
-                                # 저장된 키워드들을 기존 키워드 목록에 추가
-                                if 'existing_keywords' not in st.session_state:
-                                    st.session_state['existing_keywords'] = set()
-                                st.session_state['existing_keywords'].update(new_keywords_to_save)
-                                
-                                # 강력한 캐시 클리어 및 강제 데이터 새로고침
-                                for key in list(st.session_state.keys()):
-                                    if any(cache_key in key for cache_key in ['saved_keywords', 'existing_keywords', 'sheet_load']):
-                                        del st.session_state[key]
-                                
-                                # 강제로 최신 데이터 다시 불러오기
-                                time.sleep(1)  # 구글시트 동기화 대기
-                                updated_df = load_keywords_from_sheet(conn, force_refresh=True)
-                                if not updated_df.empty:
-                                    st.session_state['saved_keywords_df'] = updated_df
-                                    st.session_state['existing_keywords'] = set(updated_df['키워드'].tolist())
-                                
+                                # 저장한 행은 공유 캐시에 이미 반영됨 (다시 읽거나 기다리지 않음)
+                                st.session_state['save_success'] = f"✅ {len(new_keywords_to_save)}개 키워드가 성공적으로 저장되었습니다! (저장 위치: {saved_sheet})"
                                 st.rerun()
                             else:
                                 st.error("❌ 저장 중 오류가 발생했습니다.")
@@ -677,6 +712,7 @@ if manual_keywords_input.strip():
                         st.warning("⚠️ 프로젝트명을 입력해주세요.")
 
 # 3. 키워드 선택 섹션
+METRICS.section('render.selection')
 if st.session_state.get('keywords_list'):
     add_section_divider("🎯 키워드 선택")
     
@@ -698,8 +734,13 @@ if st.session_state.get('keywords_list'):
     
     # 키워드를 4개씩 나누어 표시
     keywords = st.session_state['keywords_list']
+    near_duplicates = st.session_state.get('near_duplicates', {})
     cols_per_row = 4
     
+    flagged_count = sum(1 for kw in keywords if kw in near_duplicates)
+    if flagged_count:
+        st.caption(f"≈ 표시된 {flagged_count}개는 이미 저장된 키워드와 비슷합니다. 버튼에 마우스를 올리면 비슷한 키워드를 볼 수 있습니다.")
+    
     for i in range(0, len(keywords), cols_per_row):
         cols = st.columns(cols_per_row)
         for j, col in enumerate(cols):
@@ -709,11 +750,13 @@ if st.session_state.get('keywords_list'):
                 
                 with col:
                     button_type = "primary" if is_selected else "secondary"
+                    similar = near_duplicates.get(keyword)
                     
                     if st.button(
-                        keyword, 
+                        f"≈ {keyword}" if similar else keyword, 
                         key=f"keyword_btn_{i+j}",
                         type=button_type,
+                        help=f"기존 키워드 '{similar[0]}'와 유사 ({similar[1]:.0%})" if similar else None,
                         use_container_width=True
                     ):
                         # 키워드 선택/해제 토글
@@ -743,7 +786,8 @@ if st.session_state.get('keywords_list'):
                 st.rerun()
 
 # 4. 저장 섹션
-if st.session_state.get('selected_keywords') and conn:
+METRICS.section('render.save')
+if st.session_state.get('selected_keywords') and store:
     add_section_divider("💾 구글시트에 저장")
     
     col1, col2 = st.columns([2, 1])
@@ -759,27 +803,12 @@ if st.session_state.get('selected_keywords') and conn:
         if st.button("💾 구글시트에 저장", type="primary", use_container_width=True):
             if project_name:
                 with st.spinner("구글시트에 저장 중..."):
-                    success = save_keywords_to_sheet(conn, project_name, st.session_state['selected_keywords'])
+                    success = save_keywords_to_sheet(store, project_name, st.session_state['selected_keywords'])
                 
                 if success:
                     saved_sheet = st.session_state.get('last_saved_sheet', '구글시트')
-                    st.success(f"✅ {len(st.session_state['selected_keywords'])}개 키워드가 성공적으로 저장되었습니다! (저장 위치: {saved_sheet})")
-                    # 저장된 키워드들을 기존 키워드 목록에 추가 (중복 체크용)
-                    if 'existing_keywords' not in st.session_state:
-                        st.session_state['existing_keywords'] = set()
-                    st.session_state['existing_keywords'].update(st.session_state['selected_keywords'])
-                    
-                    # 강력한 캐시 클리어 및 강제 데이터 새로고침
-                    for key in list(st.session_state.keys()):
-                        if any(cache_key in key for cache_key in ['saved_keywords', 'existing_keywords', 'sheet_load']):
-                            del st.session_state[key]
-                    
-                    # 강제로 최신 데이터 다시 불러오기
-                    time.sleep(1)  # 구글시트 동기화 대기
-                    updated_df = load_keywords_from_sheet(conn, force_refresh=True)
-                    if not updated_df.empty:
-                        st.session_state['saved_keywords_df'] = updated_df
-                        st.session_state['existing_keywords'] = set(updated_df['키워드'].tolist())
+                    # 저장한 행은 공유 캐시에 이미 반영됨 (다시 읽거나 기다리지 않음)
+                    st.session_state['save_success'] = f"✅ {len(st.session_state['selected_keywords'])}개 키워드가 성공적으로 저장되었습니다! (저장 위치: {saved_sheet})"
                     
                     # 저장 후 선택 해제
                     st.session_state['selected_keywords'] = []
@@ -800,369 +829,473 @@ if st.session_state.get('selected_keywords') and conn:
             help="저장할 키워드 목록입니다"
         )
 
-# 5. 저장된 키워드 관리 섹션
-if conn:
-    add_section_divider("📊 저장된 키워드 관리")
+def rerun_keyword_manager():
+    """관리 화면 조각만 다시 실행 (조각 재실행 중이 아니면 앱 전체)"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+# 다른 세션 변경 알림에 표시할 변경 종류
+CHANGE_LABELS = {'add': '추가', 'update': '수정', 'delete': '삭제'}
+
+@st.fragment(run_every=get_app_setting("change_poll_seconds", 10.0) or None)
+def watch_keyword_changes():
+    """다른 세션이 공유 캐시를 바꿨는지 주기적으로 버전만 비교하고, 바뀌었으면 알린 뒤 화면 갱신
     
-    # 저장된 키워드 불러오기 (항상 최신 데이터 사용)
-    saved_df = load_keywords_from_sheet(conn, force_refresh=True)
+    데이터는 모든 세션이 같은 캐시를 보므로 다시 실행만 하면 되고 시트를 다시 읽지 않습니다.
+    """
+    cache = get_sheet_cache()
+    seen_version = st.session_state.get('seen_cache_version')
+    if seen_version is None or seen_version == cache.version:
+        return
     
-    # 성공 메시지 표시 (한번만)
-    if 'sheet_load_success' in st.session_state and st.session_state.get('show_connection_status', True):
-        sheet_name = st.session_state['sheet_load_success']
-        st.success(f"✅ {sheet_name}에서 데이터를 불러왔습니다!")
-        del st.session_state['sheet_load_success']
+    changes = cache.changes_since(seen_version, exclude_origin=get_session_id())
+    st.session_state['seen_cache_version'] = cache.version
+    if changes is None:
+        st.session_state['change_notice'] = "👥 다른 사용자의 변경이 많아 목록을 새로 표시했습니다"
+    else:
+        counts = {}
+        for _, kind, count, _ in changes:
+            if kind in CHANGE_LABELS:
+                counts[kind] = counts.get(kind, 0) + count
+        if not counts:
+            return
+        summary = ", ".join(f"{CHANGE_LABELS[kind]} {count}개" for kind, count in counts.items())
+        st.session_state['change_notice'] = f"👥 다른 사용자의 변경 반영: {summary}"
+    st.rerun()
+
+@st.fragment
+def render_keyword_manager(store):
+    """저장된 키워드 관리 화면 (검색·필터, 통계, 컨트롤, 목록, 테이블)
     
-    if not saved_df.empty:
-        st.session_state['saved_keywords_df'] = saved_df
-        
-        # 🔍 통합 검색 & 필터 시스템 (최우선 배치)
-        st.markdown("#### 🔍 통합 검색 & 필터")
-        
-        # 검색창
-        search_query = st.text_input(
-            "🔍 통합 검색",
-            placeholder="키워드명, 프로젝트명, 메모에서 검색...",
-            help="모든 필드에서 검색됩니다"
+    st.fragment라서 이 안의 위젯(필터, 페이지 이동, 행 편집)을 조작하면 앱 전체가 아니라 이 함수만 다시 실행됩니다.
+    데이터는 공유 캐시에서 가져오므로 다시 실행해도 시트를 읽지 않습니다.
+    """
+    with fragment_run_metrics('manager'):
+        _render_keyword_manager(store)
+
+def _render_keyword_manager(store):
+    """render_keyword_manager 본문"""
+    saved_df = load_keywords_from_sheet(store)
+    if saved_df.empty:
+        st.info("📝 저장된 키워드가 없습니다.")
+        return
+    
+    # 🔍 통합 검색 & 필터 시스템 (최우선 배치)
+    st.markdown("#### 🔍 통합 검색 & 필터")
+    
+    # 검색창
+    search_query = st.text_input(
+        "🔍 통합 검색",
+        placeholder="키워드명, 프로젝트명, 메모에서 검색...",
+        help="모든 필드에서 검색됩니다"
+    )
+    
+    # 필터 옵션들
+    filter_col1, filter_col2, filter_col3, filter_col4, filter_col5, filter_col6 = st.columns(6)
+    
+    with filter_col1:
+        projects = ['전체'] + list(saved_df['프로젝트명'].unique())
+        selected_project = st.selectbox("📁 프로젝트", projects)
+    
+    with filter_col2:
+        usage_filter = st.selectbox("✅ 사용여부", ['전체', '사용함(✅)', '미사용(❌)'])
+    
+    with filter_col3:
+        tistory_filter = st.selectbox("📝 티스토리", ['전체', '작성함(✅)', '미작성(❌)'])
+    
+    with filter_col4:
+        blogspot_filter = st.selectbox("📰 블로그스팟", ['전체', '작성함(✅)', '미작성(❌)'])
+    
+    with filter_col5:
+        date_filter = st.selectbox("📅 등록일", ['전체', '오늘', '최근 3일', '최근 일주일', '최근 한달'])
+    
+    with filter_col6:
+        sort_option = st.selectbox("🔄 정렬", ['최신순', '오래된순', '키워드명 순', '프로젝트명 순'])
+    
+    # 필터 적용: 선택한 필터를 조건으로 컴파일해 마스크 하나로 합치고, 결과는 화면에 보일 구간만 만듦
+    cache = get_sheet_cache()
+    filter_engine = get_filter_engine()
+    data_version = cache.version
+    conditions = compile_filters(
+        search_query, selected_project, usage_filter, tistory_filter, blogspot_filter, date_filter
+    )
+    with span('filter.apply'):
+        filtered_positions, filter_mask = filter_engine.positions(
+            saved_df, data_version, conditions, sort_option,
+            # 공유 캐시의 바이그램 역색인으로 검색 (전체 행을 훑지 않음)
+            search_index=cache.search_index() if search_query else None
         )
-        
-        # 필터 옵션들
-        filter_col1, filter_col2, filter_col3, filter_col4, filter_col5, filter_col6 = st.columns(6)
-        
-        with filter_col1:
-            projects = ['전체'] + list(saved_df['프로젝트명'].unique())
-            selected_project = st.selectbox("📁 프로젝트", projects)
-        
-        with filter_col2:
-            usage_filter = st.selectbox("✅ 사용여부", ['전체', '사용함(✅)', '미사용(❌)'])
-        
-        with filter_col3:
-            # 티스토리작성 컬럼이 없으면 기본값 추가
-            if '티스토리작성' not in saved_df.columns:
-                saved_df['티스토리작성'] = '❌'
-            tistory_filter = st.selectbox("📝 티스토리", ['전체', '작성함(✅)', '미작성(❌)'])
-        
-        with filter_col4:
-            # 블로그스팟작성 컬럼이 없으면 기본값 추가
-            if '블로그스팟작성' not in saved_df.columns:
-                saved_df['블로그스팟작성'] = '❌'
-            blogspot_filter = st.selectbox("📰 블로그스팟", ['전체', '작성함(✅)', '미작성(❌)'])
-        
-        with filter_col5:
-            date_filter = st.selectbox("📅 등록일", ['전체', '오늘', '최근 3일', '최근 일주일', '최근 한달'])
-        
-        with filter_col6:
-            sort_option = st.selectbox("🔄 정렬", ['최신순', '오래된순', '키워드명 순', '프로젝트명 순'])
-        
-        # 필터 적용
-        filtered_df = saved_df.copy()
-        
-        # 검색어 필터
-        if search_query:
-            search_mask = (
-                filtered_df['키워드'].str.contains(search_query, case=False, na=False) |
-                filtered_df['프로젝트명'].str.contains(search_query, case=False, na=False) |
-                filtered_df['메모'].str.contains(search_query, case=False, na=False)
-            )
-            filtered_df = filtered_df[search_mask]
-        
-        # 프로젝트 필터
-        if selected_project != '전체':
-            filtered_df = filtered_df[filtered_df['프로젝트명'] == selected_project]
-        
-        # 사용여부 필터
-        if usage_filter == '사용함(✅)':
-            filtered_df = filtered_df[filtered_df['사용여부'] == '✅']
-        elif usage_filter == '미사용(❌)':
-            filtered_df = filtered_df[filtered_df['사용여부'] == '❌']
-        
-        # 티스토리 작성 필터
-        if tistory_filter == '작성함(✅)':
-            filtered_df = filtered_df[filtered_df['티스토리작성'] == '✅']
-        elif tistory_filter == '미작성(❌)':
-            filtered_df = filtered_df[filtered_df['티스토리작성'] == '❌']
-        
-        # 블로그스팟 작성 필터
-        if blogspot_filter == '작성함(✅)':
-            filtered_df = filtered_df[filtered_df['블로그스팟작성'] == '✅']
-        elif blogspot_filter == '미작성(❌)':
-            filtered_df = filtered_df[filtered_df['블로그스팟작성'] == '❌']
-        
-        # 날짜 필터 (간단화)
-        if date_filter != '전체':
-            from datetime import datetime, timedelta
-            today = datetime.now()
-            
-            if date_filter == '오늘':
-                target_date = today.strftime('%Y-%m-%d')
-                filtered_df = filtered_df[filtered_df['날짜'].str.contains(target_date, na=False)]
-        
-        # 정렬 적용
-        if sort_option == '최신순':
-            filtered_df = filtered_df.sort_values('날짜', ascending=False)
-        elif sort_option == '오래된순':
-            filtered_df = filtered_df.sort_values('날짜', ascending=True)
-        elif sort_option == '키워드명 순':
-            filtered_df = filtered_df.sort_values('키워드', ascending=True)
-        elif sort_option == '프로젝트명 순':
-            filtered_df = filtered_df.sort_values('프로젝트명', ascending=True)
-        
-        # 통계 정보 표시
-        col1, col2, col3, col4, col5, col6 = st.columns(6)
-        with col1:
-            st.metric("🔍 검색 결과", f"{len(filtered_df)}개")
-        with col2:
-            total_keywords = len(filtered_df)
-            used_keywords = len(filtered_df[filtered_df['사용여부'] == '✅'])
-            st.metric("✅ 사용됨", f"{used_keywords}개")
-        with col3:
-            unused_keywords = len(filtered_df[filtered_df['사용여부'] == '❌'])
-            st.metric("❌ 미사용", f"{unused_keywords}개")
-        with col4:
-            usage_rate = (used_keywords / total_keywords * 100) if total_keywords > 0 else 0
-            st.metric("📊 사용률", f"{usage_rate:.1f}%")
-        with col5:
-            tistory_written = len(filtered_df[filtered_df.get('티스토리작성', '❌') == '✅'])
-            st.metric("📝 티스토리", f"{tistory_written}개")
-        with col6:
-            blogspot_written = len(filtered_df[filtered_df.get('블로그스팟작성', '❌') == '✅'])
-            st.metric("📰 블로그스팟", f"{blogspot_written}개")
-        
-        # 컨트롤 버튼들 (작게 배치)
-        st.markdown("#### 🎛️ 컨트롤")
-        col1, col2, col3, col4, col5, col6 = st.columns(6)
-        
-        with col1:
-            if st.button("🔄 강력 새로고침", use_container_width=True):
-                # 모든 캐시 완전 삭제
-                for key in list(st.session_state.keys()):
-                    if any(cache_key in key for cache_key in ['saved_keywords', 'existing_keywords', 'sheet_load']):
-                        del st.session_state[key]
+    
+    # 통계 정보 표시 (프로젝트/상태 필터만 있으면 미리 집계된 값, 검색·날짜 필터가 있으면 결합 마스크로 계산)
+    summary_args = stats_query(conditions)
+    with span('filter.summary'):
+        if summary_args is not None:
+            project, statuses = summary_args
+            summary = cache.stats.summary(project, **statuses)
+        else:
+            summary = filter_engine.summary(saved_df, data_version, filter_mask)
+    
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+    with col1:
+        st.metric("🔍 검색 결과", f"{summary['total']}개")
+    with col2:
+        st.metric("✅ 사용됨", f"{summary['used']}개")
+    with col3:
+        st.metric("❌ 미사용", f"{summary['unused']}개")
+    with col4:
+        usage_rate = (summary['used'] / summary['total'] * 100) if summary['total'] > 0 else 0
+        st.metric("📊 사용률", f"{usage_rate:.1f}%")
+    with col5:
+        st.metric("📝 티스토리", f"{summary['tistory']}개")
+    with col6:
+        st.metric("📰 블로그스팟", f"{summary['blogspot']}개")
+    
+    # 컨트롤 버튼들 (작게 배치)
+    st.markdown("#### 🎛️ 컨트롤")
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+    
+    with col1:
+        if st.button("🔄 강력 새로고침", use_container_width=True):
+            # 공유 캐시를 시트에서 강제로 다시 읽기 (모든 세션에 반영)
+            with st.spinner("최신 데이터를 불러오는 중..."):
+                updated_df = load_keywords_from_sheet(store, force_refresh=True)
+                if not updated_df.empty:
+                    st.success(f"✅ 최신 데이터 로드 완료! (총 {len(updated_df)}개 키워드)")
+                else:
+                    st.warning("⚠️ 데이터를 불러올 수 없습니다.")
+            st.rerun()
+    
+    with col2:
+        if st.button("🔍 연결 테스트", use_container_width=True):
+            try:
+                # 캐시 무시하고 실제 데이터 확인
+                test_df = store.load()
+                st.success(f"✅ 연결 성공! ({len(test_df)}개)")
                 
-                # 강제로 최신 데이터 불러오기
-                with st.spinner("최신 데이터를 불러오는 중..."):
-                    time.sleep(0.5)
-                    updated_df = load_keywords_from_sheet(conn, force_refresh=True)
-                    if not updated_df.empty:
-                        st.session_state['saved_keywords_df'] = updated_df
-                        st.session_state['existing_keywords'] = set(updated_df['키워드'].tolist())
-                        st.success(f"✅ 최신 데이터 로드 완료! (총 {len(updated_df)}개 키워드)")
-                    else:
-                        st.warning("⚠️ 데이터를 불러올 수 없습니다.")
-                st.rerun()
-        
-        with col2:
-            if st.button("🔍 연결 테스트", use_container_width=True):
-                try:
-                    # 캐시 무시하고 실제 데이터 확인
-                    test_df = conn.read(ttl=0)
-                    st.success(f"✅ 연결 성공! ({len(test_df)}개)")
+                # 모든 세션이 공유하는 캐시 데이터와 비교
+                current_saved = len(saved_df)
+                if current_saved != len(test_df):
+                    st.warning(f"⚠️ 데이터 불일치! 실제: {len(test_df)}개 vs 공유 캐시: {current_saved}개")
+                    if st.button("🔄 즉시 동기화", key="sync_now"):
+                        # 공유 캐시를 다시 읽어 모든 세션에 반영
+                        load_keywords_from_sheet(store, force_refresh=True)
+                        st.success("✅ 동기화 완료!")
+                        st.rerun()
+                else:
+                    st.success("✅ 데이터 동기화됨!")
                     
-                    # 현재 세션에 저장된 데이터와 비교
-                    current_saved = len(st.session_state.get('saved_keywords_df', pd.DataFrame()))
-                    if current_saved != len(test_df):
-                        st.warning(f"⚠️ 데이터 불일치! 실제: {len(test_df)}개 vs 세션: {current_saved}개")
-                        if st.button("🔄 즉시 동기화", key="sync_now"):
-                            # 강제 동기화
-                            for key in list(st.session_state.keys()):
-                                if any(cache_key in key for cache_key in ['saved_keywords', 'existing_keywords']):
-                                    del st.session_state[key]
-                            st.session_state['saved_keywords_df'] = test_df
-                            if not test_df.empty and '키워드' in test_df.columns:
-                                st.session_state['existing_keywords'] = set(test_df['키워드'].tolist())
-                            st.success("✅ 동기화 완료!")
-                            st.rerun()
-                    else:
-                        st.success("✅ 데이터 동기화됨!")
-                        
-                except Exception as e:
-                    st.error(f"❌ 연결 실패: {e}")
-        
-        with col3:
-            debug_mode = st.checkbox("🐛 디버그")
-        
-        with col4:
-            show_keywords = st.checkbox("📋 목록 보기", value=True)
-        
-        with col5:
-            show_full_table = st.checkbox("📊 테이블", value=False)
+            except Exception as e:
+                st.error(f"❌ 연결 실패: {e}")
+    
+    with col3:
+        debug_mode = st.checkbox("🐛 디버그")
+    
+    with col4:
+        show_keywords = st.checkbox("📋 목록 보기", value=True)
+    
+    with col5:
+        show_full_table = st.checkbox("📊 테이블", value=False)
+    
+    with col6:
+        tombstone_count = get_sheet_cache().tombstone_count
+        if st.button(f"🧹 삭제 정리 ({tombstone_count})", use_container_width=True, disabled=tombstone_count == 0,
+                     help="삭제 표시된 키워드를 시트에서 한 번에 제거합니다"):
+            with st.spinner("삭제된 키워드를 정리하는 중..."):
+                # 큐에 남은 삭제 표시까지 먼저 반영하고, 큐가 비어 있을 때만 정리
+                write_queue = get_write_queue(store)
+                write_queue.flush_now()
+                # 큐가 비어 있지 않으면 None, 정리에 실패하면 (None,) (실패 메시지는 compact_keyword_sheet가 표시)
+                result = write_queue.run_if_drained(lambda: (compact_keyword_sheet(store),))
+            if result is None:
+                st.warning("⚠️ 아직 반영되지 않은 수정이 있어 정리하지 못했습니다. 잠시 후 다시 시도해주세요.")
+            elif result[0] is not None:
+                st.success(f"✅ {result[0]}개 행 정리 완료!")
+                st.rerun()
+    
+    # 시트 반영 대기 중인 수정 표시
+    write_queue = get_write_queue(store)
+    pending_count = write_queue.pending_count()
+    if pending_count:
+        queue_col1, queue_col2 = st.columns([3, 1])
+        with queue_col1:
+            if write_queue.last_error:
+                st.warning(f"⚠️ 시트 반영 대기 {pending_count}건 (자동 재시도 예정: {write_queue.last_error})")
+            else:
+                st.info(f"⏳ 시트 반영 대기 {pending_count}건 (잠시 후 자동 반영)")
+        with queue_col2:
+            if st.button("⏫ 지금 반영", use_container_width=True, key="flush_now"):
+                with st.spinner("구글시트에 반영 중..."):
+                    flushed = write_queue.flush_now()
+                if write_queue.last_error:
+                    st.error(f"❌ 반영 실패: {write_queue.last_error}")
+                else:
+                    st.success(f"✅ {flushed}건 반영 완료!")
+                    rerun_keyword_manager()
+    
+    # 반영을 포기한 수정 표시 (화면에는 이미 반영된 것처럼 보였던 수정이므로 알려야 함)
+    dropped = write_queue.dropped_edits()
+    if dropped:
+        keywords = dict(zip(saved_df['ID'], saved_df['키워드'])) if not saved_df.empty else {}
+        st.error(f"❌ 저장소에 반영하지 못한 수정 {len(dropped)}건이 있습니다. 확인 후 필요하면 다시 수정해주세요.")
+        st.dataframe(pd.DataFrame([{
+            '시각': datetime.fromtimestamp(entry['at']).strftime('%H:%M:%S'),
+            '키워드': keywords.get(entry['id'], entry['id']),
+            '수정': ', '.join(f"{column}: {to_sheet_value(value)}" for column, value in entry['changes'].items()),
+            '사유': entry['reason'],
+        } for entry in dropped]), use_container_width=True, hide_index=True)
+        if st.button("확인했습니다", key="clear_dropped"):
+            write_queue.clear_dropped()
+            rerun_keyword_manager()
+    
+    # 디버그 모드
+    if debug_mode and not saved_df.empty:
+        st.markdown("#### 🐛 디버그 정보")
+        st.write(f"**데이터 형태**: {saved_df.shape}")
+        st.write(f"**컬럼명**: {list(saved_df.columns)}")
+        st.write(f"**데이터 타입**: {saved_df.dtypes.to_dict()}")
+        st.dataframe(saved_df.head(3), use_container_width=True)
         
-        with col6:
-            st.write("")  # 빈 공간
+        # 직전 실행의 구간 시간과 저장소 호출 수 (이번 실행은 아직 끝나지 않았으므로 직전 기록)
+        last_run = st.session_state.get('last_run_metrics')
+        if last_run:
+            st.markdown(f"**⏱️ 직전 실행 계측** ({last_run['label']}, {last_run['duration_ms']:.0f}ms)")
+            span_rows = [
+                {'구간': name, '횟수': values['count'], '합계(ms)': values['total_ms'], '최대(ms)': values['max_ms']}
+                for name, values in last_run['spans'].items()
+            ]
+            if span_rows:
+                st.dataframe(
+                    pd.DataFrame(span_rows).sort_values('합계(ms)', ascending=False),
+                    use_container_width=True, hide_index=True
+                )
+            if last_run['counters']:
+                st.write("**저장소 호출/행 수**: " + ", ".join(
+                    f"{name}={value}" for name, value in sorted(last_run['counters'].items())
+                ))
         
-        # 디버그 모드
-        if debug_mode and not saved_df.empty:
-            st.markdown("#### 🐛 디버그 정보")
-            st.write(f"**데이터 형태**: {saved_df.shape}")
-            st.write(f"**컬럼명**: {list(saved_df.columns)}")
-            st.write(f"**데이터 타입**: {saved_df.dtypes.to_dict()}")
-            st.dataframe(saved_df.head(3), use_container_width=True)
+        cumulative_counters = METRICS.snapshot()['counters']
+        if cumulative_counters:
+            st.caption("프로세스 누적: " + ", ".join(
+                f"{name}={value}" for name, value in sorted(cumulative_counters.items())
+            ))
+        if 'metrics_export_error' in st.session_state:
+            st.warning(f"⚠️ 계측 파일 내보내기 실패: {st.session_state.pop('metrics_export_error')}")
         
-        # 키워드 목록 표시
-        if show_keywords:
-            st.markdown("#### 📝 키워드 목록")
-            
-            if not filtered_df.empty:
-                # 간단한 키워드 목록 표시
-                for idx, row in filtered_df.iterrows():
-                    original_idx = saved_df.index[saved_df['키워드'] == row['키워드']].tolist()[0]
-                    
-                    # 키워드 정보 표시
-                    col1, col2, col3, col4, col5, col6 = st.columns([3, 1, 1, 1, 3, 1])
-                    
-                    with col1:
-                        st.markdown(f"**🔑 {row['키워드']}**")
-                        st.caption(f"📁 {row['프로젝트명']} | 📅 {str(row['날짜']).split()[0] if ' ' in str(row['날짜']) else row['날짜']}")
-                    
-                    with col2:
-                        current_status = row['사용여부'] == '✅'
-                        new_status = st.checkbox(
-                            "사용완료",
-                            value=current_status,
-                            key=f"status_check_{original_idx}"
-                        )
-                    
-                    with col3:
-                        current_tistory = row.get('티스토리작성', '❌') == '✅'
-                        new_tistory = st.checkbox(
-                            "티스토리",
-                            value=current_tistory,
-                            key=f"tistory_check_{original_idx}"
-                        )
-                    
-                    with col4:
-                        current_blogspot = row.get('블로그스팟작성', '❌') == '✅'
-                        new_blogspot = st.checkbox(
-                            "블로그스팟",
-                            value=current_blogspot,
-                            key=f"blogspot_check_{original_idx}"
-                        )
-                    
-                    with col5:
-                        current_memo = row.get('메모', '')
-                        new_memo = st.text_input(
-                            "메모", 
-                            value=current_memo,
-                            key=f"memo_input_{original_idx}",
-                            placeholder="메모를 입력하세요...",
-                            label_visibility="collapsed"
-                        )
-                    
-                    with col6:
-                        # 액션 버튼들
-                        action_col1, action_col2 = st.columns(2)
-                        
-                        with action_col1:
-                            if st.button("💾", key=f"save_btn_{original_idx}", help="저장", use_container_width=True):
-                                if (new_status != current_status or 
-                                    new_tistory != current_tistory or 
-                                    new_blogspot != current_blogspot or 
-                                    new_memo != current_memo):
-                                    success = update_keyword_usage(conn, original_idx, new_status, new_tistory, new_blogspot, new_memo)
-                                    if success:
-                                        st.success("✅ 저장 완료!")
-                                        
-                                        # 강력한 캐시 클리어 및 강제 데이터 새로고침
-                                        for key in list(st.session_state.keys()):
-                                            if any(cache_key in key for cache_key in ['saved_keywords', 'existing_keywords']):
-                                                del st.session_state[key]
-                                        
-                                        # 강제로 최신 데이터 다시 불러오기
-                                        time.sleep(0.5)
-                                        updated_df = load_keywords_from_sheet(conn, force_refresh=True)
-                                        if not updated_df.empty:
-                                            st.session_state['saved_keywords_df'] = updated_df
-                                            st.session_state['existing_keywords'] = set(updated_df['키워드'].tolist())
-                                        
-                                        st.rerun()
-                                    else:
-                                        st.error("❌ 저장 실패")
-                                else:
-                                    st.info("변경사항 없음")
-                        
-                        with action_col2:
-                            if st.button("🗑️", key=f"delete_btn_{original_idx}", help="삭제", use_container_width=True):
-                                if st.session_state.get(f"confirm_delete_{original_idx}", False):
-                                    success = delete_keyword_from_sheet(conn, original_idx)
-                                    if success:
-                                        st.success(f"✅ '{row['키워드']}' 삭제됨!")
-                                        
-                                        # 강력한 캐시 클리어 및 강제 데이터 새로고침
-                                        for key in list(st.session_state.keys()):
-                                            if any(cache_key in key for cache_key in ['saved_keywords', 'existing_keywords', f"confirm_delete_{original_idx}"]):
-                                                del st.session_state[key]
-                                        
-                                        # 강제로 최신 데이터 다시 불러오기
-                                        time.sleep(0.5)
-                                        updated_df = load_keywords_from_sheet(conn, force_refresh=True)
-                                        if not updated_df.empty:
-                                            st.session_state['saved_keywords_df'] = updated_df
-                                            st.session_state['existing_keywords'] = set(updated_df['키워드'].tolist())
-                                        else:
-                                            st.session_state['existing_keywords'] = set()
-                                            st.session_state['saved_keywords_df'] = pd.DataFrame()
-                                        
-                                        st.rerun()
-                                    else:
-                                        st.error("❌ 삭제 실패")
-                                        st.session_state[f"confirm_delete_{original_idx}"] = False
-                                else:
-                                    st.session_state[f"confirm_delete_{original_idx}"] = True
-                                    st.warning(f"⚠️ 삭제 확인: 다시 클릭")
-                    
-                    st.markdown("---")
-            else:
-                st.info(f"📝 '{search_query}' 검색 결과가 없습니다." if search_query else "📝 필터 조건에 맞는 키워드가 없습니다.")
+        export_col1, export_col2 = st.columns(2)
+        with export_col1:
+            st.download_button(
+                "📥 실행 기록 (JSON lines)", METRICS.to_jsonl(),
+                file_name="keyword_metrics.jsonl", mime="application/json", use_container_width=True
+            )
+        with export_col2:
+            st.download_button(
+                "📥 누적 지표 (Prometheus)", METRICS.to_prometheus(),
+                file_name="keyword_metrics.prom", mime="text/plain", use_container_width=True
+            )
+    
+    # 키워드 목록 표시
+    if show_keywords:
+        st.markdown("#### 📝 키워드 목록")
         
-        # 전체 데이터 테이블
-        if show_full_table:
-            add_section_divider("📊 전체 데이터 테이블")
+        total_filtered = len(filtered_positions)
+        if total_filtered:
+            # 보이는 페이지의 행만 위젯으로 그림 (필터와 통계는 전체 데이터 기준)
+            list_col1, list_col2, list_col3, list_col4 = st.columns([1, 2, 1, 1])
+            with list_col4:
+                page_size_options = [10, 20, 50, 100]
+                default_page_size = get_app_setting("list_page_size", 20)
+                list_page_size = st.selectbox(
+                    "페이지당",
+                    page_size_options,
+                    index=page_size_options.index(default_page_size) if default_page_size in page_size_options else 1,
+                    key="list_page_size",
+                    label_visibility="collapsed"
+                )
+            list_pages = (total_filtered - 1) // list_page_size + 1
             
-            # 페이지네이션
-            items_per_page = 30
-            total_items = len(saved_df)
-            total_pages = (total_items - 1) // items_per_page + 1 if total_items > 0 else 1
+            # 필터/정렬/페이지 크기가 바뀌면 첫 페이지로, 삭제 등으로 페이지가 줄면 마지막 페이지로
+            list_signature = (conditions, sort_option, list_page_size)
+            if st.session_state.get('list_signature') != list_signature:
+                st.session_state['list_signature'] = list_signature
+                st.session_state['list_page'] = 1
+            st.session_state['list_page'] = min(max(st.session_state.get('list_page', 1), 1), list_pages)
             
-            if 'current_page' not in st.session_state:
-                st.session_state['current_page'] = 1
+            with list_col1:
+                if st.button("⬅️ 이전", key="list_prev", disabled=st.session_state['list_page'] <= 1, use_container_width=True):
+                    st.session_state['list_page'] -= 1
+                    rerun_keyword_manager()
+            with list_col2:
+                list_start = (st.session_state['list_page'] - 1) * list_page_size
+                list_end = min(list_start + list_page_size, total_filtered)
+                st.markdown(f"""
+                <div style="text-align: center; padding: 0.5rem; color: #b0b0b0;">
+                    페이지 {st.session_state['list_page']} / {list_pages} ({list_start + 1}-{list_end} / 총 {total_filtered}개)
+                </div>
+                """, unsafe_allow_html=True)
+            with list_col3:
+                if st.button("➡️ 다음", key="list_next", disabled=st.session_state['list_page'] >= list_pages, use_container_width=True):
+                    st.session_state['list_page'] += 1
+                    rerun_keyword_manager()
             
-            # 페이지 컨트롤
-            if total_pages > 1:
-                col1, col2, col3 = st.columns([1, 2, 1])
+            page_df = saved_df.take(filtered_positions[list_start:list_end])
+            for idx, row in page_df.iterrows():
+                row_id = row['ID']
+                
+                # 키워드 정보 표시
+                col1, col2, col3, col4, col5, col6 = st.columns([3, 1, 1, 1, 3, 1])
                 
                 with col1:
-                    if st.button("⬅️ 이전", disabled=st.session_state['current_page'] <= 1):
-                        st.session_state['current_page'] -= 1
-                        st.rerun()
+                    st.markdown(f"**🔑 {row['키워드']}**")
+                    st.caption(f"📁 {row['프로젝트명']} | 📅 {display_date(row['날짜'])}")
                 
                 with col2:
-                    st.markdown(f"""
-                    <div style="text-align: center; padding: 0.5rem; color: #b0b0b0;">
-                        페이지 {st.session_state['current_page']} / {total_pages} 
-                        (총 {total_items}개 항목)
-                    </div>
-                    """, unsafe_allow_html=True)
+                    current_status = bool(row['사용여부'])
+                    new_status = st.checkbox(
+                        "사용완료",
+                        value=current_status,
+                        key=f"status_check_{row_id}"
+                    )
                 
                 with col3:
-                    if st.button("➡️ 다음", disabled=st.session_state['current_page'] >= total_pages):
-                        st.session_state['current_page'] += 1
-                        st.rerun()
+                    current_tistory = bool(row.get('티스토리작성', False))
+                    new_tistory = st.checkbox(
+                        "티스토리",
+                        value=current_tistory,
+                        key=f"tistory_check_{row_id}"
+                    )
+                
+                with col4:
+                    current_blogspot = bool(row.get('블로그스팟작성', False))
+                    new_blogspot = st.checkbox(
+                        "블로그스팟",
+                        value=current_blogspot,
+                        key=f"blogspot_check_{row_id}"
+                    )
+                
+                with col5:
+                    current_memo = row.get('메모', '')
+                    new_memo = st.text_input(
+                        "메모", 
+                        value=current_memo,
+                        key=f"memo_input_{row_id}",
+                        placeholder="메모를 입력하세요...",
+                        label_visibility="collapsed"
+                    )
+                
+                with col6:
+                    # 액션 버튼들
+                    action_col1, action_col2 = st.columns(2)
+                    
+                    with action_col1:
+                        if st.button("💾", key=f"save_btn_{row_id}", help="저장", use_container_width=True):
+                            if (new_status != current_status or 
+                                new_tistory != current_tistory or 
+                                new_blogspot != current_blogspot or 
+                                new_memo != current_memo):
+                                # 바뀐 항목만 큐에 기록 (시트 반영은 백그라운드에서 모아서 처리)
+                                queue_keyword_update(
+                                    store, row_id,
+                                    used_status=new_status if new_status != current_status else None,
+                                    tistory_status=new_tistory if new_tistory != current_tistory else None,
+                                    blogspot_status=new_blogspot if new_blogspot != current_blogspot else None,
+                                    memo=new_memo if new_memo != current_memo else None
+                                )
+                                rerun_keyword_manager()
+                            else:
+                                st.info("변경사항 없음")
+                    
+                    with action_col2:
+                        if st.button("🗑️", key=f"delete_btn_{row_id}", help="삭제", use_container_width=True):
+                            if st.session_state.get(f"confirm_delete_{row_id}", False):
+                                # 삭제 표시를 큐에 기록하고 화면에서는 바로 제거
+                                queue_keyword_delete(store, row_id)
+                                del st.session_state[f"confirm_delete_{row_id}"]
+                                rerun_keyword_manager()
+                            else:
+                                st.session_state[f"confirm_delete_{row_id}"] = True
+                                st.warning(f"⚠️ 삭제 확인: 다시 클릭")
+                
+                st.markdown("---")
+        else:
+            st.info(f"📝 '{search_query}' 검색 결과가 없습니다." if search_query else "📝 필터 조건에 맞는 키워드가 없습니다.")
+    
+    # 전체 데이터 테이블
+    if show_full_table:
+        add_section_divider("📊 전체 데이터 테이블")
+        
+        # 페이지네이션
+        items_per_page = 30
+        total_items = len(saved_df)
+        total_pages = (total_items - 1) // items_per_page + 1 if total_items > 0 else 1
+        
+        if 'current_page' not in st.session_state:
+            st.session_state['current_page'] = 1
+        
+        # 페이지 컨트롤
+        if total_pages > 1:
+            col1, col2, col3 = st.columns([1, 2, 1])
             
-            # 현재 페이지 데이터
-            start_idx = (st.session_state['current_page'] - 1) * items_per_page
-            end_idx = start_idx + items_per_page
-            current_page_df = saved_df.iloc[start_idx:end_idx]
+            with col1:
+                if st.button("⬅️ 이전", disabled=st.session_state['current_page'] <= 1):
+                    st.session_state['current_page'] -= 1
+                    rerun_keyword_manager()
             
-            # 데이터프레임 표시
-            if not current_page_df.empty:
-                st.dataframe(
-                    current_page_df,
-                    use_container_width=True,
-                    hide_index=False
-                )
+            with col2:
+                st.markdown(f"""
+                <div style="text-align: center; padding: 0.5rem; color: #b0b0b0;">
+                    페이지 {st.session_state['current_page']} / {total_pages} 
+                    (총 {total_items}개 항목)
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                if st.button("➡️ 다음", disabled=st.session_state['current_page'] >= total_pages):
+                    st.session_state['current_page'] += 1
+                    rerun_keyword_manager()
+        
+        # 현재 페이지 데이터
+        start_idx = (st.session_state['current_page'] - 1) * items_per_page
+        end_idx = start_idx + items_per_page
+        current_page_df = saved_df.iloc[start_idx:end_idx]
         
-        if not show_keywords and not show_full_table:
-            st.info(f"💡 총 {len(saved_df)}개의 키워드가 저장되어 있습니다. '📋 목록 보기' 또는 '📊 테이블'을 체크하여 확인하세요.")
+        # 데이터프레임 표시
+        if not current_page_df.empty:
+            st.dataframe(
+                current_page_df,
+                use_container_width=True,
+                hide_index=False
+            )
+    
+    if not show_keywords and not show_full_table:
+        st.info(f"💡 총 {len(saved_df)}개의 키워드가 저장되어 있습니다. '📋 목록 보기' 또는 '📊 테이블'을 체크하여 확인하세요.")
+
+# 5. 저장된 키워드 관리 섹션
+METRICS.section('render.manager')
+if store:
+    add_section_divider("📊 저장된 키워드 관리")
+    
+    # 저장된 키워드 불러오기 (헤더와 같은 공유 캐시 사용)
+    saved_df = load_keywords_from_sheet(store)
+    
+    # 다른 세션의 변경 알림 (주기적으로 버전만 확인)
+    watch_keyword_changes()
+    if 'change_notice' in st.session_state:
+        st.toast(st.session_state.pop('change_notice'))
+    
+    # 저장 완료 메시지 표시 (저장 후 다시 실행된 화면에서 한번만)
+    if 'save_success' in st.session_state:
+        st.success(st.session_state.pop('save_success'))
+    
+    # 성공 메시지 표시 (한번만)
+    if 'sheet_load_success' in st.session_state and st.session_state.get('show_connection_status', True):
+        sheet_name = st.session_state['sheet_load_success']
+        st.success(f"✅ {sheet_name}에서 데이터를 불러왔습니다!")
+        del st.session_state['sheet_load_success']
+    
+    if not saved_df.empty:
+        render_keyword_manager(store)
     
     else:
         st.info("📝 아직 저장된 키워드가 없습니다. 키워드를 추출하고 저장해보세요!")
@@ -1177,6 +1310,7 @@ else:
     st.warning("⚠️ 구글시트 연결을 확인해주세요. secrets.toml 파일에 인증 정보가 설정되어 있나요?")
 
 # 푸터
+METRICS.section('render.footer')
 add_section_divider()
 st.markdown("""
 <div style="text-align: center; padding: 2rem 0; color: #808080;">
@@ -1184,3 +1318,6 @@ st.markdown("""
     <p style="font-size: 0.9rem; margin: 0;">HTML에서 키워드를 추출하고 구글시트로 체계적으로 관리하세요!</p>
 </div>
 """, unsafe_allow_html=True)
+
+# 실행 계측 마무리 (디버그 패널 표시 및 파일 내보내기)
+finish_run_metrics(run_record)
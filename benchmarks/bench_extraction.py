@@ -0,0 +1,107 @@
+"""HTML 키워드 추출 벤치마크
+
+기존 앱의 BeautifulSoup 전체 트리 방식(legacy_extract)과 keyword_core.extraction 스트리밍 방식을
+benchmarks.generators의 같은 합성 페이지로 돌려 걸린 시간과 최대 메모리(tracemalloc 기준)를 비교합니다.
+
+두 방식은 중복 판단이 다르므로(기존: 글자 그대로, 스트리밍: normalize_keyword 기준) 키워드 목록을 직접 비교하지 않고,
+선택자에 걸린 태그 텍스트가 같은지와 그 텍스트에 dedupe_keywords를 적용한 결과가 스트리밍 결과와 같은지 확인합니다.
+
+    python -m benchmarks.bench_extraction --size-mb 5 --repeat 3
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from benchmarks.generators import WORDS, make_keyword_page
+from keyword_core.extraction import dedupe_keywords, extract_keywords, iter_tag_texts
+
+# 기존 앱의 키워드 선택자
+LEGACY_SELECTOR = '.keyword, .keyword-blur, .end-board-td-blur'
+
+def legacy_extract(html_content, existing_keywords=None):
+    """기존 앱의 parse_keywords_from_html (화면 코드만 빼고 그대로, 비교 기준) → (키워드 목록, 추출 정보)"""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    selector = '.keyword, .keyword-blur, .end-board-td-blur'
+    keyword_tags = soup.select(selector)
+    
+    if existing_keywords is None:
+        existing_keywords = set()
+    
+    seen = set()
+    unique_keywords = []
+    duplicate_count = 0
+    
+    for tag in keyword_tags:
+        text = tag.get_text(strip=True)
+        if text and len(text) >= 2:
+            # 기존 키워드와 중복 체크
+            if text in existing_keywords:
+                duplicate_count += 1
+                continue
+            
+            # 이번 추출에서 중복 체크
+            if text not in seen:
+                seen.add(text)
+                unique_keywords.append(text)
+    
+    info = {
+        'total_found': len(keyword_tags),
+        'duplicates_removed': duplicate_count,
+        'new_keywords': len(unique_keywords)
+    }
+    
+    return unique_keywords[:100], info  # 최대 100개
+
+def legacy_tag_texts(html_content):
+    """기존 방식이 선택자로 찾은 태그 텍스트 목록 (문서 순서)"""
+    return [tag.get_text(strip=True) for tag in BeautifulSoup(html_content, 'html.parser').select(LEGACY_SELECTOR)]
+
+def check_same_tags(html, existing_keywords):
+    """스트리밍 추출이 기존 방식과 같은 태그를 찾고, 그 텍스트로 같은 결과를 내는지 확인 (다르면 SystemExit)"""
+    legacy_texts = legacy_tag_texts(html)
+    if list(iter_tag_texts(html)) != legacy_texts:
+        raise SystemExit("결과 불일치: 스트리밍 추출이 찾은 태그 텍스트가 BeautifulSoup과 다릅니다")
+    if extract_keywords(html, existing_keywords) != dedupe_keywords(legacy_texts, existing_keywords):
+        raise SystemExit("결과 불일치: 같은 태그 텍스트에서 스트리밍 추출 결과가 다릅니다")
+
+def measure(func, html, existing_keywords, repeat):
+    """가장 빠른 실행 시간(초)과 최대 메모리(바이트), 결과 반환"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(html, existing_keywords)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    
+    tracemalloc.start()
+    func(html, existing_keywords)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=float, default=5.0, help='생성할 페이지 크기 (MB)')
+    parser.add_argument('--repeat', type=int, default=3, help='시간 측정 반복 횟수 (가장 빠른 값 사용)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    existing_keywords = {' '.join(WORDS[i:i + 2]) for i in range(0, len(WORDS), 3)}
+    html = make_keyword_page(args.size_mb, seed=args.seed, existing_keywords=sorted(existing_keywords))
+    print(f"페이지 크기: {len(html.encode('utf-8')) / 1024 / 1024:.1f} MB")
+    
+    check_same_tags(html, existing_keywords)
+    legacy_time, legacy_peak, legacy_result = measure(legacy_extract, html, existing_keywords, args.repeat)
+    stream_time, stream_peak, stream_result = measure(extract_keywords, html, existing_keywords, args.repeat)
+    
+    print(f"추출 정보: 기존 {legacy_result[1]} / 스트리밍 {stream_result[1]}")
+    print(f"{'방식':<12}{'시간(s)':>10}{'최대 메모리(MB)':>18}")
+    print(f"{'BeautifulSoup':<12}{legacy_time:>10.3f}{legacy_peak / 1024 / 1024:>18.1f}")
+    print(f"{'스트리밍':<12}{stream_time:>10.3f}{stream_peak / 1024 / 1024:>18.1f}")
+    print(f"속도 {legacy_time / stream_time:.1f}배, 메모리 {legacy_peak / max(stream_peak, 1):.1f}배 절감")
+
+if __name__ == '__main__':
+    main()
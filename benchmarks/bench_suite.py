@@ -0,0 +1,289 @@
+"""키워드 추출·관리 화면·저장소 성능 벤치마크 모음
+
+합성 페이지(benchmarks.generators)로 HTML 추출과 중복 제거를, 합성 키워드 표(1천~50만 행)로
+타입 변환, 중복/유사 키워드 인덱스, 검색·필터·정렬 파이프라인, 통계, 저장소 작업(추가/읽기/수정/정리)을 잽니다.
+구글시트 저장소는 지연 없는 가짜 연결(keyword_core.fake_sheets)로 앱 쪽 처리 비용만 잽니다.
+결과는 JSON 파일로 저장하고, --baseline으로 이전 결과를 주면 항목별로 비교해 느려진 항목이 있으면 종료 코드 1을 돌려줍니다.
+
+    python -m benchmarks.bench_suite --rows 1000,10000,100000 -o bench_results.json
+    python -m benchmarks.bench_suite --rows 10000 --baseline bench_results.json --max-regression 0.25
+    python -m benchmarks.bench_suite --rows 500000 --only pipeline,storage --repeat 5
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.generators import make_keyword_page, make_keyword_table, make_keywords
+from keyword_core.dedupe import KeywordIndex
+from keyword_core.extraction import extract_keywords, filter_new_keywords
+from keyword_core.fake_sheets import FakeSheetsConnection
+from keyword_core.filters import FilterEngine, compile_filters
+from keyword_core.frame import to_typed_frame
+from keyword_core.profiles import AUTO_PROFILE, load_profiles
+from keyword_core.search import SearchIndex
+from keyword_core.similarity import NearDuplicateIndex, find_near_duplicates
+from keyword_core.stats import KeywordStats
+from keyword_core.storage import TOMBSTONE, GSheetsStore, SQLiteStore
+
+# 결과 파일 형식 버전 (항목 이름/필드가 바뀌면 올림)
+RESULT_VERSION = 1
+
+# 벤치마크 날짜 기준 (합성 표의 마지막 저장 시각과 맞춰 날짜 필터 결과가 실행할 때마다 같도록)
+BENCH_NOW = datetime(2024, 6, 30, 18, 0, 0)
+
+# 관리 화면에서 자주 쓰는 필터 조합 (검색 + 프로젝트 + 사용여부 + 등록일)
+PIPELINE_FILTERS = dict(search_query='운동', project='프로젝트03', usage='미사용(❌)', date='최근 한달')
+
+def measure(func, repeat, setup=None):
+    """func를 repeat번 실행한 시간 목록(초) (setup이 있으면 매번 setup()의 반환값을 인자로 넘기고 그 시간은 빼고 잼)"""
+    timings = []
+    for _ in range(repeat):
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+class Suite:
+    """벤치마크 결과 모음 (--only로 고른 항목만 실행)"""
+    
+    def __init__(self, repeat, only=None):
+        self.repeat = repeat
+        self.only = only
+        self.results = []
+    
+    def wanted(self, name):
+        return not self.only or any(name.startswith(prefix) for prefix in self.only)
+    
+    def run(self, name, func, setup=None, repeat=None, **params):
+        """항목 하나 측정 후 결과 기록 (가장 빠른 값과 중앙값)"""
+        if not self.wanted(name):
+            return None
+        timings = measure(func, repeat or self.repeat, setup)
+        result = {
+            'name': name,
+            'params': params,
+            'best_s': min(timings),
+            'median_s': statistics.median(timings),
+            'repeat': len(timings),
+        }
+        self.results.append(result)
+        print(f"{result_key(result):<64}{result['best_s'] * 1000:>12.2f}{result['median_s'] * 1000:>12.2f}", flush=True)
+        return result
+
+def result_key(result):
+    """비교에 쓰는 항목 키 (예: pipeline.warm[rows=10000])"""
+    params = ','.join(f"{key}={value}" for key, value in sorted(result['params'].items()))
+    return f"{result['name']}[{params}]" if params else result['name']
+
+def bench_extraction(suite, size_mb, density, duplicate_ratio, seed):
+    """HTML 추출 (앱의 parse_keywords_from_html과 같은 extract_keywords 호출) 및 직접 입력 중복 제거"""
+    saved_keywords = make_keywords(2000, seed=seed + 1)
+    existing_keywords = KeywordIndex(saved_keywords)
+    html = make_keyword_page(size_mb, density, duplicate_ratio, seed, existing_keywords=saved_keywords)
+    profiles = load_profiles()
+    params = dict(size_mb=size_mb, density=density, duplicate_ratio=duplicate_ratio)
+    
+    suite.run('extract.default', lambda: extract_keywords(html, existing_keywords, profile='default', profiles=profiles), **params)
+    suite.run('extract.auto', lambda: extract_keywords(html, existing_keywords, profile=AUTO_PROFILE, profiles=profiles), **params)
+
+def bench_table(suite, rows, seed):
+    """합성 키워드 표 rows행에 대한 관리 화면 파이프라인과 중복 검사"""
+    raw_df = make_keyword_table(rows, seed=seed, now=BENCH_NOW)
+    df = to_typed_frame(raw_df)
+    candidates = make_keywords(1000, duplicate_ratio=0.3, seed=seed + 2, pool=list(raw_df['키워드'].iloc[:5000]))
+    
+    suite.run('frame.typed', lambda: to_typed_frame(raw_df), rows=rows)
+    
+    # 중복 제거: 저장된 키워드 인덱스 만들기와 새 키워드 1000개 검사
+    suite.run('dedupe.index', lambda: KeywordIndex.from_frame(df), rows=rows)
+    keyword_index = KeywordIndex.from_frame(df)
+    suite.run('dedupe.filter_new', lambda: filter_new_keywords(candidates, keyword_index), rows=rows)
+    if suite.wanted('dedupe.near'):
+        suite.run('dedupe.near_index', lambda: NearDuplicateIndex.from_frame(df), repeat=1, rows=rows)
+        near_index = NearDuplicateIndex.from_frame(df)
+        suite.run('dedupe.near_query', lambda: find_near_duplicates(candidates[:100], near_index), rows=rows)
+    
+    # 검색 색인과 통계
+    suite.run('search.index', lambda: SearchIndex.from_frame(df), rows=rows)
+    search_index = SearchIndex.from_frame(df)
+    suite.run('search.query', lambda: search_index.search('운동'), rows=rows)
+    suite.run('stats.build', lambda: KeywordStats.from_frame(df), rows=rows)
+    stats = KeywordStats.from_frame(df)
+    suite.run('stats.summary', lambda: stats.summary('프로젝트03', 사용여부=False), rows=rows)
+    
+    # 검색·필터·정렬: 새 데이터 버전(마스크 캐시 없음)과 같은 버전 재실행(마스크 재사용)
+    conditions = compile_filters(**PIPELINE_FILTERS, today=BENCH_NOW)
+    
+    def pipeline(engine, sort_option='최신순'):
+        positions, mask = engine.positions(df, 1, conditions, sort_option, search_index=search_index)
+        engine.summary(df, 1, mask)
+        return df.take(positions[:20])
+    
+    suite.run('pipeline.cold', pipeline, setup=FilterEngine, rows=rows)
+    warm_engine = FilterEngine()
+    pipeline(warm_engine)
+    suite.run('pipeline.warm', lambda: pipeline(warm_engine), rows=rows)
+    for sort_option, name in [('최신순', 'latest'), ('키워드명 순', 'keyword'), ('프로젝트명 순', 'project')]:
+        suite.run(f'pipeline.sort.{name}', lambda: warm_engine.positions(df, 1, (), sort_option), rows=rows)
+    return raw_df
+
+def bench_storage(suite, raw_df, workdir):
+    """SQLite 저장소 작업 (행 추가, 전체 읽기, 1% 행 수정, 1% 삭제 표시 정리)"""
+    rows = len(raw_df)
+    if not suite.wanted('storage'):
+        return
+    new_rows = raw_df.to_dict('records')
+    edited_ids = list(raw_df['ID'].iloc[::100])
+    counter = iter(range(10 ** 6))
+    
+    def fresh_store(filled=True):
+        store = SQLiteStore(os.path.join(workdir, f"bench_{rows}_{next(counter)}.db"))
+        if filled:
+            store.append(new_rows)
+        return store
+    
+    suite.run('storage.sqlite.append', lambda store: store.append(new_rows),
+              setup=lambda: fresh_store(filled=False), rows=rows)
+    store = fresh_store()
+    suite.run('storage.sqlite.load', store.load, rows=rows)
+    edits = {row_id: {'사용여부': True, '메모': '벤치마크'} for row_id in edited_ids}
+    suite.run('storage.sqlite.patch', lambda: store.patch(edits), rows=rows, edited=len(edits))
+    
+    tombstones = {row_id: {'삭제여부': TOMBSTONE} for row_id in edited_ids}
+    
+    def marked_store():
+        marked = fresh_store()
+        marked.patch(tombstones)
+        return marked
+    
+    suite.run('storage.sqlite.compact', lambda marked: marked.compact(), setup=marked_store,
+              rows=rows, removed=len(tombstones))
+
+def bench_fake_sheets(suite, raw_df):
+    """구글시트 저장소 작업 (지연 없는 가짜 연결: 행 추가, 전체 읽기, 1% 행 수정, 1% 삭제 표시 정리)"""
+    rows = len(raw_df)
+    if not suite.wanted('storage'):
+        return
+    new_rows = raw_df.to_dict('records')
+    edited_ids = list(raw_df['ID'].iloc[::100])
+    edits = {row_id: {'사용여부': True, '메모': '벤치마크'} for row_id in edited_ids}
+    tombstones = {row_id: {'삭제여부': TOMBSTONE} for row_id in edited_ids}
+    
+    def fresh_store(filled=True, loaded=False, marked=False):
+        store = GSheetsStore(FakeSheetsConnection(worksheets={'키워드관리': []}))
+        if filled:
+            store.append(new_rows)
+        if loaded or marked:
+            store.load()
+        if marked:
+            store.patch(tombstones)
+        return store
+    
+    suite.run('storage.gsheets.append', lambda store: store.append(new_rows),
+              setup=lambda: fresh_store(filled=False), rows=rows)
+    store = fresh_store()
+    suite.run('storage.gsheets.load', store.load, rows=rows)
+    suite.run('storage.gsheets.patch', lambda store: store.patch(edits),
+              setup=lambda: fresh_store(loaded=True), rows=rows, edited=len(edits))
+    suite.run('storage.gsheets.compact', lambda store: store.compact(),
+              setup=lambda: fresh_store(marked=True), rows=rows, removed=len(tombstones))
+
+def compare(results, baseline, max_regression):
+    """기준 결과와 항목별 비교 출력, 허용치보다 느려진 항목 키 목록 반환 (가장 빠른 값 기준)"""
+    baseline_by_key = {result_key(result): result for result in baseline.get('results', [])}
+    regressions = []
+    print(f"\n{'항목':<64}{'기준(ms)':>12}{'현재(ms)':>12}{'비율':>8}")
+    for result in results:
+        key = result_key(result)
+        base = baseline_by_key.get(key)
+        if base is None:
+            print(f"{key:<64}{'-':>12}{result['best_s'] * 1000:>12.2f}{'새 항목':>8}")
+            continue
+        ratio = result['best_s'] / base['best_s'] if base['best_s'] else float('inf')
+        marker = ''
+        if ratio > 1 + max_regression:
+            regressions.append(key)
+            marker = '  ⚠️'
+        print(f"{key:<64}{base['best_s'] * 1000:>12.2f}{result['best_s'] * 1000:>12.2f}{ratio:>8.2f}{marker}")
+    return regressions
+
+def parse_sizes(text, cast=int):
+    """'1000,10k,0.5' 같은 쉼표 목록 → 숫자 목록 (k는 1000배)"""
+    sizes = []
+    for part in filter(None, (p.strip().lower() for p in text.split(','))):
+        sizes.append(cast(float(part[:-1]) * 1000) if part.endswith('k') else cast(part))
+    return sizes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_suite', description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', default='1000,10000,100000', help="합성 키워드 표 행 수 목록 (예: 1k,10k,100k,500k)")
+    parser.add_argument('--size-mb', default='1', help="합성 페이지 크기 목록 (MB)")
+    parser.add_argument('--density', type=float, default=0.5, help="페이지 행 가운데 키워드 선택자에 걸리는 비율")
+    parser.add_argument('--duplicate-ratio', type=float, default=0.2, help="페이지 키워드 가운데 중복 비율")
+    parser.add_argument('--repeat', type=int, default=3, help="항목별 반복 횟수 (가장 빠른 값과 중앙값 기록)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', help="이 접두사로 시작하는 항목만 실행 (쉼표 목록, 예: pipeline,storage)")
+    parser.add_argument('-o', '--output', default='bench_results.json', help="결과 JSON 파일 ('-'면 쓰지 않음)")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON 파일")
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help="기준보다 이 비율 넘게 느려지면 실패 (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+    
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f"기준 결과를 읽을 수 없습니다: {e}")
+    
+    suite = Suite(args.repeat, [p.strip() for p in args.only.split(',') if p.strip()] if args.only else None)
+    print(f"{'항목':<64}{'최소(ms)':>12}{'중앙값(ms)':>12}")
+    started = time.perf_counter()
+    
+    if suite.wanted('extract'):
+        for size_mb in parse_sizes(args.size_mb, float):
+            bench_extraction(suite, size_mb, args.density, args.duplicate_ratio, args.seed)
+    
+    with tempfile.TemporaryDirectory(prefix='keyword-bench-') as workdir:
+        for rows in parse_sizes(args.rows):
+            raw_df = bench_table(suite, rows, args.seed)
+            bench_storage(suite, raw_df, workdir)
+            bench_fake_sheets(suite, raw_df)
+    
+    report = {
+        'version': RESULT_VERSION,
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'elapsed_s': round(time.perf_counter() - started, 3),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'args': vars(args),
+        },
+        'results': suite.results,
+    }
+    if args.output != '-':
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    
+    if baseline is not None:
+        regressions = compare(suite.results, baseline, args.max_regression)
+        if regressions:
+            print(f"\n기준보다 {args.max_regression:.0%} 넘게 느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""벤치마크용 합성 데이터 생성
+
+같은 seed면 항상 같은 결과가 나오므로 기준 결과(baseline)와 비교할 수 있습니다.
+
+    make_keyword_page(size_mb=2, density=0.5, duplicate_ratio=0.3)   # 키워드 도구 결과 페이지 HTML
+    make_keyword_table(100_000)                                       # 저장소에서 읽은 형태의 키워드 표
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from keyword_core.storage import DATE_FORMAT, ID_PREFIX, SHEET_COLUMNS
+
+WORDS = ['다이어트', '식단', '홈트', '운동', '추천', '방법', '후기', '가격', '비교', '효과',
+         '부작용', '2024', '순위', '맛집', '여행', '캠핑', '노트북', '청소기', 'best', 'diy']
+
+# 합성 단어를 만들 한글 음절 (WORDS만으로는 50만 개의 서로 다른 키워드를 만들 수 없음)
+SYLLABLES = '가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후'
+
+# 키워드 선택자에 걸리는 클래스 / 걸리지 않는 클래스 (profiles.DEFAULT_SELECTORS 기준)
+MATCHING_CLASSES = ['keyword', 'keyword-blur', 'keyword highlight']
+OTHER_CLASSES = ['plain', 'title', 'rank-text']
+
+MEMOS = ['', '', '', '다음 주 작성', '경쟁 많음', '시즌 키워드', '재확인 필요']
+
+def make_keyword(rng):
+    """실제 단어와 합성 단어를 섞은 키워드 하나 (1~3 단어)"""
+    words = []
+    for _ in range(rng.randint(1, 3)):
+        if rng.random() < 0.5:
+            words.append(rng.choice(WORDS))
+        else:
+            words.append(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return ' '.join(words)
+
+def make_keywords(count, duplicate_ratio=0.0, seed=0, pool=None):
+    """키워드 count개 (duplicate_ratio 비율은 앞에 나온 키워드나 pool의 키워드를 다시 사용)"""
+    rng = random.Random(seed)
+    pool = list(pool or [])
+    keywords = []
+    for _ in range(count):
+        if (keywords or pool) and rng.random() < duplicate_ratio:
+            source = pool if pool and (not keywords or rng.random() < 0.5) else keywords
+            keyword = rng.choice(source)
+            # 정규화하면 같아지는 변형 (대소문자/공백)
+            if rng.random() < 0.3:
+                keyword = keyword.upper().replace(' ', '  ')
+            keywords.append(keyword)
+        else:
+            keywords.append(make_keyword(rng))
+    return keywords
+
+def make_keyword_page(size_mb=1.0, density=0.5, duplicate_ratio=0.2, seed=0, existing_keywords=None):
+    """키워드 도구 결과 페이지를 흉내 낸 HTML
+    
+    density: 표 행 가운데 키워드 선택자에 걸리는 행의 비율
+    duplicate_ratio: 걸리는 키워드 가운데 같은 페이지의 앞 키워드나 existing_keywords를 반복하는 비율
+    """
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    keyword_seed = rng.randrange(2 ** 32)
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>키워드</title>',
+             '<style>.keyword{color:red}</style></head><body><table class="end-board">']
+    size = sum(len(p) for p in parts)
+    
+    # 페이지 크기에 맞춰 키워드를 넉넉히 만들어 두고 차례로 사용
+    batch = max(int(target / 300 * density), 1) + 1
+    keywords = iter(make_keywords(batch, duplicate_ratio, keyword_seed, existing_keywords))
+    
+    while size < target:
+        if rng.random() < density:
+            keyword = next(keywords, None) or make_keyword(rng)
+            css = rng.choice(MATCHING_CLASSES)
+        else:
+            keyword = make_keyword(rng)
+            css = rng.choice(OTHER_CLASSES)
+        row = (
+            f'<tr class="row"><td class="rank">{rng.randint(1, 9999)}</td>'
+            f'<td><a href="/search?q={rng.randint(0, 10**9)}"><span class="{css}">{keyword}</span></a></td>'
+            f'<td class="volume"><b>{rng.randint(10, 99999)}</b>&nbsp;회</td>'
+            f'<td class="volume"><!-- pc/mobile --><i>{rng.randint(0, 500)}</i><br>{rng.randint(0, 500)}</td></tr>\n'
+        )
+        if rng.random() < 0.01:
+            row += '<script>window.dataLayer = window.dataLayer || []; dataLayer.push({"k": 1});</script>\n'
+        parts.append(row)
+        size += len(row)
+    
+    parts.append('</table></body></html>')
+    return ''.join(parts)
+
+def make_keyword_table(rows, projects=20, used_ratio=0.3, written_ratio=0.2, duplicate_ratio=0.05,
+                       days=90, seed=0, now=None):
+    """저장소 load()가 돌려주는 형태(시트 값: ✅/❌, 날짜 문자열)의 키워드 표 rows행
+    
+    날짜는 now부터 days일 전까지 퍼져 있고 저장 순서대로 오래된 것부터 나옵니다.
+    """
+    rng = random.Random(seed)
+    now = (now or datetime(2024, 6, 30, 18, 0, 0)).replace(microsecond=0)
+    project_names = [f"프로젝트{i + 1:02d}" for i in range(projects)]
+    keywords = make_keywords(rows, duplicate_ratio, seed)
+    offsets = sorted((rng.randrange(days * 86400) for _ in range(rows)), reverse=True)
+    
+    def status(ratio):
+        return '✅' if rng.random() < ratio else '❌'
+    
+    data = {
+        '날짜': [(now - timedelta(seconds=offset)).strftime(DATE_FORMAT) for offset in offsets],
+        '프로젝트명': [rng.choice(project_names) for _ in range(rows)],
+        '키워드': keywords,
+        '사용여부': [status(used_ratio) for _ in range(rows)],
+        '티스토리작성': [status(written_ratio) for _ in range(rows)],
+        '블로그스팟작성': [status(written_ratio) for _ in range(rows)],
+        '메모': [rng.choice(MEMOS) for _ in range(rows)],
+        'ID': [f"{ID_PREFIX}{rng.getrandbits(44):011x}" for _ in range(rows)],
+        '삭제여부': [''] * rows,
+    }
+    df = pd.DataFrame(data, columns=SHEET_COLUMNS)
+    df.attrs['tombstone_count'] = 0
+    return df
+
+def make_keyword_rows(rows, **options):
+    """make_keyword_table과 같은 데이터를 저장소 append()에 넘길 {컬럼: 값} 행 목록으로"""
+    return make_keyword_table(rows, **options).to_dict('records')
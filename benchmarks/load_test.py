@@ -0,0 +1,410 @@
+"""여러 세션 동시 사용 부하 테스트 (Streamlit AppTest로 실제 앱 화면을 조작)
+
+세션 N개가 각자 HTML 붙여넣기 → 추출 → 키워드 선택 → 저장 → 검색·필터 → 상태 체크 후 저장 → 삭제를 진행하고,
+모든 세션은 한 프로세스에서 공유 캐시/쓰기 큐/저장소를 함께 씁니다(실제 서버 한 대와 같은 구성).
+AppTest는 한 프로세스에서 동시에 여러 개를 돌릴 수 없으므로, 세션들은 동작 하나씩 번갈아(라운드 로빈) 진행합니다.
+재실행 지연은 다른 세션들의 상태(캐시, 세션 상태, 대기 중인 쓰기)가 모두 살아 있는 서버에서 잰 값이고,
+쓰기 큐와 캐시 다시 읽기는 백그라운드 스레드에서 실제로 동시에 돕니다.
+저장소는 로컬 가짜 구글시트(keyword_core.fake_sheets, 지연·할당량 설정 가능) 또는 SQLite 임시 파일이며,
+가짜 구글시트에는 중간중간 빈 행을 끼워 둘 수 있습니다(--blank-rows, 사람이 지운 행 흉내).
+끝나면 세션들이 수정/삭제한 행이 저장소의 바로 그 행에 들어갔는지도 검사해 오류로 보고합니다.
+
+재실행 지연 백분위(전체/동작별), 세션당 서버 RSS 증가량, 저장소 호출 수(keyword_core.instrumentation 카운터)를 보고하고,
+--max-* 기준을 넘으면 종료 코드 1을 돌려줍니다. 다른 스크립트나 테스트에서는 run_load_test()의 결과를
+assert_thresholds()에 넘겨 회귀 기준을 검사할 수 있습니다.
+
+    python -m benchmarks.load_test --sessions 10 --rows 5000 -o load_results.json
+    python -m benchmarks.load_test --sessions 20 --latency 0.2 --max-p95-ms 3000 --max-reads-per-session 2
+    python -m benchmarks.load_test --sessions 3 --rows 200 --blank-rows 20
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import closing
+
+from benchmarks.generators import make_keyword_page, make_keyword_table
+from keyword_core.fake_sheets import FakeSheetsConnection
+from keyword_core.instrumentation import METRICS
+from keyword_core.storage import SHEET_COLUMNS, TOMBSTONE, SQLiteStore
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+# 보고할 지연 백분위
+PERCENTILES = (50, 90, 95, 99)
+
+# 세션 흐름에서 누르는 화면 요소의 라벨 (앱 문구가 바뀌면 함께 수정)
+EXTRACT_BUTTON = "🔍 키워드 추출 시작"
+PROJECT_INPUT = "프로젝트명을 입력하세요"
+SAVE_BUTTON = "💾 구글시트에 저장"
+SEARCH_INPUT = "🔍 통합 검색"
+USAGE_FILTER = "✅ 사용여부"
+
+def current_rss_mb():
+    """현재 프로세스 RSS (MB, /proc이 없으면 최대 RSS로 대신함)"""
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, 리눅스는 KB 단위
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+def percentile(values, pct):
+    """nearest-rank 백분위 (values가 비어 있으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+def latency_summary(values):
+    """지연 목록(ms) → {count, mean, p50, p90, p95, p99, max}"""
+    summary = {'count': len(values), 'mean': round(sum(values) / len(values), 2) if values else None}
+    for pct in PERCENTILES:
+        value = percentile(values, pct)
+        summary[f'p{pct}'] = None if value is None else round(value, 2)
+    summary['max'] = round(max(values), 2) if values else None
+    return summary
+
+def seed_storage(backend, rows, workdir, seed=0, blank_rows=0):
+    """세션이 쓸 저장소 파일을 합성 키워드 rows행으로 채우고 앱 설정(환경변수) 반환
+    
+    blank_rows: 가짜 구글시트의 데이터 행 사이에 고르게 끼워 넣을 빈 행 수 (SQLite는 무시)
+    """
+    table = make_keyword_table(rows, seed=seed) if rows else None
+    if backend == 'sqlite':
+        path = os.path.join(workdir, 'load_test.db')
+        if table is not None:
+            SQLiteStore(path).append(table.to_dict('records'))
+        return {'KEYWORD_STORAGE_BACKEND': 'sqlite', 'KEYWORD_SQLITE_PATH': path}
+    
+    path = os.path.join(workdir, 'load_test_sheets.json')
+    data = table.astype(str).values.tolist() if table is not None else []
+    if blank_rows:
+        step = max(len(data) // blank_rows, 1)
+        for position in range(blank_rows, 0, -1):
+            data.insert(min(position * step, len(data)), [''] * len(SHEET_COLUMNS))
+    grid = [list(SHEET_COLUMNS)] + data
+    FakeSheetsConnection(path, worksheets={'키워드관리': grid}).save()
+    return {'KEYWORD_STORAGE_BACKEND': 'fake_gsheets', 'KEYWORD_FAKE_SHEETS_PATH': path}
+
+class _SessionFailed(Exception):
+    """세션 흐름을 더 진행할 수 없음 (오류는 SessionDriver.errors에 기록됨)"""
+
+def _find(elements, label):
+    for element in elements:
+        if element.label == label:
+            return element
+    raise LookupError(f"화면 요소를 찾을 수 없음: {label}")
+
+class SessionDriver:
+    """세션 하나 (AppTest 하나)로 사용자 흐름 진행, 동작마다 재실행 시간 기록
+    
+    flow()는 동작 하나를 마칠 때마다 멈추는 제너레이터라서 여러 세션을 번갈아 진행할 수 있습니다.
+    """
+    
+    def __init__(self, index, html, select_count, timeout):
+        from streamlit.testing.v1 import AppTest
+        
+        self.index = index
+        self.html = html
+        self.select_count = select_count
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.timings = []
+        self.errors = []
+        # 저장소에 반영됐어야 하는 수정/삭제 (끝난 뒤 check_storage로 검사)
+        self.updated = []
+        self.deleted = []
+    
+    def step(self, action, prepare=None):
+        """prepare(app)로 위젯 값을 바꾼 뒤 재실행하고 걸린 시간 기록 (요소를 못 찾거나 앱 예외가 나면 _SessionFailed)"""
+        try:
+            if prepare is not None:
+                prepare(self.app)
+            started = time.perf_counter()
+            self.app.run()
+            self.timings.append((action, (time.perf_counter() - started) * 1000))
+        except Exception as e:
+            self.errors.append(f"세션 {self.index} {action}: {e}")
+            raise _SessionFailed() from e
+        if self.app.exception:
+            self.errors.append(f"세션 {self.index} {action}: {self.app.exception[0].message}")
+            raise _SessionFailed()
+    
+    def _keyword_ids(self):
+        """목록에 보이는 키워드 행 ID (상태 체크박스 키에서)"""
+        prefix = 'status_check_'
+        return [box.key[len(prefix):] for box in self.app.checkbox if box.key and box.key.startswith(prefix)]
+    
+    def flow(self):
+        """붙여넣기 → 추출 → 선택 → 저장 → 검색·필터 → 상태 수정 → 삭제 (동작마다 yield)"""
+        try:
+            yield from self._flow()
+        except _SessionFailed:
+            return
+    
+    def _flow(self):
+        self.step('open')
+        yield
+        self.step('paste', lambda app: app.text_area[0].input(self.html))
+        yield
+        self.step('extract', lambda app: _find(app.button, EXTRACT_BUTTON).click())
+        yield
+        
+        for position in range(self.select_count):
+            key = f"keyword_btn_{position}"
+            if not any(button.key == key for button in self.app.button):
+                break
+            self.step('select', lambda app: app.button(key=key).click())
+            yield
+        
+        project = f"부하테스트{self.index:02d}"
+        if any(element.label == PROJECT_INPUT for element in self.app.text_input):
+            self.step('project', lambda app: _find(app.text_input, PROJECT_INPUT).input(project))
+            yield
+            self.step('save', lambda app: _find(app.button, SAVE_BUTTON).click())
+            yield
+        
+        # 방금 저장한 프로젝트로 검색 → 사용여부 필터 → 필터 해제
+        self.step('search', lambda app: _find(app.text_input, SEARCH_INPUT).input(project))
+        yield
+        self.step('filter', lambda app: _find(app.selectbox, USAGE_FILTER).select('미사용(❌)'))
+        yield
+        self.step('filter', lambda app: _find(app.selectbox, USAGE_FILTER).select('전체'))
+        yield
+        
+        row_ids = self._keyword_ids()
+        if row_ids:
+            row_id = row_ids[0]
+            self.step('toggle', lambda app: app.checkbox(key=f"status_check_{row_id}").check())
+            yield
+            self.step('toggle', lambda app: app.checkbox(key=f"tistory_check_{row_id}").check())
+            yield
+            self.step('update', lambda app: app.button(key=f"save_btn_{row_id}").click())
+            self.updated.append(row_id)
+            yield
+        if len(row_ids) > 1:
+            row_id = row_ids[-1]
+            # 삭제는 두 번 눌러 확인
+            self.step('delete', lambda app: app.button(key=f"delete_btn_{row_id}").click())
+            yield
+            self.step('delete', lambda app: app.button(key=f"delete_btn_{row_id}").click())
+            self.deleted.append(row_id)
+            yield
+
+def run_round_robin(drivers):
+    """모든 세션의 흐름을 동작 하나씩 번갈아 끝까지 진행"""
+    flows = [driver.flow() for driver in drivers]
+    while flows:
+        for flow in list(flows):
+            if next(flow, StopIteration) is StopIteration:
+                flows.remove(flow)
+
+def check_storage(settings, drivers):
+    """세션들이 수정/삭제한 행이 저장소의 그 행에 들어갔는지, 키워드/ID 없이 값만 있는 행이 생기지 않았는지 검사 → 문제 목록"""
+    if settings['KEYWORD_STORAGE_BACKEND'] == 'sqlite':
+        select_columns = ', '.join(f'"{col}"' for col in SHEET_COLUMNS)
+        with closing(sqlite3.connect(settings['KEYWORD_SQLITE_PATH'])) as db:
+            lines = [list(SHEET_COLUMNS)] + [list(row) for row in db.execute(f"SELECT {select_columns} FROM keywords")]
+    else:
+        lines = FakeSheetsConnection(settings['KEYWORD_FAKE_SHEETS_PATH']).worksheet_values('키워드관리')
+    
+    header = lines[0]
+    rows = [dict(zip(header, line)) for line in lines[1:] if any(line)]
+    problems = [f"저장소 검사: 키워드/ID 없는 행 {row}" for row in rows if not row.get('키워드') or not row.get('ID')]
+    by_id = {}
+    for row in rows:
+        if row.get('ID') in by_id:
+            problems.append(f"저장소 검사: 중복 ID {row['ID']}")
+        by_id[row.get('ID')] = row
+    for driver in drivers:
+        for row_id in driver.updated:
+            row = by_id.get(row_id)
+            if row is None or row.get('사용여부') != '✅' or row.get('티스토리작성') != '✅':
+                problems.append(f"저장소 검사: 세션 {driver.index}의 수정이 {row_id} 행에 없음 ({row})")
+        for row_id in driver.deleted:
+            row = by_id.get(row_id)
+            if row is not None and row.get('삭제여부') != TOMBSTONE:
+                problems.append(f"저장소 검사: 세션 {driver.index}이 삭제한 {row_id} 행에 삭제 표시 없음")
+    return problems
+
+def run_load_test(sessions=5, rows=1000, backend='fake_gsheets', latency=0.0, rate_limit=0,
+                  consistency_delay=0.0, select_count=5, page_kb=50, flush_interval=0.5, timeout=120, seed=0,
+                  blank_rows=0):
+    """세션 sessions개로 부하 테스트를 돌리고 결과 dict 반환 (blank_rows는 seed_storage 참고)"""
+    with tempfile.TemporaryDirectory(prefix='keyword-load-') as workdir:
+        settings = seed_storage(backend, rows, workdir, seed, blank_rows)
+        settings.update({
+            'KEYWORD_FAKE_SHEETS_LATENCY': str(latency),
+            'KEYWORD_FAKE_SHEETS_RATE_LIMIT': str(rate_limit),
+            'KEYWORD_FAKE_SHEETS_CONSISTENCY_DELAY': str(consistency_delay),
+            'KEYWORD_WRITE_FLUSH_INTERVAL': str(flush_interval),
+            # 부하 테스트 중에는 주기 확인 조각을 끔 (AppTest는 주기 실행을 하지 않음)
+            'KEYWORD_CHANGE_POLL_SECONDS': '0',
+        })
+        previous_env = {key: os.environ.get(key) for key in settings}
+        os.environ.update(settings)
+        try:
+            return _run_sessions(settings, sessions, rows, backend, latency, rate_limit, consistency_delay,
+                                 select_count, page_kb, flush_interval, timeout, seed, blank_rows)
+        finally:
+            for key, value in previous_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+def _run_sessions(settings, sessions, rows, backend, latency, rate_limit, consistency_delay,
+                  select_count, page_kb, flush_interval, timeout, seed, blank_rows):
+    counters_before = METRICS.snapshot()['counters']
+    rss_before = current_rss_mb()
+    drivers = [
+        SessionDriver(index, make_keyword_page(page_kb / 1024, seed=seed + index + 1), select_count, timeout)
+        for index in range(sessions)
+    ]
+    
+    started = time.perf_counter()
+    run_round_robin(drivers)
+    elapsed = time.perf_counter() - started
+    
+    # 쓰기 지연 큐가 남은 수정을 반영할 시간을 준 뒤 호출 수 집계
+    time.sleep(flush_interval * 2)
+    rss_after = current_rss_mb()
+    counters_after = METRICS.snapshot()['counters']
+    storage_calls = {
+        name: value - counters_before.get(name, 0)
+        for name, value in sorted(counters_after.items())
+        if value != counters_before.get(name, 0)
+    }
+    
+    timings = [(action, ms) for driver in drivers for action, ms in driver.timings]
+    by_action = {}
+    for action, ms in timings:
+        by_action.setdefault(action, []).append(ms)
+    
+    return {
+        'meta': {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'sessions': sessions,
+            'rows': rows,
+            'blank_rows': blank_rows,
+            'backend': backend,
+            'latency_s': latency,
+            'rate_limit': rate_limit,
+            'consistency_delay_s': consistency_delay,
+            'elapsed_s': round(elapsed, 3),
+            'python': platform.python_version(),
+            'threads_alive': threading.active_count(),
+        },
+        'latency_ms': {
+            'overall': latency_summary([ms for _, ms in timings]),
+            'by_action': {action: latency_summary(values) for action, values in by_action.items()},
+        },
+        'memory': {
+            'rss_before_mb': round(rss_before, 1),
+            'rss_after_mb': round(rss_after, 1),
+            'rss_per_session_mb': round((rss_after - rss_before) / max(sessions, 1), 2),
+        },
+        'storage_calls': storage_calls,
+        'storage_calls_per_session': {name: round(value / max(sessions, 1), 2) for name, value in storage_calls.items()},
+        'errors': [error for driver in drivers for error in driver.errors] + check_storage(settings, drivers),
+    }
+
+def check_thresholds(report, max_p95_ms=None, max_p99_ms=None, max_rss_per_session_mb=None,
+                     max_reads_per_session=None, max_errors=0):
+    """기준을 넘은 항목 설명 목록 (None인 기준은 검사하지 않음)"""
+    violations = []
+    overall = report['latency_ms']['overall']
+    if max_p95_ms is not None and (overall['p95'] or 0) > max_p95_ms:
+        violations.append(f"p95 재실행 지연 {overall['p95']}ms > {max_p95_ms}ms")
+    if max_p99_ms is not None and (overall['p99'] or 0) > max_p99_ms:
+        violations.append(f"p99 재실행 지연 {overall['p99']}ms > {max_p99_ms}ms")
+    rss = report['memory']['rss_per_session_mb']
+    if max_rss_per_session_mb is not None and rss > max_rss_per_session_mb:
+        violations.append(f"세션당 RSS {rss}MB > {max_rss_per_session_mb}MB")
+    if max_reads_per_session is not None:
+        per_session = report['storage_calls_per_session']
+        reads = per_session.get('sheets.reads', 0) + per_session.get('sqlite.reads', 0)
+        if reads > max_reads_per_session:
+            violations.append(f"세션당 저장소 읽기 {reads}회 > {max_reads_per_session}회")
+    if max_errors is not None and len(report['errors']) > max_errors:
+        violations.append(f"오류 {len(report['errors'])}건 > {max_errors}건: {report['errors'][:3]}")
+    return violations
+
+def assert_thresholds(report, **limits):
+    """check_thresholds 기준을 넘으면 AssertionError (테스트에서 회귀 검사용)"""
+    violations = check_thresholds(report, **limits)
+    assert not violations, "부하 테스트 기준 초과: " + "; ".join(violations)
+
+def print_report(report):
+    meta = report['meta']
+    print(f"세션 {meta['sessions']}개, {meta['backend']} {meta['rows']}행, {meta['elapsed_s']}초")
+    print(f"\n{'동작':<10}{'횟수':>6}{'p50':>10}{'p90':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+    rows = [('전체', report['latency_ms']['overall'])] + sorted(report['latency_ms']['by_action'].items())
+    for action, summary in rows:
+        print(f"{action:<10}{summary['count']:>6}" + ''.join(
+            f"{summary[key]:>10.1f}" if summary[key] is not None else f"{'-':>10}"
+            for key in ('p50', 'p90', 'p95', 'p99', 'max')
+        ))
+    memory = report['memory']
+    print(f"\nRSS {memory['rss_before_mb']}MB → {memory['rss_after_mb']}MB (세션당 {memory['rss_per_session_mb']}MB)")
+    print("저장소 호출: " + (", ".join(f"{name}={value}" for name, value in report['storage_calls'].items()) or "없음"))
+    if report['errors']:
+        print(f"\n오류 {len(report['errors'])}건:")
+        for error in report['errors'][:10]:
+            print(f"  {error}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.load_test', description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=5, help="세션 수")
+    parser.add_argument('--rows', type=int, default=1000, help="미리 저장해 둘 합성 키워드 행 수")
+    parser.add_argument('--blank-rows', type=int, default=0, help="가짜 구글시트 데이터 사이에 끼워 둘 빈 행 수")
+    parser.add_argument('--backend', choices=['fake_gsheets', 'sqlite'], default='fake_gsheets')
+    parser.add_argument('--latency', type=float, default=0.0, help="가짜 구글시트 호출당 지연(초)")
+    parser.add_argument('--rate-limit', type=int, default=0, help="가짜 구글시트 분당 허용 호출 수 (0이면 제한 없음)")
+    parser.add_argument('--consistency-delay', type=float, default=0.0, help="가짜 구글시트 쓰기가 보이기까지 지연(초)")
+    parser.add_argument('--select', type=int, default=5, help="세션마다 선택해 저장할 키워드 수")
+    parser.add_argument('--page-kb', type=float, default=50, help="붙여넣을 합성 페이지 크기 (KB)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help="결과 JSON 파일")
+    parser.add_argument('--max-p95-ms', type=float, help="전체 재실행 p95 지연 상한 (ms)")
+    parser.add_argument('--max-p99-ms', type=float, help="전체 재실행 p99 지연 상한 (ms)")
+    parser.add_argument('--max-rss-per-session-mb', type=float, help="세션당 RSS 증가 상한 (MB)")
+    parser.add_argument('--max-reads-per-session', type=float, help="세션당 저장소 읽기 횟수 상한")
+    parser.add_argument('--max-errors', type=int, default=0, help="허용할 세션 흐름 오류 수")
+    args = parser.parse_args(argv)
+    
+    report = run_load_test(
+        sessions=args.sessions, rows=args.rows, backend=args.backend, latency=args.latency,
+        rate_limit=args.rate_limit, consistency_delay=args.consistency_delay,
+        select_count=args.select, page_kb=args.page_kb, seed=args.seed, blank_rows=args.blank_rows
+    )
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    
+    violations = check_thresholds(
+        report, max_p95_ms=args.max_p95_ms, max_p99_ms=args.max_p99_ms,
+        max_rss_per_session_mb=args.max_rss_per_session_mb,
+        max_reads_per_session=args.max_reads_per_session, max_errors=args.max_errors
+    )
+    if violations:
+        print("\n기준 초과:\n  " + "\n  ".join(violations))
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""키워드 추출 & 관리 도구의 UI 없는 핵심 기능 모음
+
+Streamlit 없이 스크립트나 워커 프로세스에서 바로 불러 쓸 수 있습니다.
+하위 모듈은 이름을 처음 사용할 때 불러오고, pandas 같은 무거운 의존성은 실제로 필요한 함수 안에서만 불러옵니다.
+
+    from keyword_core import extract_keywords, SQLiteStore
+"""
+
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    'extract_keywords': 'extraction',
+    'dedupe_keywords': 'extraction',
+    'iter_tag_texts': 'extraction',
+    'split_manual_keywords': 'extraction',
+    'filter_new_keywords': 'extraction',
+    'KeywordCollector': 'extraction',
+    'ExtractionProfile': 'profiles',
+    'DEFAULT_PROFILE': 'profiles',
+    'load_profiles': 'profiles',
+    'SHEET_COLUMNS': 'storage',
+    'TOMBSTONE': 'storage',
+    'StorageError': 'storage',
+    'is_transient_error': 'storage',
+    'KeywordStore': 'storage',
+    'GSheetsStore': 'storage',
+    'SQLiteStore': 'storage',
+    'new_keyword_id': 'storage',
+    'new_keyword_rows': 'storage',
+    'usage_changes': 'storage',
+    'to_sheet_value': 'storage',
+    'to_typed_frame': 'frame',
+    'KeywordIndex': 'dedupe',
+    'normalize_keyword': 'dedupe',
+    'NearDuplicateIndex': 'similarity',
+    'find_near_duplicates': 'similarity',
+    'FilterEngine': 'filters',
+    'compile_filters': 'filters',
+    'SearchIndex': 'search',
+    'KeywordStats': 'stats',
+    'METRICS': 'instrumentation',
+    'FakeSheetsConnection': 'fake_sheets',
+    'SheetCache': 'cache',
+    'apply_edits_to_frame': 'cache',
+    'load_with_edits': 'cache',
+    'WriteBehindQueue': 'write_queue',
+    'run_batch': 'batch',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
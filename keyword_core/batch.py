@@ -0,0 +1,291 @@
+"""저장해 둔 HTML 페이지 여러 개에서 한 번에 키워드 추출 (Streamlit 없이 실행)
+
+    python -m keyword_core.batch exports/ -o keywords.csv
+    python -m keyword_core.batch "exports/**/*.html" week32.zip --store sqlite:keywords.db --save --project 8월 2주차
+    python -m keyword_core.batch exports/ --profiles profiles.json --profile auto -o keywords.jsonl
+
+입력은 폴더, glob 패턴, zip 파일, HTML 파일을 섞어 줄 수 있습니다. 파일마다 앱의 키워드 추출과 같은 규칙
+(추출 프로필의 선택자/길이/불용어 규칙, 기존 키워드 제외, 파일당 최대 개수)을 적용하고,
+배치 전체에서 먼저 나온 키워드만 남깁니다. --profiles로 주는 JSON 파일은 secrets.toml의
+[extraction_profiles]와 같은 구조({이름: {selectors, source, min_length, ...}})입니다.
+"""
+
+import argparse
+import csv
+import glob
+import io
+import json
+import os
+import sys
+import zipfile
+
+from keyword_core.dedupe import KeywordIndex, as_keyword_index, normalize_keyword
+from keyword_core.extraction import extract_keywords
+from keyword_core.profiles import load_profiles
+
+HTML_SUFFIXES = ('.html', '.htm')
+
+# 파일 인코딩 후보 (저장한 한국어 페이지는 cp949인 경우가 있음)
+ENCODINGS = ('utf-8-sig', 'cp949')
+
+# 워커 프로세스마다 한 번만 받아 두는 기존 키워드 인덱스와 컴파일된 추출 프로필
+_existing_keywords = KeywordIndex()
+_profiles = None
+
+class BatchSource:
+    """추출할 HTML 하나 (일반 파일 또는 zip 안의 파일)"""
+    
+    __slots__ = ('path', 'member')
+    
+    def __init__(self, path, member=None):
+        self.path = path
+        self.member = member
+    
+    @property
+    def name(self):
+        return f"{self.path}!{self.member}" if self.member else self.path
+    
+    def read_bytes(self):
+        if self.member is None:
+            with open(self.path, 'rb') as f:
+                return f.read()
+        with zipfile.ZipFile(self.path) as zf:
+            return zf.read(self.member)
+
+def _is_html(name):
+    return name.lower().endswith(HTML_SUFFIXES)
+
+def _expand_zip(path):
+    with zipfile.ZipFile(path) as zf:
+        members = sorted(info.filename for info in zf.infolist() if not info.is_dir() and _is_html(info.filename))
+    return [BatchSource(path, member) for member in members]
+
+def _expand_file(path):
+    if zipfile.is_zipfile(path) and path.lower().endswith('.zip'):
+        return _expand_zip(path)
+    return [BatchSource(path)]
+
+def collect_sources(inputs):
+    """폴더 / glob / zip / 파일 입력을 HTML 소스 목록으로 펼침 (입력 순서 유지, 중복 제거)"""
+    sources = []
+    seen = set()
+    
+    for item in inputs:
+        if os.path.isdir(item):
+            paths = []
+            for root, _, files in os.walk(item):
+                paths.extend(os.path.join(root, name) for name in files if _is_html(name) or name.lower().endswith('.zip'))
+            expanded = [source for path in sorted(paths) for source in _expand_file(path)]
+        elif os.path.isfile(item):
+            expanded = _expand_file(item)
+        else:
+            matches = sorted(glob.glob(item, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"입력을 찾을 수 없습니다: {item}")
+            expanded = [source for path in matches if os.path.isfile(path) for source in _expand_file(path)]
+        
+        for source in expanded:
+            if source.name not in seen:
+                seen.add(source.name)
+                sources.append(source)
+    
+    return sources
+
+def decode_html(data):
+    """바이트를 문자열로 (utf-8 우선, 실패하면 cp949, 그래도 안 되면 깨진 글자만 대체)"""
+    for encoding in ENCODINGS:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return data.decode(ENCODINGS[0], errors='replace')
+
+def _init_worker(existing_keywords, profiles):
+    global _existing_keywords, _profiles
+    _existing_keywords = existing_keywords
+    _profiles = profiles
+
+def _extract_source(task):
+    """워커에서 실행: 소스 하나 추출 → (이름, 키워드 목록, 추출 정보, 오류 메시지)"""
+    source, profile, limit = task
+    try:
+        html = decode_html(source.read_bytes())
+        keywords, info = extract_keywords(html, _existing_keywords, profile=profile, limit=limit, profiles=_profiles)
+        return source.name, keywords, info, None
+    except Exception as e:
+        return source.name, [], None, str(e)
+
+def run_batch(sources, existing_keywords=None, workers=None, profile=None, profiles=None, limit=None, on_result=None):
+    """소스들을 프로세스 풀로 나눠 추출하고 배치 전체에서 중복 제거
+    
+    profile은 프로필 이름 또는 'auto'(파일마다 자동 감지), profiles는 load_profiles() 결과입니다.
+    limit이 None이면 프로필의 최대 개수, 0이면 제한 없음.
+    반환값: ([(키워드, 출처 이름)], 요약 정보). on_result(이름, 추출 정보, 오류)는 파일 하나가 끝날 때마다 호출됩니다.
+    """
+    existing_keywords = as_keyword_index(existing_keywords)
+    if profiles is None:
+        profiles = load_profiles()
+    tasks = [(source, profile, limit) for source in sources]
+    workers = workers or os.cpu_count() or 1
+    
+    seen = set()
+    results = []
+    summary = {
+        'files': len(sources),
+        'failed_files': 0,
+        'total_found': 0,
+        'duplicates_removed': 0,
+        'batch_duplicates': 0,
+        'new_keywords': 0
+    }
+    
+    if workers == 1 or len(tasks) <= 1:
+        _init_worker(existing_keywords, profiles)
+        outcomes = map(_extract_source, tasks)
+        executor = None
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(existing_keywords, profiles)
+        )
+        outcomes = executor.map(_extract_source, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+    
+    try:
+        # map은 입력 순서대로 결과를 돌려주므로 먼저 나온 파일의 키워드가 남음
+        for name, keywords, info, error in outcomes:
+            if on_result:
+                on_result(name, info, error)
+            if error:
+                summary['failed_files'] += 1
+                continue
+            
+            summary['total_found'] += info['total_found']
+            summary['duplicates_removed'] += info['duplicates_removed']
+            for keyword in keywords:
+                key = normalize_keyword(keyword)
+                if key in seen:
+                    summary['batch_duplicates'] += 1
+                    continue
+                seen.add(key)
+                results.append((keyword, name))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    summary['new_keywords'] = len(results)
+    return results, summary
+
+def write_results(results, output, fmt=None):
+    """결과를 CSV(엑셀 호환 utf-8-sig) 또는 JSONL로 저장, output이 '-'이면 표준 출력"""
+    if fmt is None:
+        fmt = 'csv' if output.lower().endswith('.csv') else 'jsonl'
+    
+    if output == '-':
+        stream = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='', write_through=True)
+        close = False
+    else:
+        stream = open(output, 'w', encoding='utf-8-sig' if fmt == 'csv' else 'utf-8', newline='')
+        close = True
+    
+    try:
+        if fmt == 'csv':
+            writer = csv.writer(stream)
+            writer.writerow(['키워드', '출처'])
+            writer.writerows(results)
+        else:
+            for keyword, source_name in results:
+                stream.write(json.dumps({'키워드': keyword, '출처': source_name}, ensure_ascii=False) + '\n')
+    finally:
+        if close:
+            stream.close()
+        else:
+            stream.flush()
+            stream.detach()
+
+def open_store(spec):
+    """--store 값으로 저장소 열기: 'sqlite:경로', 'fake:경로'(로컬 가짜 구글시트) 또는 'gsheets' (.streamlit/secrets.toml 사용)"""
+    from keyword_core.storage import GSheetsStore, SQLiteStore
+    
+    if spec.startswith('sqlite:'):
+        return SQLiteStore(spec[len('sqlite:'):] or 'keywords.db')
+    if spec.startswith('fake:'):
+        from keyword_core.fake_sheets import FakeSheetsConnection
+        return GSheetsStore(FakeSheetsConnection(spec[len('fake:'):] or 'fake_sheets.json', worksheets={'키워드관리': []}))
+    if spec == 'gsheets':
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        return GSheetsStore(st.connection("gsheets", type=GSheetsConnection))
+    raise ValueError(f"알 수 없는 저장소: {spec} (sqlite:경로, fake:경로 또는 gsheets)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m keyword_core.batch',
+        description="HTML 페이지 여러 개에서 키워드를 한 번에 추출합니다."
+    )
+    parser.add_argument('inputs', nargs='+', help="HTML 파일, 폴더, glob 패턴 또는 zip 파일")
+    parser.add_argument('-o', '--output', help="결과 파일 (.csv 또는 .jsonl, '-'는 표준 출력)")
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help="출력 형식 (기본: 확장자로 판단)")
+    parser.add_argument('--store', help="기존 키워드를 읽을 저장소: sqlite:경로, fake:경로 또는 gsheets")
+    parser.add_argument('--save', action='store_true', help="추출한 키워드를 --store 저장소에 바로 저장")
+    parser.add_argument('--project', default='', help="저장할 때 사용할 프로젝트명")
+    parser.add_argument('--workers', type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--profile', default='default', help="추출 프로필 이름 또는 auto (파일마다 자동 감지)")
+    parser.add_argument('--profiles', help="추가 추출 프로필 JSON 파일")
+    parser.add_argument('--limit', type=int, default=None, help="파일당 최대 키워드 수 (기본: 프로필 설정, 0이면 제한 없음)")
+    args = parser.parse_args(argv)
+    
+    if args.save and not args.store:
+        parser.error("--save에는 --store가 필요합니다")
+    if not args.output and not args.save:
+        args.output = '-'
+    
+    try:
+        sources = collect_sources(args.inputs)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    if not sources:
+        parser.error("추출할 HTML 파일이 없습니다")
+    
+    try:
+        profile_config = None
+        if args.profiles:
+            with open(args.profiles, encoding='utf-8') as f:
+                profile_config = json.load(f)
+        profiles = load_profiles(profile_config)
+    except (OSError, ValueError) as e:
+        parser.error(f"추출 프로필 오류: {e}")
+    if args.profile != 'auto' and args.profile not in profiles:
+        parser.error(f"알 수 없는 추출 프로필: {args.profile} (사용 가능: {', '.join(profiles)}, auto)")
+    
+    store = open_store(args.store) if args.store else None
+    existing_keywords = KeywordIndex.from_frame(store.load()) if store else KeywordIndex()
+    
+    def report(name, info, error):
+        if error:
+            print(f"❌ {name}: {error}", file=sys.stderr)
+        else:
+            print(f"✅ {name}: {info['new_keywords']}개 ({info['profile']})", file=sys.stderr)
+    
+    results, summary = run_batch(
+        sources, existing_keywords, workers=args.workers, profile=args.profile, profiles=profiles,
+        limit=args.limit, on_result=report
+    )
+    
+    if args.output:
+        write_results(results, args.output, args.format)
+    if args.save and results:
+        from keyword_core.storage import new_keyword_rows
+        store.append(new_keyword_rows(args.project, [keyword for keyword, _ in results]))
+    
+    print(
+        f"파일 {summary['files']}개 (실패 {summary['failed_files']}), 발견 {summary['total_found']}개, "
+        f"기존 중복 {summary['duplicates_removed']}개, 배치 내 중복 {summary['batch_duplicates']}개, "
+        f"새 키워드 {summary['new_keywords']}개" + (" 저장 완료" if args.save and results else ""),
+        file=sys.stderr
+    )
+    return 1 if summary['failed_files'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""여러 세션이 함께 쓰는 키워드 DataFrame 캐시"""
+
+import threading
+import time
+from collections import deque
+
+from keyword_core.dedupe import KeywordIndex
+from keyword_core.frame import concat_typed, set_typed_value, to_typed_frame
+from keyword_core.search import SEARCH_COLUMNS, SearchIndex
+from keyword_core.similarity import NearDuplicateIndex
+from keyword_core.stats import STATS_COLUMNS, KeywordStats
+from keyword_core.storage import TOMBSTONE
+
+class SheetCache:
+    """모든 세션이 공유하는 키워드 DataFrame 캐시
+    
+    한 번 읽은 데이터를 ttl(초) 동안 재사용합니다. 앱에서 한 저장/수정/삭제는 add_rows/apply_changes/discard로
+    캐시에 바로 반영하므로(read-your-writes) 쓰고 나서 시트를 다시 읽을 필요가 없습니다.
+    변경마다 version이 올라가고 최근 변경 기록(changes_since)이 남으므로, 다른 세션은 버전만 비교해서
+    다시 읽지 않고도 바뀐 내용을 알아챌 수 있습니다. 쓰기 함수의 origin에는 쓴 세션을 넘깁니다.
+    반환된 DataFrame은 여러 세션이 함께 보므로 읽기 전용으로 사용해야 합니다.
+    읽은 데이터는 바로 타입 변환된 표(keyword_core.frame)로 바꿔 보관하므로 상태는 bool, 날짜는 datetime입니다.
+    keyword_index(중복 검사 인덱스)와 stats(상태 조합별 행 수)는 읽을 때 한 번 만들고 이후 추가/수정/삭제는 해당 행만 반영합니다.
+    유사 키워드 인덱스와 통합 검색 색인은 만드는 비용이 커서 처음 부를 때(near_duplicate_index(), search_index()) 만듭니다.
+    """
+    
+    def __init__(self, ttl, history=200):
+        self.ttl = ttl
+        self.version = 0
+        self.tombstone_count = 0
+        self._df = None
+        self._row_index = {}
+        # 새로 추가하는 행에 붙일 다음 인덱스 라벨 (삭제로 줄지 않으므로 지운 행의 라벨을 다시 쓰지 않음)
+        self._next_label = 0
+        self.keyword_index = KeywordIndex()
+        self.stats = KeywordStats()
+        self._near_duplicate_index = None
+        self._search_index = None
+        self._loaded_at = 0.0
+        self._refreshing = False
+        self._changes = deque(maxlen=history)
+        self._lock = threading.Lock()
+    
+    def get(self, loader, force=False, background=False):
+        """캐시된 DataFrame 반환 (없거나 오래됐으면 loader로 한 번만 다시 읽음)
+        
+        background=True면 오래된 데이터는 일단 그대로 돌려주고 백그라운드 스레드에서 다시 읽어 맞춥니다.
+        다시 읽는 동안 앱에서 쓰기가 있었으면(버전 변경) 읽은 결과를 버리고 이미 반영된 캐시를 유지합니다.
+        """
+        with self._lock:
+            expired = time.monotonic() - self._loaded_at > self.ttl
+            if force or self._df is None or (expired and not background):
+                self._install(self._build(loader()))
+            elif expired and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh, args=(loader, self.version), daemon=True).start()
+            return self._df
+    
+    def _refresh(self, loader, version):
+        """백그라운드 다시 읽기 (쓰기 경합 시 결과 폐기, 실패하면 ttl 뒤에 다시 시도)"""
+        try:
+            state = self._build(loader())
+        except Exception:
+            state = None
+        with self._lock:
+            self._refreshing = False
+            if state is not None and self.version == version:
+                self._install(state)
+            else:
+                self._loaded_at = time.monotonic()
+    
+    @staticmethod
+    def _build(raw_df):
+        """읽은 데이터 → 캐시에 넣을 표와 인덱스 (잠금 밖에서도 호출 가능)"""
+        df = to_typed_frame(raw_df)
+        return df, build_row_index(df), KeywordIndex.from_frame(df), KeywordStats.from_frame(df)
+    
+    def _install(self, state):
+        """_build 결과로 캐시 교체 (잠금 안에서 호출)"""
+        self._df, self._row_index, self.keyword_index, self.stats = state
+        self._next_label = int(self._df.index.max()) + 1 if len(self._df) else 0
+        self._near_duplicate_index = None
+        self._search_index = None
+        self.tombstone_count = self._df.attrs.get('tombstone_count', 0)
+        self._loaded_at = time.monotonic()
+        self._bump('reload', len(self._df))
+    
+    def _bump(self, kind, count, origin=None):
+        """버전을 올리고 변경 기록 남기기 (잠금 안에서 호출)"""
+        self.version += 1
+        self._changes.append((self.version, kind, count, origin))
+    
+    def changes_since(self, version, exclude_origin=None):
+        """version 이후의 변경 기록 [(버전, 종류, 행 수, origin)] (기록이 잘려 알 수 없으면 None)
+        
+        종류는 'add', 'update', 'delete', 'reload', 'invalidate'이며 exclude_origin이 쓴 변경은 뺍니다.
+        """
+        with self._lock:
+            if version >= self.version:
+                return []
+            if not self._changes or self._changes[0][0] > version + 1:
+                return None
+            return [change for change in self._changes if change[0] > version and (exclude_origin is None or change[3] != exclude_origin)]
+    
+    def apply_changes(self, row_id, changes, origin=None):
+        """우리 쪽 수정을 다시 읽지 않고 캐시에 바로 반영 (삭제 표시는 discard)"""
+        if changes.get('삭제여부') == TOMBSTONE:
+            self.discard(row_id, origin)
+            return
+        with self._lock:
+            label = self._row_index.get(row_id)
+            if self._df is not None and label in self._df.index:
+                old_row = self._stats_row(label)
+                for column, value in changes.items():
+                    set_typed_value(self._df, label, column, value)
+                self.stats.update(old_row, self._stats_row(label))
+                if '키워드' in changes:
+                    for index in self._keyword_indexes():
+                        index.discard(row_id)
+                        index.add(changes['키워드'], row_id)
+                if self._search_index is not None and any(column in changes for column in SEARCH_COLUMNS):
+                    self._search_index.add(label, self._search_values(label))
+                self._bump('update', 1, origin)
+    
+    def add_rows(self, rows, origin=None):
+        """새로 저장한 행을 다시 읽지 않고 캐시와 중복 검사 인덱스에 바로 추가"""
+        import pandas as pd
+        
+        with self._lock:
+            if self._df is None or not rows:
+                return
+            start = self._next_label
+            self._next_label += len(rows)
+            new_df = to_typed_frame(pd.DataFrame(rows, index=range(start, start + len(rows))))
+            self._df = concat_typed(self._df, new_df)
+            for label, row in zip(new_df.index, rows):
+                self._row_index[row['ID']] = label
+                for index in self._keyword_indexes():
+                    index.add(row['키워드'], row['ID'])
+                self.stats.add(row)
+                if self._search_index is not None:
+                    self._search_index.add(label, [row.get(column) for column in SEARCH_COLUMNS])
+            self._bump('add', len(rows), origin)
+    
+    def discard(self, row_id, origin=None):
+        """삭제 표시한 행을 다시 읽지 않고 캐시에서만 제거 (같은 행을 두 번 지워도 한 번만 반영)"""
+        with self._lock:
+            label = self._row_index.pop(row_id, None)
+            if self._df is not None and label in self._df.index:
+                self.stats.remove(self._stats_row(label))
+                self._df = self._df.drop(index=label)
+                for index in self._keyword_indexes():
+                    index.discard(row_id)
+                if self._search_index is not None:
+                    self._search_index.discard(label)
+                self.tombstone_count += 1
+                self._bump('delete', 1, origin)
+    
+    def mark_compacted(self):
+        """저장소의 삭제 표시 행을 정리한 뒤 호출 (캐시에서는 이미 빠진 행들이므로 정리 대기 수만 비움)"""
+        with self._lock:
+            self.tombstone_count = 0
+    
+    def invalidate(self):
+        """다음 조회 시 시트를 다시 읽도록 캐시 무효화"""
+        with self._lock:
+            self._df = None
+            self._row_index = {}
+            self.keyword_index = KeywordIndex()
+            self.stats = KeywordStats()
+            self._near_duplicate_index = None
+            self._search_index = None
+            self._bump('invalidate', 0)
+    
+    def near_duplicate_index(self):
+        """유사 키워드 인덱스 (처음 부를 때 캐시된 데이터로 만들고 이후에는 추가/삭제만 반영), 데이터가 없으면 None"""
+        with self._lock:
+            if self._near_duplicate_index is None and self._df is not None:
+                self._near_duplicate_index = NearDuplicateIndex.from_frame(self._df)
+            return self._near_duplicate_index
+    
+    def search_index(self):
+        """통합 검색 색인 (처음 부를 때 캐시된 데이터로 만들고 이후에는 추가/수정/삭제만 반영), 데이터가 없으면 None"""
+        with self._lock:
+            if self._search_index is None and self._df is not None:
+                self._search_index = SearchIndex.from_frame(self._df)
+            return self._search_index
+    
+    def _stats_row(self, label):
+        """집계에 쓰는 행의 현재 값 (잠금 안에서 호출)"""
+        return {column: self._df.at[label, column] for column in STATS_COLUMNS if column in self._df.columns}
+    
+    def _search_values(self, label):
+        """검색 색인에 넣을 행의 현재 값 (잠금 안에서 호출)"""
+        return [self._df.at[label, column] if column in self._df.columns else None for column in SEARCH_COLUMNS]
+    
+    def _keyword_indexes(self):
+        """행 추가/삭제를 반영할 키워드 인덱스들 (잠금 안에서 호출)"""
+        if self._near_duplicate_index is None:
+            return [self.keyword_index]
+        return [self.keyword_index, self._near_duplicate_index]
+
+def build_row_index(df):
+    """ID → DataFrame 인덱스 해시 인덱스 생성"""
+    if df is None or df.empty or 'ID' not in df.columns:
+        return {}
+    return dict(zip(df['ID'], df.index))
+
+def load_with_edits(load, pending_edits):
+    """load()로 새로 읽은 표에 아직 저장소에 없을 수 있는 수정(pending_edits())을 덮어씀
+    
+    수정은 읽기 전에 먼저 받아 둡니다. 읽는 도중에 쓰기 지연 큐가 반영을 마쳐 큐가 비어도, 읽은 데이터가
+    반영 전의 것이면 그 수정이 되돌아가 보이기 때문입니다. 읽는 동안 새로 들어온 수정은 읽은 뒤에 합칩니다.
+    """
+    edits = pending_edits()
+    df = to_typed_frame(load())
+    for row_id, changes in pending_edits().items():
+        edits.setdefault(row_id, {}).update(changes)
+    return apply_edits_to_frame(df, edits)
+
+def apply_edits_to_frame(df, edits):
+    """{ID: {컬럼: 값}} 수정 사항을 DataFrame에 적용 (삭제 표시된 행은 제외)"""
+    if df.empty or not edits:
+        return df
+    
+    row_index = build_row_index(df)
+    deleted = []
+    for row_id, changes in edits.items():
+        label = row_index.get(row_id)
+        if label is None:
+            continue
+        if changes.get('삭제여부') == TOMBSTONE:
+            deleted.append(label)
+            continue
+        for column, value in changes.items():
+            set_typed_value(df, label, column, value)
+    
+    if deleted:
+        df = df.drop(index=deleted)
+    return df
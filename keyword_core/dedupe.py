@@ -0,0 +1,111 @@
+"""정규화한 키워드 기준 중복 검사
+
+"다이어트 식단" / "다이어트식단" / "ＤＩＥＴ" / "diet"처럼 띄어쓰기, 전각/반각, 대소문자만 다른 키워드를
+같은 키워드로 봅니다. KeywordIndex는 저장된 키워드 전체를 한 번 인덱싱한 뒤 저장/삭제 때마다
+해당 키워드만 더하고 빼므로, 화면을 다시 그릴 때마다 전체 목록으로 집합을 새로 만들 필요가 없습니다.
+"""
+
+import math
+import threading
+import unicodedata
+
+def normalize_keyword(keyword):
+    """중복 검사용 키 (NFKC 정규화 → 대소문자 통일 → 모든 공백 제거)"""
+    text = unicodedata.normalize('NFKC', keyword)
+    text = unicodedata.normalize('NFKC', text.casefold())
+    return ''.join(text.split())
+
+def keyword_text(value):
+    """시트에서 읽은 키워드 칸 값을 문자열로 (빈 칸은 None, 숫자로 읽힌 키워드는 원래 표기로)"""
+    if value is None:
+        return None
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            value = int(value)
+    text = str(value).strip()
+    return text or None
+
+class KeywordIndex:
+    """정규화 키 → 저장된 키워드 인덱스 (키워드 in index로 중복 검사)
+    
+    같은 정규화 키를 가진 행이 여러 개일 수 있으므로 키마다 행 수를 세고, 행 ID로 개별 삭제를 반영합니다.
+    여러 세션이 함께 쓰므로 변경은 잠금 안에서 합니다.
+    """
+    
+    def __init__(self, keywords=()):
+        self._counts = {}
+        self._originals = {}
+        self._keys_by_id = {}
+        self._lock = threading.Lock()
+        for keyword in keywords:
+            self.add(keyword)
+    
+    @classmethod
+    def from_frame(cls, df):
+        """저장소 DataFrame(키워드, ID 컬럼)으로 인덱스 만들기"""
+        index = cls()
+        if df is None or df.empty or '키워드' not in df.columns:
+            return index
+        row_ids = df['ID'] if 'ID' in df.columns else [None] * len(df)
+        for row_id, keyword in zip(row_ids, df['키워드']):
+            index.add(keyword, row_id)
+        return index
+    
+    def __getstate__(self):
+        # 워커 프로세스로 보낼 때 잠금은 빼고 보냄
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def __contains__(self, keyword):
+        text = keyword_text(keyword)
+        return text is not None and normalize_keyword(text) in self._counts
+    
+    def __len__(self):
+        return len(self._counts)
+    
+    def match(self, keyword):
+        """keyword와 중복으로 보는 저장된 키워드 (없으면 None)"""
+        text = keyword_text(keyword)
+        if text is None:
+            return None
+        return self._originals.get(normalize_keyword(text))
+    
+    def add(self, keyword, row_id=None):
+        """저장된 키워드 하나 추가"""
+        text = keyword_text(keyword)
+        if text is None:
+            return
+        key = normalize_keyword(text)
+        with self._lock:
+            if row_id is not None:
+                if row_id in self._keys_by_id:
+                    return
+                self._keys_by_id[row_id] = key
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._originals.setdefault(key, text)
+    
+    def discard(self, row_id):
+        """행 ID로 키워드 하나 제거 (같은 키의 다른 행이 남아 있으면 인덱스에는 계속 남음)"""
+        with self._lock:
+            key = self._keys_by_id.pop(row_id, None)
+            if key is None:
+                return
+            remaining = self._counts.get(key, 0) - 1
+            if remaining > 0:
+                self._counts[key] = remaining
+            else:
+                self._counts.pop(key, None)
+                self._originals.pop(key, None)
+
+def as_keyword_index(existing_keywords):
+    """기존 키워드 인자(None, 집합, 목록, KeywordIndex)를 KeywordIndex로"""
+    if isinstance(existing_keywords, KeywordIndex):
+        return existing_keywords
+    return KeywordIndex(existing_keywords or ())
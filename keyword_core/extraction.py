@@ -0,0 +1,321 @@
+"""HTML 키워드 추출 엔진
+
+문서 전체 트리를 만들지 않고 html.parser 이벤트를 따라가며 추출 프로필의 선택자에 맞는 요소만 모읍니다.
+기본 프로필의 결과는 BeautifulSoup(html, 'html.parser').select(...)와 tag.get_text(strip=True)를
+쓰던 기존 방식과 같습니다. 여러 프로필을 한 번에 넘기면 문서를 한 번만 읽으면서 모두 평가합니다.
+"""
+
+from html.parser import HTMLParser
+
+from keyword_core.dedupe import as_keyword_index, normalize_keyword
+from keyword_core.profiles import AUTO_PROFILE, DEFAULT_PROFILE, load_profiles
+
+# 한 번에 파서에 넣는 문자 수
+CHUNK_SIZE = 64 * 1024
+
+# 닫는 태그 없이 끝나는 요소 (BeautifulSoup html.parser 빌더와 동일)
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr',
+    'image', 'img', 'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid',
+    'param', 'source', 'spacer', 'track', 'wbr'
+])
+
+# 안의 글자를 별도 종류로 취급하는 요소 (BeautifulSoup의 string container)
+# 이 요소 안의 글자는 일반 요소의 get_text()에 포함되지 않고, 같은 이름의 요소에서만 보입니다.
+STRING_CONTAINERS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+_EMPTY_CLASSES = frozenset()
+
+class _Capture:
+    """수집 중인 요소 하나 (열린 위치, 모을 글자 종류, 프로필, 지금까지 모은 텍스트)"""
+    
+    __slots__ = ('depth', 'kind', 'profile', 'slot', 'parts')
+    
+    def __init__(self, depth, kind, profile, slot):
+        self.depth = depth
+        self.kind = kind
+        self.profile = profile
+        self.slot = slot
+        self.parts = []
+
+class KeywordTagParser(HTMLParser):
+    """추출 프로필의 선택자에 맞는 요소의 값만 모으는 스트리밍 파서
+    
+    열린 태그 이름 스택만 유지하고, 매칭된 요소가 열려 있는 동안에만 텍스트를 보관합니다.
+    닫는 태그 처리는 BeautifulSoup처럼 같은 이름의 가장 가까운 열린 태그까지 닫고,
+    열린 적 없는 닫는 태그는 무시합니다. 값이 정해지면 문서 순서대로 프로필별 sinks[i](값)을 호출합니다.
+    """
+    
+    def __init__(self, profiles, sinks):
+        super().__init__(convert_charrefs=True)
+        self.profiles = list(profiles)
+        self._sinks = list(sinks)
+        self._slots = [[] for _ in self.profiles]
+        self._first_slot = [0] * len(self.profiles)
+        self._class_only = all(profile._class_only for profile in self.profiles)
+        self._stack = []
+        self._containers = []
+        self._captures = []
+        self._text = []
+        self._closed_voids = {}
+    
+    def _end_text(self, plain=False):
+        """이어진 텍스트 한 덩어리를 마무리해 열린 요소들에 추가 (get_text(strip=True) 규칙)"""
+        if not self._text:
+            return
+        text = ''.join(self._text).strip()
+        self._text = []
+        if not text:
+            return
+        kind = None
+        if self._containers and not plain:
+            kind = self._stack[self._containers[-1]]
+        for capture in self._captures:
+            if capture.kind == kind:
+                capture.parts.append(text)
+    
+    def _reserve(self, index):
+        """프로필 index의 다음 결과 자리 (문서 순서 = 여는 태그 순서)"""
+        slots = self._slots[index]
+        slots.append(None)
+        return self._first_slot[index] + len(slots) - 1
+    
+    def _resolve(self, index, slot, value):
+        """결과 자리에 값을 채우고, 앞쪽부터 값이 정해진 만큼 sink로 내보냄"""
+        slots = self._slots[index]
+        position = slot - self._first_slot[index]
+        slots[position] = value
+        if position:
+            return
+        
+        count = 0
+        while count < len(slots) and slots[count] is not None:
+            count += 1
+        sink = self._sinks[index]
+        for ready in slots[:count]:
+            sink(ready)
+        del slots[:count]
+        self._first_slot[index] += count
+    
+    def _pop_to(self, depth):
+        """스택을 depth 길이까지 닫고 그 안에서 열린 요소 수집 완료"""
+        del self._stack[depth:]
+        while self._containers and self._containers[-1] >= depth:
+            self._containers.pop()
+        
+        while self._captures and self._captures[-1].depth >= depth:
+            capture = self._captures.pop()
+            self._resolve(capture.profile, capture.slot, ''.join(capture.parts))
+    
+    def handle_starttag(self, tag, attrs, self_closing=False):
+        self._end_text()
+        
+        if attrs or not self._class_only:
+            # 같은 속성이 여러 번 나오면 마지막 값 사용
+            attr_values = {name: value or '' for name, value in attrs}
+            class_value = attr_values.get('class')
+            class_tokens = frozenset(class_value.split()) if class_value else _EMPTY_CLASSES
+            
+            for index, profile in enumerate(self.profiles):
+                if not profile.matches(tag, attr_values, class_tokens):
+                    continue
+                slot = self._reserve(index)
+                if profile.source == 'text':
+                    kind = tag if tag in STRING_CONTAINERS else None
+                    self._captures.append(_Capture(len(self._stack), kind, index, slot))
+                else:
+                    self._resolve(index, slot, attr_values.get(profile.source, '').strip())
+        
+        if tag in STRING_CONTAINERS:
+            self._containers.append(len(self._stack))
+        self._stack.append(tag)
+        if self_closing or tag in VOID_ELEMENTS:
+            self._pop_to(len(self._stack) - 1)
+            if not self_closing:
+                # 뒤에 나올 수 있는 </br> 같은 닫는 태그는 무시
+                self._closed_voids[tag] = self._closed_voids.get(tag, 0) + 1
+    
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, self_closing=True)
+    
+    def handle_endtag(self, tag):
+        if self._closed_voids.get(tag):
+            self._closed_voids[tag] -= 1
+            return
+        self._end_text()
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth] == tag:
+                self._pop_to(depth)
+                break
+    
+    def handle_data(self, data):
+        if self._captures:
+            self._text.append(data)
+    
+    def handle_comment(self, data):
+        self._end_text()
+    
+    def handle_decl(self, decl):
+        self._end_text()
+    
+    def handle_pi(self, data):
+        self._end_text()
+    
+    def unknown_decl(self, data):
+        self._end_text()
+        # CDATA 구간은 일반 텍스트로 취급
+        if data.upper().startswith('CDATA[') and self._captures:
+            self._text.append(data[len('CDATA['):])
+            self._end_text(plain=True)
+    
+    def close(self):
+        super().close()
+        self._end_text()
+        self._pop_to(0)
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE):
+    """문자열 또는 텍스트 파일 객체를 chunk_size 글자씩 나눠 돌려줌"""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+    
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def scan_document(source, profiles, sinks):
+    """문서를 한 번 읽으면서 모든 프로필의 값을 각 sink로 보냄"""
+    parser = KeywordTagParser(profiles, sinks)
+    for chunk in iter_chunks(source):
+        parser.feed(chunk)
+    parser.close()
+
+def iter_tag_texts(source, profile=DEFAULT_PROFILE):
+    """프로필 선택자에 맞는 요소마다 값(기본은 get_text(strip=True))을 문서 순서대로 생성 (빈 문자열 포함)"""
+    ready = []
+    parser = KeywordTagParser([profile], [ready.append])
+    for chunk in iter_chunks(source):
+        parser.feed(chunk)
+        yield from ready
+        ready.clear()
+    parser.close()
+    yield from ready
+
+class KeywordCollector:
+    """프로필 규칙과 중복 제거를 적용하며 추출 값을 하나씩 받는 수집기
+    
+    규칙(길이/불용어)에 맞지 않는 값과 같은 추출 안의 중복은 조용히 빼고,
+    existing_keywords에 있는 키워드는 duplicates_removed로 셉니다.
+    중복은 정규화한 키워드(normalize_keyword) 기준이며 처음 나온 표기를 남깁니다.
+    """
+    
+    def __init__(self, profile=DEFAULT_PROFILE, existing_keywords=None, limit=None):
+        self.profile = profile
+        self.existing_keywords = as_keyword_index(existing_keywords)
+        if limit is None:
+            limit = profile.limit
+        self.limit = limit or None
+        self.total_found = 0
+        self.valid_count = 0
+        self.duplicate_count = 0
+        self.new_count = 0
+        self.keywords = []
+        self._seen = set()
+    
+    def add(self, text):
+        self.total_found += 1
+        if not self.profile.accepts(text):
+            return
+        self.valid_count += 1
+        
+        # 기존 키워드와 중복 체크
+        if text in self.existing_keywords:
+            self.duplicate_count += 1
+            return
+        
+        # 이번 추출에서 중복 체크
+        key = normalize_keyword(text)
+        if key not in self._seen:
+            self._seen.add(key)
+            self.new_count += 1
+            if self.limit is None or len(self.keywords) < self.limit:
+                self.keywords.append(text)
+    
+    def result(self):
+        """(키워드 목록, 추출 정보)"""
+        info = {
+            'total_found': self.total_found,
+            'duplicates_removed': self.duplicate_count,
+            'new_keywords': self.new_count,
+            'profile': self.profile.name
+        }
+        return list(self.keywords), info
+
+def dedupe_keywords(texts, existing_keywords=None, profile=DEFAULT_PROFILE, limit=None):
+    """추출한 텍스트 정리 → (키워드 목록, 추출 정보)"""
+    collector = KeywordCollector(profile, existing_keywords, limit)
+    for text in texts:
+        collector.add(text)
+    return collector.result()
+
+def resolve_profiles(profile=None, profiles=None):
+    """profile 인자(이름, 프로필 객체, 'auto', 프로필 목록)를 평가할 프로필 목록으로 변환"""
+    if profile is None:
+        return [DEFAULT_PROFILE]
+    if isinstance(profile, (list, tuple)):
+        return list(profile)
+    if not isinstance(profile, str):
+        return [profile]
+    
+    if profiles is None:
+        profiles = load_profiles()
+    if profile == AUTO_PROFILE:
+        return list(profiles.values())
+    if profile not in profiles:
+        raise ValueError(f"알 수 없는 추출 프로필: {profile} (사용 가능: {', '.join(profiles)})")
+    return [profiles[profile]]
+
+def extract_keywords(source, existing_keywords=None, profile=None, limit=None, profiles=None):
+    """HTML(문자열 또는 텍스트 파일 객체)에서 키워드 추출 → (키워드 목록, 추출 정보)
+    
+    profile에 'auto'나 프로필 목록을 주면 문서를 한 번만 읽으며 모든 후보를 평가하고,
+    규칙을 통과한 값이 가장 많은 프로필(같으면 앞쪽)의 결과를 돌려줍니다. 추출 정보의 'profile'에 선택된 이름이 들어갑니다.
+    limit이 None이면 프로필의 최대 개수를, 0이면 제한 없이 사용합니다.
+    """
+    candidates = resolve_profiles(profile, profiles)
+    existing_keywords = as_keyword_index(existing_keywords)
+    collectors = [KeywordCollector(candidate, existing_keywords, limit) for candidate in candidates]
+    scan_document(source, candidates, [collector.add for collector in collectors])
+    
+    best = max(collectors, key=lambda collector: collector.valid_count) if len(collectors) > 1 else collectors[0]
+    return best.result()
+
+def split_manual_keywords(text, min_length=1):
+    """쉼표로 구분한 직접 입력 키워드 목록 (앞뒤 공백 제거, min_length 미만 제외)"""
+    keywords = (kw.strip() for kw in text.split(','))
+    return [kw for kw in keywords if kw and len(kw) >= min_length]
+
+def filter_new_keywords(keywords, existing_keywords, min_length=2):
+    """직접 입력한 키워드 중 기존 키워드에 없는 것만 → (새 키워드 목록, 기존 중복 수)
+    
+    기존 키워드 비교와 입력 안의 중복 제거 모두 정규화한 키워드 기준입니다.
+    """
+    existing_keywords = as_keyword_index(existing_keywords)
+    new_keywords = []
+    duplicate_count = 0
+    seen = set()
+    
+    for keyword in keywords:
+        if len(keyword) >= min_length:  # 최소 2글자 이상
+            if keyword in existing_keywords:
+                duplicate_count += 1
+                continue
+            key = normalize_keyword(keyword)
+            if key not in seen:
+                seen.add(key)
+                new_keywords.append(keyword)
+    
+    return new_keywords, duplicate_count
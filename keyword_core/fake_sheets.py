@@ -0,0 +1,409 @@
+"""구글시트 연결(streamlit-gsheets GSheetsConnection)을 대신하는 로컬 가짜 연결
+
+GSheetsStore가 쓰는 연결 API만 흉내 냅니다.
+- conn.read(worksheet=..., ttl=...) / conn.update(worksheet=..., data=...): 시트 전체 읽기/쓰기
+- conn.client._select_worksheet(worksheet=...): gspread 워크시트 (row_values, col_values, batch_get, find, update,
+  append_rows, batch_update, add_cols, col_count, delete_rows)
+
+시트는 메모리에 두고, path를 주면 JSON 파일에 저장해 프로세스를 다시 띄워도 이어 씁니다.
+네트워크 없이 앱의 읽기/쓰기 패턴을 재현할 수 있도록 다음을 흉내 냅니다.
+- latency: 호출마다 걸리는 시간(초) (메서드별 {이름: 초}도 가능) + row_latency × 주고받은 행 수 + jitter
+- rate_limit / rate_window: 구간 안 호출 수가 넘으면 429 RateLimitError (구글시트 기본 할당량은 분당 60회)
+- error_rate: 무작위 429 비율 (seed로 재현 가능), fail_next(n): 다음 n번 호출을 확실히 실패시킴
+- consistency_delay: 쓰기가 읽기에 보이기까지 걸리는 시간(초)
+
+    conn = FakeSheetsConnection('fake_sheets.json', latency=0.3, rate_limit=60, consistency_delay=2)
+    store = GSheetsStore(conn)
+
+시계(clock)와 대기(sleep) 함수를 바꿔 끼우면 실제로 기다리지 않고도 같은 순서를 재현할 수 있습니다.
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+
+# 새 워크시트의 기본 열 수 (구글시트 기본값)
+DEFAULT_COL_COUNT = 26
+
+_A1_RE = re.compile(r'^([A-Za-z]+)(\d+)$')
+
+# 헤더가 빈 열에 pandas가 붙이는 이름
+_UNNAMED_RE = re.compile(r'^Unnamed:\s\d+$')
+
+class FakeSheetsError(Exception):
+    """가짜 구글시트 호출 실패"""
+
+class RateLimitError(FakeSheetsError):
+    """할당량 초과 (구글시트 API의 429 응답)"""
+    
+    code = 429
+
+class WorksheetNotFound(FakeSheetsError):
+    """없는 워크시트"""
+
+class Cell:
+    """find() 결과 셀 (gspread.Cell과 같은 속성)"""
+    
+    def __init__(self, row, col, value):
+        self.row = row
+        self.col = col
+        self.value = value
+    
+    def __repr__(self):
+        return f"<Cell R{self.row}C{self.col} {self.value!r}>"
+
+def _a1_to_rowcol(label):
+    """A1 표기 → (행, 열) 번호 (예: AB3 → 3, 28)"""
+    match = _A1_RE.match(label)
+    if not match:
+        raise FakeSheetsError(f"잘못된 셀 위치: {label}")
+    col = 0
+    for letter in match.group(1).upper():
+        col = col * 26 + ord(letter) - ord('A') + 1
+    return int(match.group(2)), col
+
+def _parse_range(range_name):
+    """'A2:C5' / 'B3' → (시작 행, 시작 열, 끝 행, 끝 열) (끝이 없으면 None)"""
+    start, _, end = range_name.partition(':')
+    start_row, start_col = _a1_to_rowcol(start)
+    if not end:
+        return start_row, start_col, None, None
+    end_row, end_col = _a1_to_rowcol(end)
+    return start_row, start_col, end_row, end_col
+
+def _cell_text(value):
+    """시트에 들어갈 셀 값 (None·NaN은 빈 칸, 나머지는 문자열)"""
+    if value is None or value != value:
+        return ''
+    return str(value)
+
+def _trim(row):
+    """행 끝의 빈 칸 제거 (gspread는 값이 있는 칸까지만 돌려줌)"""
+    end = len(row)
+    while end and row[end - 1] == '':
+        end -= 1
+    return row[:end]
+
+class FakeWorksheet:
+    """가짜 연결의 워크시트 하나 (gspread Worksheet에서 GSheetsStore가 쓰는 메서드만)"""
+    
+    def __init__(self, conn, title):
+        self._conn = conn
+        self.title = title
+    
+    @property
+    def col_count(self):
+        # gspread는 워크시트를 열 때 받은 속성 값을 돌려주므로 API 호출로 세지 않음
+        with self._conn._lock:
+            return max(self._conn._col_counts.get(self.title, DEFAULT_COL_COUNT),
+                       max(map(len, self._conn._grid(self.title)), default=0))
+    
+    @property
+    def row_count(self):
+        with self._conn._lock:
+            return len(self._conn._grid(self.title))
+    
+    def row_values(self, row, **kwargs):
+        def read():
+            grid = self._conn._grid(self.title)
+            return _trim(list(grid[row - 1])) if row <= len(grid) else []
+        return self._conn._call('row_values', 1, read, worksheet=self.title)
+    
+    def col_values(self, col, **kwargs):
+        def read():
+            return _trim([line[col - 1] if len(line) >= col else '' for line in self._conn._grid(self.title)])
+        return self._conn._call('col_values', self.row_count, read, worksheet=self.title)
+    
+    def batch_get(self, ranges, **kwargs):
+        def read():
+            grid = self._conn._grid(self.title)
+            results = []
+            for range_name in ranges:
+                start_row, start_col, end_row, end_col = _parse_range(range_name)
+                end_row = min(end_row or start_row, len(grid))
+                rows = []
+                for line in grid[start_row - 1:end_row]:
+                    rows.append(_trim(line[start_col - 1:end_col or start_col]))
+                # 뒤쪽의 빈 행은 돌려주지 않음
+                while rows and not rows[-1]:
+                    rows.pop()
+                results.append(rows)
+            return results
+        return self._conn._call('batch_get', len(ranges), read, worksheet=self.title)
+    
+    def find(self, query, in_row=None, in_column=None, case_sensitive=True):
+        def search():
+            grid = self._conn._grid(self.title)
+            target = query if case_sensitive else query.lower()
+            for row_number, line in enumerate(grid, start=1):
+                if in_row is not None and row_number != in_row:
+                    continue
+                for col_number, value in enumerate(line, start=1):
+                    if in_column is not None and col_number != in_column:
+                        continue
+                    if (value if case_sensitive else value.lower()) == target:
+                        return Cell(row_number, col_number, value)
+            return None
+        return self._conn._call('find', 1, search, worksheet=self.title)
+    
+    def update(self, values=None, range_name=None, **kwargs):
+        values = [[_cell_text(value) for value in row] for row in values or []]
+        
+        def write(grid):
+            start_row, start_col, _, _ = _parse_range(range_name or 'A1')
+            _write_block(grid, start_row, start_col, values)
+        self._conn._write('update', len(values), self.title, write)
+        return {'updatedRange': range_name, 'updatedRows': len(values)}
+    
+    def append_rows(self, values, value_input_option='RAW', insert_data_option=None, table_range=None, **kwargs):
+        values = [[_cell_text(value) for value in row] for row in values]
+        
+        def write(grid):
+            # 마지막으로 값이 있는 행 다음에 추가
+            while grid and not any(grid[-1]):
+                grid.pop()
+            grid.extend(values)
+        self._conn._write('append_rows', len(values), self.title, write)
+        return {'updates': {'updatedRows': len(values)}}
+    
+    def batch_update(self, data, **kwargs):
+        updates = [
+            (item['range'], [[_cell_text(value) for value in row] for row in item['values']])
+            for item in data
+        ]
+        
+        def write(grid):
+            for range_name, values in updates:
+                start_row, start_col, _, _ = _parse_range(range_name)
+                _write_block(grid, start_row, start_col, values)
+        rows = {range_name.split(':')[0].lstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for range_name, _ in updates}
+        self._conn._write('batch_update', len(rows), self.title, write)
+        return {'totalUpdatedCells': sum(len(row) for _, values in updates for row in values)}
+    
+    def add_cols(self, cols):
+        def write(grid):
+            self._conn._col_counts[self.title] = self._conn._col_counts.get(self.title, DEFAULT_COL_COUNT) + cols
+        self._conn._write('add_cols', 0, self.title, write)
+    
+    def delete_rows(self, start_index, end_index=None):
+        end_index = end_index or start_index
+        
+        def write(grid):
+            del grid[start_index - 1:end_index]
+        self._conn._write('delete_rows', end_index - start_index + 1, self.title, write)
+
+def _write_block(grid, start_row, start_col, values):
+    """grid의 (start_row, start_col)부터 values 블록 덮어쓰기 (모자라는 행/칸은 빈 칸으로 늘림)"""
+    for offset, row in enumerate(values):
+        while len(grid) < start_row + offset:
+            grid.append([])
+        line = grid[start_row + offset - 1]
+        end_col = start_col + len(row) - 1
+        if len(line) < end_col:
+            line.extend([''] * (end_col - len(line)))
+        line[start_col - 1:end_col] = row
+
+class _FakeClient:
+    """conn.client (GSheetsStore는 _select_worksheet만 사용)"""
+    
+    def __init__(self, conn):
+        self._conn = conn
+    
+    def _select_worksheet(self, worksheet=None, **kwargs):
+        title = self._conn._call('open', 0, lambda: self._conn._title(worksheet), worksheet=worksheet)
+        return FakeWorksheet(self._conn, title)
+
+class FakeSheetsConnection:
+    """streamlit-gsheets GSheetsConnection 대용 (메모리/JSON 파일 저장, 지연·할당량·일관성 지연 흉내)
+    
+    worksheets: 처음 넣어 둘 {시트 이름: 셀 값 행 목록} (path 파일이 있으면 파일 내용이 우선)
+    calls에 메서드별 호출 수, rejected에 할당량 초과로 거절한 호출 수가 쌓입니다.
+    """
+    
+    def __init__(self, path=None, worksheets=None, latency=0.0, row_latency=0.0, jitter=0.0,
+                 rate_limit=None, rate_window=60.0, error_rate=0.0, consistency_delay=0.0,
+                 seed=0, clock=time.monotonic, sleep=time.sleep):
+        self.path = path
+        self.latency = latency
+        self.row_latency = row_latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.error_rate = error_rate
+        self.consistency_delay = consistency_delay
+        self.calls = Counter()
+        self.rejected = 0
+        self.client = _FakeClient(self)
+        self._clock = clock
+        self._sleep = sleep
+        self._random = random.Random(seed)
+        self._recent_calls = deque()
+        self._forced_failures = 0
+        self._pending = deque()
+        self._lock = threading.RLock()
+        
+        self._book = {name: [list(map(_cell_text, row)) for row in rows] for name, rows in (worksheets or {}).items()}
+        self._col_counts = {}
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+            self._book = saved.get('worksheets', {})
+            self._col_counts = saved.get('col_counts', {})
+    
+    # ---------------- streamlit-gsheets 연결 API ----------------
+    
+    def read(self, worksheet=None, ttl=None, **options):
+        """시트 전체 → DataFrame (ttl은 무시하고 consistency_delay로 지연을 흉내 냄)
+        
+        실제 연결(gspread_dataframe.get_as_dataframe)과 같게 만듭니다.
+        - 시트 크기(행 수 × col_count)만큼 빈 칸을 채운 값을 TextParser로 읽음 (1행이 컬럼, 숫자 추론, 빈 칸은 NaN,
+          dtype 등 options는 TextParser에 그대로 넘김)
+        - 빈 행은 빼되 인덱스는 다시 매기지 않음 (인덱스 = 시트의 데이터 행 위치, 시트 행 번호 - 2)
+        - 헤더가 비어 있고 값도 없는 열(Unnamed: n)은 뺌
+        - 빈 시트는 pandas.errors.EmptyDataError
+        """
+        from pandas.io.parsers import TextParser
+        
+        def read():
+            title = self._title(worksheet)
+            grid = self._grid(title)
+            width = max(self._col_counts.get(title, DEFAULT_COL_COUNT), max(map(len, grid), default=0))
+            return [list(line) + [''] * (width - len(line)) for line in grid]
+        
+        values = self._call('read', 0, read, worksheet=worksheet)
+        df = TextParser(values, **options).read(None).dropna(how='all', axis=0)
+        empty_unnamed = [label for label in df.columns if _UNNAMED_RE.match(str(label)) and df[label].isna().all()]
+        if empty_unnamed:
+            df = df.drop(columns=empty_unnamed)
+        # 지연은 읽은 행 수까지 반영 (호출 전에는 행 수를 모름)
+        self._wait(self.row_latency * len(df))
+        return df
+    
+    def update(self, worksheet=None, data=None, **kwargs):
+        """DataFrame으로 시트 전체 덮어쓰기 (없는 시트면 새로 만듦)"""
+        values = [list(map(str, data.columns))] + [[_cell_text(value) for value in row] for row in data.itertuples(index=False)]
+        title = worksheet or self._first_title() or 'Sheet1'
+        
+        def write(grid):
+            grid[:] = values
+        self._write('update_sheet', len(values), title, write, create=True)
+        return data
+    
+    # ---------------- 장애/상태 조절 ----------------
+    
+    def fail_next(self, count=1):
+        """다음 count번 호출을 429로 실패시킴"""
+        with self._lock:
+            self._forced_failures += count
+    
+    def flush(self):
+        """아직 보이지 않는 쓰기를 모두 바로 반영"""
+        with self._lock:
+            self._apply_pending(force=True)
+    
+    def worksheet_values(self, worksheet=None):
+        """현재 보이는 시트 셀 값 사본 (호출 수/지연에 포함되지 않음)"""
+        with self._lock:
+            self._apply_pending()
+            return [list(line) for line in self._grid(self._title(worksheet))]
+    
+    def save(self):
+        """path 파일에 시트 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        with self._lock:
+            snapshot = {'worksheets': self._book, 'col_counts': self._col_counts}
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+    
+    # ---------------- 내부 ----------------
+    
+    def _first_title(self):
+        return next(iter(self._book), None)
+    
+    def _title(self, worksheet):
+        """워크시트 이름/번호 → 시트 이름 (None·0은 첫 번째 시트)"""
+        titles = list(self._book)
+        if worksheet is None or worksheet == 0:
+            if not titles:
+                raise WorksheetNotFound("시트가 없습니다")
+            return titles[0]
+        if isinstance(worksheet, int):
+            if worksheet >= len(titles):
+                raise WorksheetNotFound(f"{worksheet}번째 시트가 없습니다")
+            return titles[worksheet]
+        if worksheet not in self._book:
+            raise WorksheetNotFound(f"시트 없음: {worksheet}")
+        return worksheet
+    
+    def _grid(self, title):
+        return self._book[title]
+    
+    def _wait(self, seconds):
+        if seconds > 0:
+            self._sleep(seconds)
+    
+    def _admit(self, method):
+        """호출 수 기록과 할당량/오류 주입 (거절하면 RateLimitError)"""
+        now = self._clock()
+        with self._lock:
+            self.calls[method] += 1
+            if self._forced_failures:
+                self._forced_failures -= 1
+                self.rejected += 1
+                raise RateLimitError(f"APIError: [429]: Quota exceeded ({method}, 강제 실패)")
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.rejected += 1
+                raise RateLimitError(f"APIError: [429]: Quota exceeded ({method}, 무작위 실패)")
+            if self.rate_limit is not None:
+                while self._recent_calls and now - self._recent_calls[0] >= self.rate_window:
+                    self._recent_calls.popleft()
+                if len(self._recent_calls) >= self.rate_limit:
+                    self.rejected += 1
+                    raise RateLimitError(
+                        f"APIError: [429]: Quota exceeded ({self.rate_limit}회/{self.rate_window:g}초)"
+                    )
+                self._recent_calls.append(now)
+            return self._call_latency(method)
+    
+    def _call_latency(self, method):
+        latency = self.latency.get(method, 0.0) if isinstance(self.latency, dict) else self.latency
+        if self.jitter:
+            latency += self._random.uniform(0, self.jitter)
+        return latency
+    
+    def _call(self, method, rows, func, worksheet=None):
+        """읽기 호출 하나 (지연 → 보이는 쓰기 반영 → func 실행)"""
+        latency = self._admit(method)
+        self._wait(latency + self.row_latency * rows)
+        with self._lock:
+            self._apply_pending()
+            return func()
+    
+    def _write(self, method, rows, title, func, create=False):
+        """쓰기 호출 하나 (지연 후 쓰기 예약, consistency_delay가 지나야 읽기에 보임)"""
+        latency = self._admit(method)
+        self._wait(latency + self.row_latency * rows)
+        with self._lock:
+            self._apply_pending()
+            if title not in self._book and not create:
+                raise WorksheetNotFound(f"시트 없음: {title}")
+            self._pending.append((self._clock() + self.consistency_delay, title, func))
+            self._apply_pending()
+    
+    def _apply_pending(self, force=False):
+        """보일 시간이 된 쓰기를 순서대로 반영 (path가 있으면 파일에도 저장)"""
+        applied = False
+        now = self._clock()
+        while self._pending and (force or self._pending[0][0] <= now):
+            _, title, func = self._pending.popleft()
+            func(self._book.setdefault(title, []))
+            applied = True
+        if applied:
+            self.save()
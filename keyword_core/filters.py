@@ -0,0 +1,189 @@
+"""저장된 키워드 관리 화면의 필터 엔진
+
+선택한 필터(검색어, 프로젝트, 사용여부, 티스토리, 블로그스팟, 등록일)를 (종류, 컬럼, 값) 조건 튜플로 컴파일하고,
+조건마다 만든 불리언 마스크를 numpy로 한 번에 AND 한 뒤 결과 DataFrame은 정렬까지 포함해 한 번만 만듭니다.
+조건별 마스크는 데이터 버전이 같은 동안 재사용하므로, 필터 하나만 바꾼 재실행은 바뀐 조건의 마스크만 새로 계산합니다.
+numpy는 마스크를 만드는 함수 안에서만 불러오므로 이 모듈은 가볍게 import됩니다.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+# 선택 상자 값 → 상태 컬럼 조건
+STATUS_FILTERS = {
+    '사용함(✅)': ('사용여부', True),
+    '미사용(❌)': ('사용여부', False),
+}
+WRITTEN_FILTERS = {
+    '작성함(✅)': True,
+    '미작성(❌)': False,
+}
+
+# 등록일 선택 → 오늘을 포함한 일수
+DATE_RANGES = {
+    '오늘': 1,
+    '최근 3일': 3,
+    '최근 일주일': 7,
+    '최근 한달': 30,
+}
+
+# 정렬 선택 → (컬럼, 오름차순 여부)
+SORT_OPTIONS = {
+    '최신순': ('날짜', False),
+    '오래된순': ('날짜', True),
+    '키워드명 순': ('키워드', True),
+    '프로젝트명 순': ('프로젝트명', True),
+}
+
+# 상태 컬럼이 없는 표에서 쓰는 기본값
+_MISSING_STATUS = False
+
+def compile_filters(search_query='', project='전체', usage='전체', tistory='전체', blogspot='전체', date='전체', today=None):
+    """화면의 필터 선택 → 조건 튜플 목록 ('전체'는 조건 없음)
+    
+    상대 날짜는 컴파일할 때 'YYYY-MM-DD' 기준일로 바꾸므로, 같은 날 같은 선택이면 같은 조건이 되어 마스크를 재사용합니다.
+    """
+    conditions = []
+    if search_query:
+        conditions.append(('search', None, search_query))
+    if project != '전체':
+        conditions.append(('eq', '프로젝트명', project))
+    if usage in STATUS_FILTERS:
+        conditions.append(('eq',) + STATUS_FILTERS[usage])
+    if tistory in WRITTEN_FILTERS:
+        conditions.append(('eq', '티스토리작성', WRITTEN_FILTERS[tistory]))
+    if blogspot in WRITTEN_FILTERS:
+        conditions.append(('eq', '블로그스팟작성', WRITTEN_FILTERS[blogspot]))
+    if date in DATE_RANGES:
+        today = today or datetime.now()
+        since = (today - timedelta(days=DATE_RANGES[date] - 1)).strftime('%Y-%m-%d')
+        conditions.append(('since', '날짜', since))
+    return tuple(conditions)
+
+class FilterEngine:
+    """조건별 마스크를 데이터 버전 단위로 캐시하는 필터 엔진
+    
+    여러 세션이 같은 공유 캐시 DataFrame을 보므로 엔진 하나를 함께 씁니다.
+    DataFrame이나 버전이 바뀌면 캐시한 마스크를 모두 버립니다.
+    """
+    
+    def __init__(self, max_masks=64):
+        self.max_masks = max_masks
+        self.hits = 0
+        self.misses = 0
+        self._source = None
+        self._masks = {}
+        self._lock = threading.Lock()
+    
+    def mask(self, df, version, conditions, search_index=None):
+        """조건을 모두 만족하는 행의 불리언 배열 (조건이 없으면 전부 True)"""
+        import numpy as np
+        
+        combined = np.ones(len(df), dtype=bool)
+        for condition in conditions:
+            combined &= self.condition_mask(df, version, condition, search_index)
+        return combined
+    
+    def condition_mask(self, df, version, condition, search_index=None):
+        """조건 하나의 마스크 (같은 데이터 버전이면 캐시에서 반환)"""
+        source = (id(df), version, len(df))
+        with self._lock:
+            if self._source != source:
+                self._source = source
+                self._masks = {}
+            cached = self._masks.get(condition)
+            if cached is not None:
+                self.hits += 1
+                return cached
+        
+        mask = _build_mask(df, condition, search_index)
+        mask.setflags(write=False)
+        with self._lock:
+            self.misses += 1
+            if self._source == source:
+                if len(self._masks) >= self.max_masks:
+                    self._masks.pop(next(iter(self._masks)))
+                self._masks[condition] = mask
+        return mask
+    
+    def apply(self, df, version, conditions, sort_option=None, search_index=None):
+        """필터 + 정렬 결과를 한 번에 만들기 → (결과 DataFrame, 결합 마스크)"""
+        positions, mask = self.positions(df, version, conditions, sort_option, search_index)
+        return df.take(positions), mask
+    
+    def positions(self, df, version, conditions, sort_option=None, search_index=None):
+        """필터 + 정렬 결과의 행 위치 배열 → (위치 배열, 결합 마스크)
+        
+        화면에 보이는 구간만 df.take(위치[시작:끝])로 만들 때 사용합니다.
+        """
+        import numpy as np
+        
+        mask = self.mask(df, version, conditions, search_index)
+        positions = np.flatnonzero(mask)
+        
+        sort = SORT_OPTIONS.get(sort_option)
+        if sort and sort[0] in df.columns and len(positions) > 1:
+            column, ascending = sort
+            keys = df[column].iloc[positions].reset_index(drop=True)
+            order = keys.sort_values(ascending=ascending, kind='stable').index.to_numpy()
+            positions = positions[order]
+        return positions, mask
+    
+    def count(self, df, version, mask, condition):
+        """결합 마스크 중 추가 조건도 만족하는 행 수 (통계용, 결과 DataFrame을 다시 훑지 않음)"""
+        import numpy as np
+        
+        return int(np.count_nonzero(mask & self.condition_mask(df, version, condition)))
+    
+    def summary(self, df, version, mask):
+        """결합 마스크의 통계 (KeywordStats.summary()와 같은 형식)"""
+        import numpy as np
+        
+        used = self.count(df, version, mask, ('eq', '사용여부', True))
+        total = int(np.count_nonzero(mask))
+        return {
+            'total': total,
+            'used': used,
+            'unused': total - used,
+            'tistory': self.count(df, version, mask, ('eq', '티스토리작성', True)),
+            'blogspot': self.count(df, version, mask, ('eq', '블로그스팟작성', True)),
+        }
+
+def stats_query(conditions):
+    """조건이 프로젝트/상태 필터뿐이면 KeywordStats.summary() 인자 (project, {컬럼: 값}), 아니면 None"""
+    project = None
+    statuses = {}
+    for kind, column, value in conditions:
+        if kind != 'eq':
+            return None
+        if column == '프로젝트명':
+            project = value
+        else:
+            statuses[column] = value
+    return project, statuses
+
+def _build_mask(df, condition, search_index=None):
+    """조건 튜플 → 불리언 numpy 배열"""
+    import numpy as np
+    
+    kind, column, value = condition
+    if kind == 'search':
+        if search_index is not None:
+            return df.index.isin(search_index.search(value))
+        mask = np.zeros(len(df), dtype=bool)
+        for name in ('키워드', '프로젝트명', '메모'):
+            if name in df.columns:
+                mask |= df[name].str.contains(value, case=False, na=False, regex=False).to_numpy(dtype=bool)
+        return mask
+    if column not in df.columns:
+        return np.full(len(df), kind == 'eq' and value is _MISSING_STATUS)
+    if kind == 'eq':
+        return (df[column] == value).to_numpy(dtype=bool)
+    if kind == 'since' and df[column].dtype.kind == 'M':
+        # 타입 변환된 표 (NaT는 제외)
+        return (df[column] >= np.datetime64(value)).to_numpy(dtype=bool)
+    if kind == 'since':
+        # 'YYYY-MM-DD ...' 문자열은 사전순 비교가 날짜순과 같음 (빈 값·날짜가 아닌 값은 제외)
+        dates = df[column].astype(str).str.slice(0, 10)
+        return ((dates >= value) & (dates <= '9999-12-31')).to_numpy(dtype=bool)
+    raise ValueError(f"알 수 없는 필터 조건: {kind}")
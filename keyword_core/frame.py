@@ -0,0 +1,109 @@
+"""키워드 표의 메모리용 타입 변환
+
+시트에는 상태가 '✅'/'❌' 문자열, 날짜가 'YYYY-MM-DD HH:MM:SS' 문자열로 저장되지만,
+앱 안에서는 읽자마자 작은 타입의 DataFrame으로 바꿔서 필터·통계가 문자열 비교 없이 동작하게 합니다.
+- 사용여부/티스토리작성/블로그스팟작성: bool
+- 프로젝트명: category
+- 날짜: datetime64 (날짜로 읽을 수 없는 값은 NaT)
+- 키워드/메모/ID: pyarrow가 있으면 Arrow 문자열, 없으면 그대로
+- 삭제여부: 읽을 때 이미 걸러지므로 버림
+
+시트 표기로 되돌리는 일은 저장소(storage.to_sheet_value)가 쓸 때만 합니다.
+"""
+
+from datetime import datetime
+
+from keyword_core.dedupe import keyword_text
+
+# bool로 다루는 상태 컬럼
+STATUS_COLUMNS = ('사용여부', '티스토리작성', '블로그스팟작성')
+
+# 문자열 컬럼 (빈 칸은 빈 문자열)
+TEXT_COLUMNS = ('키워드', '메모', 'ID')
+
+# 메모리용 표에서 빼는 컬럼
+DROPPED_COLUMNS = ('삭제여부',)
+
+def _string_dtype():
+    """Arrow 문자열 dtype (pyarrow가 없으면 None)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    import pandas as pd
+    return pd.StringDtype('pyarrow')
+
+def typed_value(column, value):
+    """시트 표기 또는 앱 값 하나를 메모리용 타입으로 ('✅' → True, 날짜 문자열 → Timestamp)"""
+    if column in STATUS_COLUMNS:
+        if isinstance(value, str):
+            return value == '✅'
+        return value is not None and value == value and bool(value)
+    if column == '날짜' and isinstance(value, str):
+        import pandas as pd
+        return pd.to_datetime(value, errors='coerce')
+    return value
+
+def to_typed_frame(df):
+    """시트에서 읽은 DataFrame → 타입이 정해진 새 DataFrame (인덱스·attrs 유지, 이미 변환된 컬럼은 그대로)"""
+    import pandas as pd
+    
+    string_dtype = _string_dtype()
+    columns = {}
+    for column in df.columns:
+        if column in DROPPED_COLUMNS:
+            continue
+        values = df[column]
+        if column in STATUS_COLUMNS:
+            if values.dtype != bool:
+                values = values.isin(('✅', True))
+        elif column == '프로젝트명':
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.fillna('').astype(str).astype('category')
+        elif column == '날짜':
+            if values.dtype.kind != 'M':
+                values = pd.to_datetime(values, format='mixed', errors='coerce')
+        elif column in TEXT_COLUMNS:
+            if string_dtype is None or values.dtype != string_dtype:
+                if column == '키워드':
+                    # 숫자로 읽힌 키워드는 원래 표기로
+                    values = pd.Series([keyword_text(value) or '' for value in values], index=df.index)
+                else:
+                    values = values.fillna('').astype(str)
+                if string_dtype is not None:
+                    values = values.astype(string_dtype)
+        columns[column] = values
+    
+    typed = pd.DataFrame(columns, index=df.index)
+    typed.attrs.update(df.attrs)
+    return typed
+
+def concat_typed(df, new_df):
+    """타입 변환된 두 표 합치기 (프로젝트명 카테고리는 합집합으로 맞춰 category 유지)"""
+    import pandas as pd
+    
+    if df.empty:
+        return new_df
+    if '프로젝트명' in df.columns and '프로젝트명' in new_df.columns:
+        categories = df['프로젝트명'].cat.categories.union(new_df['프로젝트명'].cat.categories)
+        df = df.assign(프로젝트명=df['프로젝트명'].cat.set_categories(categories))
+        new_df = new_df.assign(프로젝트명=new_df['프로젝트명'].cat.set_categories(categories))
+    combined = pd.concat([df, new_df])
+    combined.attrs.update(df.attrs)
+    return combined
+
+def set_typed_value(df, label, column, value):
+    """표의 칸 하나를 메모리용 타입 값으로 수정 (새 프로젝트명은 카테고리에 추가)"""
+    value = typed_value(column, value)
+    if column in df.columns and df[column].dtype == 'category' and value not in df[column].cat.categories:
+        df[column] = df[column].cat.add_categories([value])
+    df.at[label, column] = value
+
+def display_date(value):
+    """날짜 칸 → 화면 표시용 'YYYY-MM-DD' (비어 있으면 빈 문자열)"""
+    if value is None or value != value:
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d')
+    text = str(value)
+    return text.split()[0] if text else ''
@@ -0,0 +1,224 @@
+"""실행 시간 구간(span)과 저장소 호출 카운터 계측
+
+span('storage.load')처럼 구간 시간을 재고 count('sheets.reads')처럼 횟수/행 수를 셉니다.
+값은 프로세스 전체 누적(METRICS)과, 현재 스레드에서 진행 중인 실행 기록(RunRecord, Streamlit 재실행 하나)에 함께 쌓입니다.
+백그라운드 스레드(쓰기 지연 큐, 캐시 다시 읽기)의 호출은 누적에만 들어갑니다.
+
+    with METRICS.run('app') as record:
+        with span('render.header'):
+            ...
+    METRICS.history[-1].to_dict()
+
+누적 값은 Prometheus 텍스트 형식(to_prometheus)으로, 실행 기록은 JSON lines(append_jsonl)로 내보낼 수 있습니다.
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Prometheus 지표 이름 접두사
+METRIC_PREFIX = 'keyword_app'
+
+class RunRecord:
+    """실행 한 번(앱 재실행 또는 조각 재실행)의 구간 시간과 카운터"""
+    
+    def __init__(self, label, session=None):
+        self.label = label
+        self.session = session
+        self.started_at = time.time()
+        self.duration = None
+        self.spans = {}
+        self.counters = {}
+        self._started = time.perf_counter()
+    
+    def add_span(self, name, seconds):
+        count, total, longest = self.spans.get(name, (0, 0.0, 0.0))
+        self.spans[name] = (count + 1, total + seconds, max(longest, seconds))
+    
+    def add_count(self, name, value):
+        self.counters[name] = self.counters.get(name, 0) + value
+    
+    def finish(self):
+        self.duration = time.perf_counter() - self._started
+    
+    def to_dict(self):
+        """JSON으로 내보낼 형태 (시간은 ms)"""
+        return {
+            'ts': round(self.started_at, 3),
+            'label': self.label,
+            'session': self.session,
+            'duration_ms': None if self.duration is None else round(self.duration * 1000, 3),
+            'spans': {
+                name: {'count': count, 'total_ms': round(total * 1000, 3), 'max_ms': round(longest * 1000, 3)}
+                for name, (count, total, longest) in self.spans.items()
+            },
+            'counters': dict(self.counters),
+        }
+
+class Metrics:
+    """프로세스 전체 누적 계측값 + 최근 실행 기록"""
+    
+    def __init__(self, history=100):
+        self.history = deque(maxlen=history)
+        self._spans = {}
+        self._counters = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    @property
+    def current(self):
+        """현재 스레드에서 진행 중인 실행 기록 (없으면 None)"""
+        return getattr(self._local, 'record', None)
+    
+    def begin_run(self, label, session=None):
+        """실행 기록 시작 (같은 스레드에 끝나지 않은 기록이 있으면 버리고 새로 시작)"""
+        self._local.section = None
+        record = RunRecord(label, session)
+        self._local.record = record
+        return record
+    
+    def end_run(self, record=None):
+        """실행 기록 종료 후 history에 추가, 끝낸 기록 반환 (열려 있는 section도 닫음)"""
+        record = record or self.current
+        if record is None:
+            return None
+        if self.current is record:
+            self.section(None)
+        record.finish()
+        if self.current is record:
+            self._local.record = None
+        with self._lock:
+            self.history.append(record)
+        return record
+    
+    @contextmanager
+    def run(self, label, session=None):
+        """실행 기록 구간 (이미 진행 중인 기록이 있으면 그 기록에 합쳐짐)"""
+        if self.current is not None:
+            yield self.current
+            return
+        record = self.begin_run(label, session)
+        try:
+            yield record
+        finally:
+            self.end_run(record)
+    
+    def add_span(self, name, seconds):
+        with self._lock:
+            count, total, longest = self._spans.get(name, (0, 0.0, 0.0))
+            self._spans[name] = (count + 1, total + seconds, max(longest, seconds))
+        record = self.current
+        if record is not None:
+            record.add_span(name, seconds)
+    
+    def add_count(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+        record = self.current
+        if record is not None:
+            record.add_count(name, value)
+    
+    def section(self, name):
+        """직전 section을 끝내고 name section 시작 (들여쓰기 없이 위에서 아래로 흐르는 화면 코드를 구간별로 측정)
+        
+        name이 None이면 직전 section만 끝냅니다.
+        """
+        now = time.perf_counter()
+        previous = getattr(self._local, 'section', None)
+        if previous is not None:
+            self.add_span(previous[0], now - previous[1])
+        self._local.section = (name, now) if name else None
+    
+    @contextmanager
+    def span(self, name):
+        """구간 시간 측정 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, time.perf_counter() - started)
+    
+    def snapshot(self):
+        """누적 값 사본 {'spans': {이름: (횟수, 합계 초, 최대 초)}, 'counters': {이름: 값}}"""
+        with self._lock:
+            return {'spans': dict(self._spans), 'counters': dict(self._counters)}
+    
+    def reset(self):
+        """누적 값과 실행 기록 모두 비우기"""
+        with self._lock:
+            self._spans = {}
+            self._counters = {}
+            self.history.clear()
+    
+    def to_prometheus(self):
+        """누적 값을 Prometheus 텍스트 노출 형식으로"""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {METRIC_PREFIX}_span_seconds 구간 실행 시간",
+            f"# TYPE {METRIC_PREFIX}_span_seconds summary",
+        ]
+        for name, (count, total, _) in sorted(snapshot['spans'].items()):
+            label = _label_value(name)
+            lines.append(f'{METRIC_PREFIX}_span_seconds_sum{{span="{label}"}} {total:.6f}')
+            lines.append(f'{METRIC_PREFIX}_span_seconds_count{{span="{label}"}} {count}')
+        lines.append(f"# HELP {METRIC_PREFIX}_span_max_seconds 구간 최대 실행 시간")
+        lines.append(f"# TYPE {METRIC_PREFIX}_span_max_seconds gauge")
+        for name, (_, _, longest) in sorted(snapshot['spans'].items()):
+            lines.append(f'{METRIC_PREFIX}_span_max_seconds{{span="{_label_value(name)}"}} {longest:.6f}')
+        for name, value in sorted(snapshot['counters'].items()):
+            metric = f"{METRIC_PREFIX}_{_metric_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+    
+    def write_prometheus(self, path):
+        """Prometheus 텍스트 파일 쓰기 (node_exporter textfile 수집용, 임시 파일로 쓴 뒤 교체)"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
+    
+    def to_jsonl(self, records=None):
+        """실행 기록들을 JSON lines 문자열로 (기본: history 전체)"""
+        if records is None:
+            with self._lock:
+                records = list(self.history)
+        return ''.join(json.dumps(record.to_dict(), ensure_ascii=False) + '\n' for record in records)
+    
+    def append_jsonl(self, path, record):
+        """실행 기록 하나를 JSON lines 파일 끝에 추가"""
+        with self._lock, open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record.to_dict(), ensure_ascii=False) + '\n')
+
+def _metric_name(name):
+    """'sheets.rows_read' → 'sheets_rows_read' (Prometheus 이름 규칙)"""
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+def _label_value(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+# 프로세스 전체에서 쓰는 계측값
+METRICS = Metrics()
+
+def span(name):
+    """METRICS.span 단축"""
+    return METRICS.span(name)
+
+def count(name, value=1):
+    """METRICS.add_count 단축"""
+    METRICS.add_count(name, value)
+
+def instrumented(name):
+    """함수 전체를 span(name)으로 감싸는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with METRICS.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,158 @@
+"""키워드 추출 프로필
+
+키워드 도구마다 다른 페이지 구조를 이름 붙인 프로필로 관리합니다.
+프로필은 만들 때 한 번 선택자를 해석(컴파일)해 두고, 추출할 때마다 그대로 재사용합니다.
+
+선택자는 스트리밍 파서가 여는 태그 하나만 보고 판단할 수 있는 단순 선택자만 지원합니다.
+    span.keyword, .keyword-blur, td[data-keyword], a[href^="/search"], #main-keyword
+자손/자식 결합자(공백, >)와 의사 클래스(:nth-child 등)는 지원하지 않습니다.
+"""
+
+import re
+
+# 기본 프로필 선택자 (기존 parse_keywords_from_html과 동일)
+DEFAULT_SELECTORS = '.keyword, .keyword-blur, .end-board-td-blur'
+
+# 자동 감지를 뜻하는 프로필 이름
+AUTO_PROFILE = 'auto'
+
+_SIMPLE_SELECTOR_RE = re.compile(
+    r'''\s*(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[.#][\w-]+|\[[^\]]+\])*)\s*$'''
+)
+_PART_RE = re.compile(r'''([.#])([\w-]+)|\[([^\]]+)\]''')
+_ATTRIBUTE_RE = re.compile(
+    r'''^\s*(?P<name>[\w-]+)\s*(?:(?P<op>[~^$*|]?=)\s*(?P<quote>["']?)(?P<value>.*?)(?P=quote))?\s*$'''
+)
+
+class SimpleSelector:
+    """컴파일된 단순 선택자 하나 (태그, 클래스, id, 속성 조건)"""
+    
+    __slots__ = ('text', 'tag', 'classes', 'element_id', 'attributes')
+    
+    def __init__(self, text):
+        match = _SIMPLE_SELECTOR_RE.match(text)
+        if not text.strip() or not match:
+            raise ValueError(f"지원하지 않는 선택자입니다: {text!r} (결합자/의사 클래스 미지원)")
+        
+        self.text = text.strip()
+        tag = match.group('tag')
+        self.tag = tag.lower() if tag and tag != '*' else None
+        classes = []
+        self.element_id = None
+        self.attributes = []
+        
+        for prefix, name, attribute in _PART_RE.findall(match.group('rest')):
+            if prefix == '.':
+                classes.append(name)
+            elif prefix == '#':
+                self.element_id = name
+            else:
+                attr_match = _ATTRIBUTE_RE.match(attribute)
+                if not attr_match:
+                    raise ValueError(f"지원하지 않는 속성 조건입니다: [{attribute}]")
+                self.attributes.append((
+                    attr_match.group('name').lower(), attr_match.group('op'), attr_match.group('value')
+                ))
+        self.classes = frozenset(classes)
+    
+    def matches(self, tag, attrs, class_tokens):
+        """여는 태그 하나가 선택자에 맞는지 (attrs는 마지막 값 기준 dict, class_tokens는 클래스 집합)"""
+        if self.tag is not None and self.tag != tag:
+            return False
+        if self.classes and not self.classes <= class_tokens:
+            return False
+        if self.element_id is not None and attrs.get('id') != self.element_id:
+            return False
+        for name, op, expected in self.attributes:
+            value = attrs.get(name)
+            if value is None:
+                return False
+            if op is None:
+                continue
+            if op == '=' and value != expected:
+                return False
+            if op == '~=' and expected not in value.split():
+                return False
+            if op == '^=' and not (expected and value.startswith(expected)):
+                return False
+            if op == '$=' and not (expected and value.endswith(expected)):
+                return False
+            if op == '*=' and not (expected and expected in value):
+                return False
+            if op == '|=' and not (value == expected or value.startswith(expected + '-')):
+                return False
+        return True
+
+def compile_selectors(selectors):
+    """쉼표로 구분한 선택자 문자열(또는 목록) → SimpleSelector 목록"""
+    if isinstance(selectors, str):
+        selectors = selectors.split(',')
+    compiled = [SimpleSelector(text) for text in selectors if text.strip()]
+    if not compiled:
+        raise ValueError("선택자가 비어 있습니다")
+    return compiled
+
+class ExtractionProfile:
+    """이름 붙인 추출 규칙 (선택자, 값을 가져올 곳, 길이/불용어 규칙, 최대 개수)
+    
+    source가 'text'면 요소의 텍스트(get_text(strip=True)), 그 밖의 값은 해당 속성 값을 키워드로 씁니다.
+    """
+    
+    def __init__(self, name, selectors=DEFAULT_SELECTORS, source='text', min_length=2, max_length=None,
+                 stopwords=(), limit=100, label=None):
+        self.name = name
+        self.label = label or name
+        self.selectors = compile_selectors(selectors)
+        self.source = source.lower() if source else 'text'
+        self.min_length = int(min_length)
+        self.max_length = int(max_length) if max_length else None
+        self.stopwords = frozenset(stopwords)
+        self.limit = int(limit) if limit else None
+        
+        # 여는 태그마다 빠르게 걸러내기 위한 값 (클래스만 보는 선택자가 대부분)
+        self._tags = {s.tag for s in self.selectors}
+        self._class_only = all(
+            s.tag is None and s.element_id is None and not s.attributes and s.classes for s in self.selectors
+        )
+        self._any_classes = frozenset().union(*(s.classes for s in self.selectors)) if self._class_only else None
+    
+    def __repr__(self):
+        selectors = ', '.join(s.text for s in self.selectors)
+        return f"ExtractionProfile({self.name!r}, {selectors!r}, source={self.source!r})"
+    
+    def matches(self, tag, attrs, class_tokens):
+        """여는 태그가 이 프로필의 선택자 중 하나에 맞는지"""
+        if self._class_only:
+            if self._any_classes.isdisjoint(class_tokens):
+                return False
+        elif None not in self._tags and tag not in self._tags:
+            return False
+        return any(s.matches(tag, attrs, class_tokens) for s in self.selectors)
+    
+    def accepts(self, text):
+        """길이/불용어 규칙을 통과하는 키워드인지"""
+        if not text or len(text) < self.min_length:
+            return False
+        if self.max_length is not None and len(text) > self.max_length:
+            return False
+        return text not in self.stopwords
+    
+    @classmethod
+    def from_config(cls, name, config):
+        """설정 dict(secrets.toml / JSON)로 프로필 만들기"""
+        options = dict(config)
+        unknown = set(options) - {'selectors', 'source', 'min_length', 'max_length', 'stopwords', 'limit', 'label'}
+        if unknown:
+            raise ValueError(f"프로필 '{name}'에 알 수 없는 항목: {', '.join(sorted(unknown))}")
+        return cls(name, **options)
+
+DEFAULT_PROFILE = ExtractionProfile('default', label='기본 (keyword 클래스)')
+
+def load_profiles(config=None):
+    """기본 프로필 + 설정의 프로필들을 컴파일해 {이름: 프로필}로 반환 (같은 이름이면 설정이 우선)"""
+    profiles = {DEFAULT_PROFILE.name: DEFAULT_PROFILE}
+    for name, options in (config or {}).items():
+        if name == AUTO_PROFILE:
+            raise ValueError(f"'{AUTO_PROFILE}'는 자동 감지용 이름이라 프로필 이름으로 쓸 수 없습니다")
+        profiles[name] = ExtractionProfile.from_config(name, options)
+    return profiles
@@ -0,0 +1,110 @@
+"""통합 검색용 글자 바이그램 역색인
+
+키워드 · 프로젝트명 · 메모를 소문자로 바꿔 한 문서로 보고, 글자 2개(바이그램)마다 해당 행 목록(포스팅)을 만듭니다.
+검색어의 바이그램 포스팅을 짧은 것부터 교집합한 뒤 남은 후보만 실제 부분 문자열인지 확인하므로
+결과는 str.contains(검색어, case=False, regex=False)와 같고, 조회 시간은 전체 행 수가 아니라 후보 수에 비례합니다.
+numpy는 색인을 만들거나 찾는 함수 안에서만 불러오므로 이 모듈은 가볍게 import됩니다.
+"""
+
+import threading
+
+# 통합 검색 대상 컬럼
+SEARCH_COLUMNS = ('키워드', '프로젝트명', '메모')
+
+# 필드 사이 구분자 (검색어에 들어갈 수 없는 글자라 필드 경계를 넘는 일치가 생기지 않음)
+_FIELD_SEPARATOR = '\x00'
+
+def search_text(values):
+    """필드 값들 → 검색용 소문자 문자열 (str.contains처럼 문자열이 아닌 값은 빈 문자열)"""
+    return _FIELD_SEPARATOR.join(value.lower() if isinstance(value, str) else '' for value in values)
+
+def _grams(text):
+    """문자열 → 바이그램 집합 (한 글자면 그 글자)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+def _index_grams(text):
+    """색인할 그램 집합 (한 글자 검색어도 찾도록 글자 하나짜리도 포함, 구분자가 낀 그램은 제외)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return {gram for gram in grams if _FIELD_SEPARATOR not in gram}
+
+class SearchIndex:
+    """DataFrame 인덱스 라벨 기준 바이그램 역색인
+    
+    처음 만들 때의 포스팅은 numpy 배열로 압축해 두고, 이후 추가/수정된 행은 작은 추가 포스팅에만 넣습니다.
+    수정/삭제로 남은 예전 포스팅은 후보 확인 단계에서 걸러지므로 따로 지우지 않습니다.
+    """
+    
+    def __init__(self, rows=()):
+        import numpy as np
+        
+        self._texts = {}
+        self._postings = {}
+        self._extra = {}
+        self._lock = threading.Lock()
+        
+        postings = {}
+        for label, values in rows:
+            text = search_text(values)
+            self._texts[label] = text
+            for gram in _index_grams(text):
+                postings.setdefault(gram, []).append(label)
+        self._postings = {gram: np.unique(labels) for gram, labels in postings.items()}
+    
+    @classmethod
+    def from_frame(cls, df, columns=SEARCH_COLUMNS):
+        """저장소 DataFrame으로 색인 만들기 (없는 컬럼은 빈 값)"""
+        if df is None or df.empty:
+            return cls()
+        fields = [df[column].tolist() if column in df.columns else [None] * len(df) for column in columns]
+        return cls(zip(df.index, zip(*fields)))
+    
+    def __len__(self):
+        return len(self._texts)
+    
+    def add(self, label, values):
+        """행 추가 또는 수정 반영 (values는 SEARCH_COLUMNS 순서의 값)"""
+        text = search_text(values)
+        with self._lock:
+            self._texts[label] = text
+            for gram in _index_grams(text):
+                self._extra.setdefault(gram, set()).add(label)
+    
+    def discard(self, label):
+        """행 삭제 반영"""
+        with self._lock:
+            self._texts.pop(label, None)
+    
+    def search(self, query):
+        """검색어를 부분 문자열로 포함하는 행 라벨 목록 (대소문자 무시, 빈 검색어는 전체)"""
+        import numpy as np
+        
+        query = query.lower()
+        with self._lock:
+            if not query:
+                return list(self._texts)
+            candidates = None
+            for gram in sorted(_grams(query), key=self._posting_size):
+                posting = self._posting(gram)
+                candidates = posting if candidates is None else np.intersect1d(candidates, posting, assume_unique=True)
+                if len(candidates) == 0:
+                    return []
+            texts = self._texts
+            return [label for label in candidates.tolist() if query in texts.get(label, '')]
+    
+    def _posting_size(self, gram):
+        base = self._postings.get(gram)
+        return (0 if base is None else len(base)) + len(self._extra.get(gram, ()))
+    
+    def _posting(self, gram):
+        """그램의 전체 포스팅 (정렬된 중복 없는 배열, 잠금 안에서 호출)"""
+        import numpy as np
+        
+        base = self._postings.get(gram)
+        extra = self._extra.get(gram)
+        if not extra:
+            return base if base is not None else np.asarray([])
+        extra = np.asarray(sorted(extra))
+        return extra if base is None else np.union1d(base, extra)
@@ -0,0 +1,223 @@
+"""유사 키워드(근사 중복) 검출 - MinHash + LSH
+
+"다이어트 식단" / "식단 다이어트"(어순), "다이어트 식단" / "다이어트의 식단"(조사 한 글자)처럼
+정규화 키가 달라 정확한 중복 검사(KeywordIndex)로는 잡히지 않는 키워드를 찾습니다.
+
+정규화 키를 글자 n-gram 집합으로 나누고 MinHash 서명을 만든 뒤, 서명을 여러 밴드로 잘라 같은 밴드 값을 가진
+키워드만 후보로 봅니다(LSH). 후보에 대해서만 실제 Jaccard 유사도를 계산하므로 저장된 키워드 수와 거의 무관하게
+키워드 하나당 수십 마이크로초 수준으로 조회됩니다.
+"""
+
+import random
+import threading
+import zlib
+
+from keyword_core.dedupe import keyword_text, normalize_keyword
+
+# 유사 키워드로 볼 기본 Jaccard 유사도 (글자 2-gram 기준)
+DEFAULT_THRESHOLD = 0.5
+
+# MinHash 순열 연산에 쓰는 메르센 소수 (2^31 - 1, 계수 × 해시가 64비트 정수에 들어가는 크기)
+_MERSENNE_PRIME = (1 << 31) - 1
+
+def shingles(key, ngram=2):
+    """정규화 키 → 글자 n-gram 집합 (n글자보다 짧으면 키 전체)"""
+    if len(key) <= ngram:
+        return frozenset([key]) if key else frozenset()
+    return frozenset(key[i:i + ngram] for i in range(len(key) - ngram + 1))
+
+def jaccard(left, right):
+    """두 n-gram 집합의 Jaccard 유사도"""
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+class NearDuplicateIndex:
+    """저장된 키워드의 MinHash/LSH 인덱스
+    
+    bands × rows_per_band개의 해시로 서명을 만들고, 밴드 하나라도 같으면 후보로 봅니다.
+    기본값(10 × 3)은 유사도 0.5 근처에서 후보가 되기 시작하고 0.65 이상은 97% 이상 후보로 잡힙니다.
+    KeywordIndex와 같이 행 ID로 개별 추가/삭제를 반영합니다.
+    """
+    
+    def __init__(self, keywords=(), bands=10, rows_per_band=3, ngram=2, seed=1):
+        self.bands = bands
+        self.rows_per_band = rows_per_band
+        self.ngram = ngram
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(bands * rows_per_band)
+        ]
+        self._buckets = {}
+        self._entries = {}
+        self._keys_by_id = {}
+        self._lock = threading.Lock()
+        self.add_many((keyword, None) for keyword in keywords)
+    
+    @classmethod
+    def from_frame(cls, df, **options):
+        """저장소 DataFrame(키워드, ID 컬럼)으로 인덱스 만들기"""
+        index = cls(**options)
+        if df is None or df.empty or '키워드' not in df.columns:
+            return index
+        row_ids = df['ID'] if 'ID' in df.columns else [None] * len(df)
+        index.add_many(zip(df['키워드'], row_ids))
+        return index
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def _band_keys_from_signature(self, signature):
+        rows = self.rows_per_band
+        return [hash((band, *signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+    
+    def _band_keys(self, grams):
+        """n-gram 집합 → 밴드별 버킷 키 목록"""
+        hashed = [zlib.crc32(gram.encode('utf-8')) for gram in grams]
+        signature = [min((a * x + b) % _MERSENNE_PRIME for x in hashed) for a, b in self._coefficients]
+        return self._band_keys_from_signature(signature)
+    
+    def _signatures(self, keys):
+        """여러 정규화 키의 밴드 키를 한 번에 계산 (numpy로 전체 n-gram을 묶어 처리, 없으면 하나씩)"""
+        try:
+            import numpy as np
+        except ImportError:
+            return [self._band_keys(shingles(key, self.ngram)) for key in keys]
+        
+        hashed = []
+        offsets = []
+        for key in keys:
+            offsets.append(len(hashed))
+            hashed.extend(zlib.crc32(gram.encode('utf-8')) for gram in shingles(key, self.ngram))
+        values = np.array(hashed, dtype=np.int64)
+        starts = np.array(offsets, dtype=np.int64)
+        
+        signatures = np.empty((len(keys), len(self._coefficients)), dtype=np.int64)
+        for column, (a, b) in enumerate(self._coefficients):
+            signatures[:, column] = np.minimum.reduceat((a * values + b) % _MERSENNE_PRIME, starts)
+        return [self._band_keys_from_signature(signature) for signature in signatures.tolist()]
+    
+    def _insert(self, key, band_keys):
+        # 버킷 대부분은 키워드 하나뿐이라 하나일 때는 집합 없이 키만 저장
+        buckets = self._buckets
+        for band_key in band_keys:
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                buckets[band_key] = key
+            elif isinstance(bucket, str):
+                if bucket != key:
+                    buckets[band_key] = {bucket, key}
+            else:
+                bucket.add(key)
+    
+    def _register(self, keyword, row_id):
+        """키워드 등록 (이미 있는 키면 개수만 늘림), 새로 인덱싱할 정규화 키 반환"""
+        text = keyword_text(keyword)
+        if text is None:
+            return None
+        key = normalize_keyword(text)
+        if not key:
+            return None
+        if row_id is not None:
+            if row_id in self._keys_by_id:
+                return None
+            self._keys_by_id[row_id] = key
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1] += 1
+            return None
+        self._entries[key] = [text, 1]
+        return key
+    
+    def add(self, keyword, row_id=None):
+        """저장된 키워드 하나 추가"""
+        with self._lock:
+            key = self._register(keyword, row_id)
+            if key is not None:
+                self._insert(key, self._band_keys(shingles(key, self.ngram)))
+    
+    def add_many(self, items):
+        """(키워드, 행 ID) 여러 개를 한 번에 추가 (처음 인덱스를 만들 때 사용)"""
+        with self._lock:
+            keys = [key for key in (self._register(keyword, row_id) for keyword, row_id in items) if key is not None]
+            if keys:
+                for key, band_keys in zip(keys, self._signatures(keys)):
+                    self._insert(key, band_keys)
+    
+    def discard(self, row_id):
+        """행 ID로 키워드 하나 제거"""
+        with self._lock:
+            key = self._keys_by_id.pop(row_id, None)
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self._entries[key]
+            for band_key in self._band_keys(shingles(key, self.ngram)):
+                bucket = self._buckets.get(band_key)
+                if bucket == key:
+                    del self._buckets[band_key]
+                elif isinstance(bucket, set):
+                    bucket.discard(key)
+                    if len(bucket) == 1:
+                        self._buckets[band_key] = bucket.pop()
+    
+    def query(self, keyword, threshold=DEFAULT_THRESHOLD, limit=3):
+        """keyword와 유사한 저장된 키워드 [(키워드, 유사도)] (유사도 높은 순, 정규화 키가 같은 정확한 중복은 제외)"""
+        text = keyword_text(keyword)
+        if text is None:
+            return []
+        key = normalize_keyword(text)
+        grams = shingles(key, self.ngram)
+        if not grams:
+            return []
+        
+        candidates = set()
+        for band_key in self._band_keys(grams):
+            bucket = self._buckets.get(band_key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, str):
+                candidates.add(bucket)
+            else:
+                candidates.update(bucket)
+        candidates.discard(key)
+        
+        matches = []
+        for candidate in candidates:
+            entry = self._entries.get(candidate)
+            if entry is None:
+                continue
+            score = jaccard(grams, shingles(candidate, self.ngram))
+            if score >= threshold:
+                matches.append((entry[0], score))
+        matches.sort(key=lambda match: -match[1])
+        return matches[:limit]
+    
+    def best_match(self, keyword, threshold=DEFAULT_THRESHOLD):
+        """가장 유사한 저장된 키워드 (키워드, 유사도), 없으면 None"""
+        matches = self.query(keyword, threshold, limit=1)
+        return matches[0] if matches else None
+
+def find_near_duplicates(keywords, index, threshold=DEFAULT_THRESHOLD):
+    """keywords 중 저장된 키워드와 유사한 것 → {키워드: (유사한 저장된 키워드, 유사도)}"""
+    if index is None or not len(index):
+        return {}
+    near_duplicates = {}
+    for keyword in keywords:
+        match = index.best_match(keyword, threshold)
+        if match:
+            near_duplicates[keyword] = match
+    return near_duplicates
@@ -0,0 +1,106 @@
+"""프로젝트 × 상태 조합별 키워드 수 집계
+
+(프로젝트명, 사용여부, 티스토리작성, 블로그스팟작성) 조합마다 행 수만 세어 두고,
+저장·수정·삭제 때 바뀐 행의 조합만 더하고 빼서(O(1)) 관리 화면 통계와 프로젝트별 현황이 표를 훑지 않게 합니다.
+조합 수는 프로젝트 수 × 8을 넘지 않으므로 필터에 맞는 조합을 합치는 조회도 행 수와 무관합니다.
+"""
+
+import threading
+
+from keyword_core.frame import STATUS_COLUMNS, typed_value
+
+# 집계 키를 이루는 컬럼 (프로젝트명 + 상태 컬럼)
+STATS_COLUMNS = ('프로젝트명',) + STATUS_COLUMNS
+
+def _stats_key(row):
+    """행({컬럼: 값}) → 집계 키 (상태는 bool, ✅/❌ 표기도 허용, 없는 값은 빈 프로젝트/False)"""
+    project = row.get('프로젝트명')
+    return (project if isinstance(project, str) else '',) + tuple(typed_value(column, row.get(column)) for column in STATUS_COLUMNS)
+
+class KeywordStats:
+    """상태 조합별 키워드 수 (행 추가/삭제/수정 시 해당 조합만 갱신)"""
+    
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_frame(cls, df):
+        """타입 변환된 표로 집계 만들기 (groupby 한 번)"""
+        stats = cls()
+        if df is None or df.empty:
+            return stats
+        columns = [column for column in STATS_COLUMNS if column in df.columns]
+        keys = df[columns].copy()
+        for column in STATS_COLUMNS:
+            if column not in keys.columns:
+                keys[column] = '' if column == '프로젝트명' else False
+        keys['프로젝트명'] = keys['프로젝트명'].astype(object).fillna('')
+        for key, count in keys.groupby(list(STATS_COLUMNS), observed=True, sort=False).size().items():
+            if count:
+                stats._counts[_stats_key(dict(zip(STATS_COLUMNS, key)))] = int(count)
+        return stats
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    @property
+    def total(self):
+        """전체 키워드 수"""
+        with self._lock:
+            return sum(self._counts.values())
+    
+    def add(self, row):
+        """행 하나 추가 반영"""
+        key = _stats_key(row)
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+    
+    def remove(self, row):
+        """행 하나 삭제 반영"""
+        key = _stats_key(row)
+        with self._lock:
+            count = self._counts.get(key, 0) - 1
+            if count > 0:
+                self._counts[key] = count
+            else:
+                self._counts.pop(key, None)
+    
+    def update(self, old_row, new_row):
+        """행 수정 반영 (집계 키가 바뀔 때만 옮김)"""
+        if _stats_key(old_row) != _stats_key(new_row):
+            self.remove(old_row)
+            self.add(new_row)
+    
+    def summary(self, project=None, **statuses):
+        """조건에 맞는 행의 통계 {'total', 'used', 'unused', 'tistory', 'blogspot'}
+        
+        project는 프로젝트명(None이면 전체), statuses는 상태 컬럼별 True/False 조건 (예: {'사용여부': True}).
+        """
+        positions = {column: 1 + i for i, column in enumerate(STATUS_COLUMNS)}
+        result = dict.fromkeys(('total', 'used', 'unused', 'tistory', 'blogspot'), 0)
+        with self._lock:
+            items = list(self._counts.items())
+        for key, count in items:
+            if project is not None and key[0] != project:
+                continue
+            if any(key[positions[column]] != value for column, value in statuses.items()):
+                continue
+            _, used, tistory, blogspot = key
+            result['total'] += count
+            result['used' if used else 'unused'] += count
+            result['tistory'] += count if tistory else 0
+            result['blogspot'] += count if blogspot else 0
+        return result
+    
+    def by_project(self):
+        """프로젝트별 통계 {프로젝트명: summary()와 같은 형식}"""
+        with self._lock:
+            projects = {key[0] for key in self._counts}
+        return {project: self.summary(project) for project in sorted(projects)}
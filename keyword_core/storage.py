@@ -0,0 +1,612 @@
+"""키워드 저장소 (구글시트 / 로컬 SQLite)
+
+모든 저장소는 같은 컬럼 구성(SHEET_COLUMNS)과 ID 기반 연산을 제공합니다.
+- load(): 삭제 표시되지 않은 행 전체를 DataFrame으로 반환
+- append(rows): 새 행만 추가
+- patch(edits): {ID: {컬럼: 값}} 수정 사항 반영, 찾지 못한 ID 목록 반환
+- compact(): 삭제 표시된 행을 실제로 제거 (읽기와 별개인 명시적 단계, 앱에서는 쓰기 지연 큐가 빈 뒤에만 호출)
+
+앱 안에서는 상태를 bool, 날짜를 datetime으로 다루고(keyword_core.frame), 시트 표기('✅'/'❌', 날짜 문자열)로의
+변환은 저장소가 쓸 때(append/patch) to_sheet_value로만 합니다.
+
+pandas는 DataFrame을 만드는 함수 안에서만 불러오므로 이 모듈은 가볍게 import됩니다.
+공개 연산은 'storage.*' 구간으로, 시트/SQLite 호출은 'sheets.*'/'sqlite.*' 카운터로 계측됩니다(keyword_core.instrumentation).
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+
+from keyword_core.instrumentation import count, instrumented, span
+
+# 시트 컬럼 순서 (새 시트를 만들 때의 헤더)
+SHEET_COLUMNS = ['날짜', '프로젝트명', '키워드', '사용여부', '티스토리작성', '블로그스팟작성', '메모', 'ID', '삭제여부']
+
+# 삭제여부 컬럼의 삭제 표시 (정리 전까지 행은 남아 있고 읽을 때만 걸러냄)
+TOMBSTONE = '✅'
+
+class StorageError(Exception):
+    """저장소 작업 실패"""
+
+# 상태 코드를 알 수 없는 오류에서 할당량 초과·서버 오류를 알아보는 문구
+_TRANSIENT_MESSAGE_RE = re.compile(r'\[(429|5\d\d)\]|quota exceeded|rate limit|database is locked', re.IGNORECASE)
+
+def is_transient_error(error):
+    """잠시 뒤 다시 시도하면 될 오류인지 (할당량 초과 429, 5xx 서버 오류, 네트워크 오류, SQLite 잠김)
+    
+    그 밖의 오류(없는 시트·컬럼 등)는 다시 시도해도 같은 결과이므로 영구 오류로 봅니다.
+    """
+    # gspread APIError는 response.status_code, 가짜 연결(keyword_core.fake_sheets)은 code
+    status = getattr(error, 'code', None)
+    if not isinstance(status, int):
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status, int):
+        return status in (408, 429) or status >= 500
+    # requests의 연결/시간 초과 오류는 OSError
+    if isinstance(error, OSError):
+        return True
+    return bool(_TRANSIENT_MESSAGE_RE.search(str(error)))
+
+# ID 앞 글자 (숫자로만 된 ID는 구글시트가 숫자로 저장해 앞의 0이 빠지거나 1.23E+47처럼 바뀌므로 글자로 시작)
+ID_PREFIX = 'k'
+
+def new_keyword_id():
+    """키워드 행 고유 ID 생성 (숫자로 읽힐 수 없는 12자)"""
+    return ID_PREFIX + uuid.uuid4().hex[:11]
+
+# 시트의 날짜 표기
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def to_sheet_value(value):
+    """앱 값 → 시트에 쓸 값 (bool은 ✅/❌, datetime은 날짜 문자열, None·NaN·NaT는 빈 칸)"""
+    if value is True:
+        return '✅'
+    if value is False:
+        return '❌'
+    if value is None or value != value:
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMAT)
+    if type(value).__module__ == 'numpy':
+        # numpy bool 등 스칼라는 파이썬 값으로 바꿔서 다시 변환
+        return to_sheet_value(value.item())
+    return value
+
+def to_sheet_row(row, columns=SHEET_COLUMNS):
+    """{컬럼: 앱 값} 행 → 시트 값 목록 (없는 컬럼은 빈 칸)"""
+    return [to_sheet_value(row.get(col, '')) for col in columns]
+
+def new_keyword_rows(project_name, keywords, saved_at=None):
+    """새로 저장할 키워드 행 목록 (상태는 모두 False, 행마다 새 ID)"""
+    if saved_at is None:
+        saved_at = datetime.now().replace(microsecond=0)
+    
+    return [{
+        '날짜': saved_at,
+        '프로젝트명': project_name,
+        '키워드': keyword,
+        '사용여부': False,
+        '티스토리작성': False,
+        '블로그스팟작성': False,
+        '메모': '',
+        'ID': new_keyword_id(),
+        '삭제여부': ''
+    } for keyword in keywords]
+
+def usage_changes(used_status=None, tistory_status=None, blogspot_status=None, memo=None):
+    """사용여부/작성 상태/메모 인자를 수정 사항 {컬럼: 값}으로 변환 (None인 항목은 제외)"""
+    changes = {}
+    if used_status is not None:
+        changes['사용여부'] = bool(used_status)
+    if tistory_status is not None:
+        changes['티스토리작성'] = bool(tistory_status)
+    if blogspot_status is not None:
+        changes['블로그스팟작성'] = bool(blogspot_status)
+    if memo is not None:
+        changes['메모'] = memo
+    return changes
+
+class KeywordStore:
+    """키워드 저장소 인터페이스"""
+    
+    display_name = "저장소"
+    supports_row_writes = True
+    
+    def __init__(self):
+        # 마지막으로 읽거나 쓴 위치 (시트 이름, 파일 이름 등)
+        self.location = None
+    
+    def load(self):
+        """삭제 표시되지 않은 행 전체 읽기 (정리는 하지 않음, compact 참고)
+        
+        반환한 DataFrame의 attrs['tombstone_count']에 정리 대기 중인 삭제 표시 수가 들어 있습니다.
+        """
+        raise NotImplementedError
+    
+    def append(self, rows):
+        """새 행({컬럼: 값} 목록)만 추가"""
+        raise NotImplementedError
+    
+    def patch(self, edits):
+        """{ID: {컬럼: 값}} 수정 사항 반영, 찾지 못한 ID 목록 반환"""
+        raise NotImplementedError
+    
+    def compact(self):
+        """삭제 표시된 행을 실제로 제거하고 제거한 행 수 반환"""
+        raise NotImplementedError
+
+def _rowcol_to_a1(row, col):
+    """(행, 열) 번호 → A1 표기 (예: 3, 28 → AB3)"""
+    letters = ''
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return f"{letters}{row}"
+
+def _fill_defaults(df):
+    """예전 시트에 없던 컬럼과 빈 칸을 기본값으로 채우기"""
+    # 새로운 컬럼이 없으면 기본값으로 추가
+    if '티스토리작성' not in df.columns:
+        df['티스토리작성'] = '❌'
+    if '블로그스팟작성' not in df.columns:
+        df['블로그스팟작성'] = '❌'
+    if '삭제여부' not in df.columns:
+        df['삭제여부'] = ''
+    # 행 추가로 뒤늦게 생긴 컬럼의 빈 칸도 기본값으로 채우기
+    df[['티스토리작성', '블로그스팟작성']] = df[['티스토리작성', '블로그스팟작성']].fillna('❌')
+    df['삭제여부'] = df['삭제여부'].fillna('')
+    return df
+
+# ---------------- 구글시트 ----------------
+
+class _InstrumentedWorksheet:
+    """gspread 워크시트 호출마다 시간과 읽기/쓰기 횟수·행 수를 기록하는 얇은 래퍼"""
+    
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+    
+    def __getattr__(self, name):
+        return getattr(self._worksheet, name)
+    
+    def _read(self, method, rows, *args, **kwargs):
+        """읽기 호출 (rows가 None이면 받은 값 수를 행 수로 셈)"""
+        with span(f'sheets.{method}'):
+            result = getattr(self._worksheet, method)(*args, **kwargs)
+        count('sheets.reads')
+        count('sheets.rows_read', len(result) if rows is None else rows)
+        return result
+    
+    def _write(self, method, rows, *args, **kwargs):
+        with span(f'sheets.{method}'):
+            result = getattr(self._worksheet, method)(*args, **kwargs)
+        count('sheets.writes')
+        count('sheets.rows_written', rows)
+        return result
+    
+    def row_values(self, row, **kwargs):
+        return self._read('row_values', 1, row, **kwargs)
+    
+    def col_values(self, col, **kwargs):
+        return self._read('col_values', None, col, **kwargs)
+    
+    def batch_get(self, ranges, **kwargs):
+        return self._read('batch_get', len(ranges), ranges, **kwargs)
+    
+    def find(self, query, **kwargs):
+        return self._read('find', 1, query, **kwargs)
+    
+    def update(self, **kwargs):
+        return self._write('update', len(kwargs.get('values') or ()), **kwargs)
+    
+    def append_rows(self, values, **kwargs):
+        return self._write('append_rows', len(values), values, **kwargs)
+    
+    def batch_update(self, data, **kwargs):
+        # 셀 단위 수정이므로 A1 표기에서 행 번호만 모아 행 수로 셈
+        rows = {item['range'].lstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for item in data}
+        return self._write('batch_update', len(rows), data, **kwargs)
+    
+    def add_cols(self, cols):
+        return self._write('add_cols', 0, cols)
+
+class GSheetsStore(KeywordStore):
+    """구글시트 저장소 (streamlit-gsheets 연결 사용)
+    
+    ID → 시트 행 번호 인덱스를 유지하여 수정/삭제 시 시트 전체를 읽지 않고 해당 행만 다룹니다.
+    시트의 행 번호는 항상 시트의 ID/키워드 열을 직접 읽어 얻습니다. conn.read() 결과의 DataFrame 인덱스는
+    연결 구현(빈 행 처리 등)에 따라 달라지므로 시트 위치로 쓰지 않습니다.
+    """
+    
+    display_name = "구글시트"
+    
+    # 시도할 시트 이름 (None은 첫 번째 시트)
+    sheet_names = ["키워드관리", "Sheet1", "시트1", None]
+    
+    def __init__(self, conn):
+        super().__init__()
+        self.conn = conn
+        self._row_index = {}
+        # 찾아 둔 키워드 워크시트 (워크시트, 시트 이름), 오류가 나거나 키워드 시트가 아니게 되면 다시 찾음
+        self._worksheet = None
+        # 행 번호로 쓰는 작업(ID 기록/추가/수정/정리)은 한 번에 하나만 (쓰기 지연 큐와 세션들이 함께 씀)
+        self._lock = threading.Lock()
+    
+    @property
+    def supports_row_writes(self):
+        """행 단위 쓰기(gspread 워크시트 직접 접근) 지원 여부 (공개 시트 연결 등은 미지원)"""
+        return hasattr(getattr(self.conn, 'client', None), '_select_worksheet')
+    
+    def _open_worksheet(self, sheet_name):
+        """gspread 워크시트 객체 가져오기 (없는 시트면 None, 할당량 초과 등 일시적 오류는 그대로 올림)"""
+        try:
+            with span('sheets.open'):
+                try:
+                    worksheet = self.conn.client._select_worksheet(worksheet=sheet_name)
+                finally:
+                    # 스프레드시트 열기 + 워크시트 확인 (실패한 요청도 할당량을 씀)
+                    count('sheets.opens')
+                    count('sheets.reads')
+            return _InstrumentedWorksheet(worksheet)
+        except Exception as e:
+            if is_transient_error(e):
+                raise
+            return None
+    
+    def _find_worksheet(self):
+        """키워드 시트 찾기 → (워크시트, 시트 이름, 헤더), 없으면 (None, None, None)
+        
+        한 번 찾은 워크시트는 기억해 두고 다음부터는 헤더 한 줄만 읽습니다. 스프레드시트를 다시 열고
+        시트 이름들을 차례로 시도하는 메타데이터 호출은 처음과, 기억한 시트를 읽다가 오류가 났거나
+        그 시트가 더 이상 키워드 시트가 아닐 때만 합니다.
+        """
+        if self._worksheet is not None:
+            worksheet, sheet_name = self._worksheet
+            try:
+                header = worksheet.row_values(1)
+            except Exception as e:
+                self._worksheet = None
+                if is_transient_error(e):
+                    raise
+                # 시트가 지워졌거나 이름이 바뀌었을 수 있으므로 처음부터 다시 찾음
+                header = None
+            if header is not None and ('키워드' in header or not header):
+                return worksheet, sheet_name, header
+            self._worksheet = None
+        
+        empty_sheet = None
+        
+        for sheet_name in self.sheet_names:
+            worksheet = self._open_worksheet(sheet_name)
+            if worksheet is None:
+                continue
+            
+            header = worksheet.row_values(1)
+            if '키워드' in header:
+                self._worksheet = (worksheet, sheet_name)
+                return worksheet, sheet_name, header
+            if not header and empty_sheet is None:
+                empty_sheet = (worksheet, sheet_name, [])
+        
+        if empty_sheet is not None:
+            self._worksheet = empty_sheet[:2]
+        return empty_sheet or (None, None, None)
+    
+    def _ensure_columns(self, worksheet, header):
+        """기존 시트에 없는 컬럼을 헤더 끝에 추가 (기존 컬럼 배치 유지), 갱신된 헤더 반환"""
+        missing = [col for col in SHEET_COLUMNS if col not in header]
+        if not missing:
+            return header
+        
+        if worksheet.col_count < len(header) + len(missing):
+            worksheet.add_cols(len(header) + len(missing) - worksheet.col_count)
+        worksheet.update(
+            range_name=_rowcol_to_a1(1, len(header) + 1),
+            values=[missing]
+        )
+        return header + missing
+    
+    def _read_raw(self):
+        """여러 시트 이름을 시도하여 키워드 시트 읽기 (캐시 무시, 삭제 표시 행 포함)"""
+        for sheet_name in self.sheet_names:
+            try:
+                with span('sheets.read'):
+                    # ID는 숫자처럼 보여도 문자열 그대로 읽음 (예전 ID가 숫자로 바뀌어 행을 못 찾는 일이 없도록)
+                    if sheet_name:
+                        df = self.conn.read(worksheet=sheet_name, ttl=0, dtype={'ID': str})  # 캐시 무시
+                    else:
+                        df = self.conn.read(ttl=0, dtype={'ID': str})  # 캐시 무시하여 첫 번째 시트 읽기
+                count('sheets.reads')
+                count('sheets.rows_read', len(df))
+                
+                # 데이터가 있고 필요한 컬럼이 있는지 확인
+                if not df.empty and '키워드' in df.columns:
+                    return _fill_defaults(df), sheet_name
+                    
+            except Exception as sheet_error:
+                continue
+        
+        import pandas as pd
+        return pd.DataFrame(), None
+    
+    def _rewrite(self, sheet_name, df):
+        """시트 전체를 df로 다시 쓰기"""
+        with span('sheets.rewrite'):
+            if sheet_name:
+                self.conn.update(worksheet=sheet_name, data=df)
+            else:
+                self.conn.update(data=df)
+        count('sheets.writes')
+        count('sheets.rows_written', len(df))
+    
+    @staticmethod
+    def _read_row_numbers(worksheet, id_col_number):
+        """시트의 ID 열을 읽어 ID → 실제 시트 행 번호 (1행은 헤더)"""
+        ids = worksheet.col_values(id_col_number)
+        return {row_id: row_number for row_number, row_id in enumerate(ids, start=1) if row_number > 1 and row_id}
+    
+    def _write_missing_ids(self, sheet_name):
+        """키워드는 있는데 ID가 빈 시트 행에 새 ID 기록 (기존 시트 이전용), 기록한 행 수 반환
+        
+        쓸 위치는 시트의 키워드/ID 열을 직접 읽어 정하므로 빈 행이 끼어 있어도 다른 행에 쓰지 않습니다.
+        """
+        if not self.supports_row_writes:
+            return 0
+        worksheet, found_sheet_name, header = self._find_worksheet()
+        if worksheet is None or found_sheet_name != sheet_name or '키워드' not in header:
+            return 0
+        header = self._ensure_columns(worksheet, header)
+        keyword_col_number = header.index('키워드') + 1
+        id_col_number = header.index('ID') + 1
+        
+        keywords = worksheet.col_values(keyword_col_number)
+        ids = worksheet.col_values(id_col_number)
+        ids += [''] * (len(keywords) - len(ids))
+        cell_updates = [
+            {'range': _rowcol_to_a1(row_number, id_col_number), 'values': [[new_keyword_id()]]}
+            for row_number in range(2, len(keywords) + 1)
+            if keywords[row_number - 1].strip() and not ids[row_number - 1].strip()
+        ]
+        if cell_updates:
+            worksheet.batch_update(cell_updates, value_input_option='RAW')
+        return len(cell_updates)
+    
+    @instrumented('storage.load')
+    def load(self):
+        """키워드 시트 읽기 (ID 보정, 삭제 표시 행 제외)"""
+        df, sheet_name = self._read_raw()
+        self.location = sheet_name
+        if df.empty:
+            return df
+        
+        if 'ID' not in df.columns:
+            df['ID'] = ''
+        df['ID'] = df['ID'].fillna('').astype(str).str.strip()
+        if (df['ID'] == '').any():
+            with self._lock:
+                written = self._write_missing_ids(sheet_name)
+            if written:
+                # 시트에 새로 기록한 ID까지 다시 읽음 (기존 시트를 이전할 때 한 번뿐)
+                df, sheet_name = self._read_raw()
+            df['ID'] = df['ID'].fillna('').astype(str).str.strip()
+        # 시트에 기록하지 못한 행(행 단위 쓰기 미지원 등)은 이번 읽기에서만 쓰는 임시 ID
+        missing = df['ID'] == ''
+        if missing.any():
+            df.loc[missing, 'ID'] = [new_keyword_id() for _ in range(int(missing.sum()))]
+        
+        tombstone_count = int((df['삭제여부'] == TOMBSTONE).sum())
+        if tombstone_count:
+            df = df[df['삭제여부'] != TOMBSTONE]
+        
+        df.attrs['tombstone_count'] = tombstone_count
+        return df
+    
+    def _append_full_rewrite(self, new_df):
+        """기존 시트 전체를 읽어 새 행을 붙인 뒤 통째로 다시 쓰기 (행 추가 미지원 연결용)"""
+        import pandas as pd
+        
+        existing_df, used_sheet_name = self._read_raw()
+        
+        # 기존 데이터와 병합
+        if not existing_df.empty:
+            updated_df = pd.concat([existing_df, new_df], ignore_index=True)
+        else:
+            updated_df = new_df
+            used_sheet_name = "Sheet1"  # 기본 시트 이름
+        
+        self._rewrite(used_sheet_name, updated_df)
+        return used_sheet_name
+    
+    @instrumented('storage.append')
+    def append(self, rows):
+        """새 행만 시트 끝에 추가 (전송량은 시트 크기와 무관), 사용한 시트 이름 반환"""
+        with self._lock:
+            if not self.supports_row_writes:
+                import pandas as pd
+                new_df = pd.DataFrame([to_sheet_row(row) for row in rows], columns=SHEET_COLUMNS)
+                self.location = self._append_full_rewrite(new_df)
+                return self.location
+            
+            worksheet, sheet_name, header = self._find_worksheet()
+            if worksheet is None:
+                raise StorageError("행 추가가 가능한 워크시트가 없습니다")
+            
+            values = []
+            if not header:
+                # 빈 시트면 헤더부터 작성
+                header = list(SHEET_COLUMNS)
+                values.append(header)
+            else:
+                header = self._ensure_columns(worksheet, header)
+            
+            for row in rows:
+                values.append(to_sheet_row(row, header))
+            
+            worksheet.append_rows(values, value_input_option='USER_ENTERED', table_range='A1')
+            self.location = sheet_name
+            return sheet_name
+    
+    @instrumented('storage.patch')
+    def patch(self, edits):
+        """여러 행의 수정을 한 번의 batch_update로 기록 (값이 바뀌는 셀만), 시트에서 찾지 못한 ID 목록 반환
+        
+        행 위치는 ID 인덱스로 찾고 한 번의 batch_get으로 확인합니다. 인덱스에 없거나 다른 사용자의
+        추가/삭제로 어긋난 행이 있으면 시트의 ID 열을 한 번 읽어 인덱스를 실제 행 번호로 다시 만듭니다.
+        """
+        with self._lock:
+            if not self.supports_row_writes:
+                raise StorageError("행 단위 쓰기를 지원하지 않는 연결입니다")
+            
+            worksheet, sheet_name, header = self._find_worksheet()
+            if worksheet is None or not header:
+                raise StorageError("키워드 시트를 찾을 수 없습니다")
+            header = self._ensure_columns(worksheet, header)
+            unknown = {column for changes in edits.values() for column in changes} - set(header)
+            if unknown:
+                raise StorageError(f"알 수 없는 컬럼: {', '.join(sorted(unknown))}")
+            id_col_number = header.index('ID') + 1
+            
+            def row_range(row_number):
+                return f"A{row_number}:{_rowcol_to_a1(row_number, len(header))}"
+            
+            def locate(row_ids):
+                """인덱스의 행 번호로 행들을 한 번에 읽어 ID가 맞는 것만 {ID: (행 번호, 현재 값)}"""
+                row_ids = [row_id for row_id in row_ids if row_id in self._row_index]
+                fetched = worksheet.batch_get([row_range(self._row_index[row_id]) for row_id in row_ids]) if row_ids else []
+                found = {}
+                for row_id, value_range in zip(row_ids, fetched):
+                    current_row = list(value_range[0]) if value_range else []
+                    if len(current_row) >= id_col_number and current_row[id_col_number - 1] == row_id:
+                        found[row_id] = (self._row_index[row_id], current_row)
+                return found
+            
+            located = locate(edits)
+            unresolved = [row_id for row_id in edits if row_id not in located]
+            if unresolved:
+                # 인덱스에 없거나 어긋난 행: ID 열을 읽어 실제 행 번호로 인덱스를 다시 만든 뒤 한 번 더 확인
+                self._row_index = self._read_row_numbers(worksheet, id_col_number)
+                located.update(locate(unresolved))
+            missing = [row_id for row_id in edits if row_id not in located]
+            
+            # 실제로 값이 바뀌는 셀만 기록
+            cell_updates = []
+            for row_id, (row_number, current_row) in located.items():
+                current_row += [''] * (len(header) - len(current_row))
+                for column, value in edits[row_id].items():
+                    value = to_sheet_value(value)
+                    col_number = header.index(column) + 1
+                    if current_row[col_number - 1] != value:
+                        cell_updates.append({
+                            'range': _rowcol_to_a1(row_number, col_number),
+                            'values': [[value]]
+                        })
+            
+            if cell_updates:
+                worksheet.batch_update(cell_updates, value_input_option='USER_ENTERED')
+            return missing
+    
+    @instrumented('storage.compact')
+    def compact(self):
+        """삭제 표시된 행들을 시트에서 실제로 제거 (전체 한 번 읽고 쓰는 동안 다른 추가/수정은 기다림), 제거한 행 수 반환"""
+        with self._lock:
+            raw_df, sheet_name = self._read_raw()
+            if raw_df.empty:
+                return 0
+            
+            tombstones = raw_df['삭제여부'] == TOMBSTONE
+            removed = int(tombstones.sum())
+            if removed:
+                self._rewrite(sheet_name, raw_df[~tombstones].reset_index(drop=True))
+                self._row_index = {}
+            return removed
+
+# ---------------- 로컬 SQLite ----------------
+
+class SQLiteStore(KeywordStore):
+    """로컬 SQLite 저장소 (키워드/프로젝트명/날짜 인덱스, 네트워크 없이 실행·부하 테스트 가능)"""
+    
+    display_name = "SQLite"
+    
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.location = os.path.basename(path) or path
+        # 백그라운드 반영 스레드와 함께 쓰므로 연결 하나를 잠금으로 보호
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        
+        columns = ', '.join(f'"{col}" TEXT' + (' PRIMARY KEY' if col == 'ID' else '') for col in SHEET_COLUMNS)
+        with self._lock, self._db:
+            if path != ':memory:':
+                self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(f"CREATE TABLE IF NOT EXISTS keywords ({columns})")
+            self._db.execute('CREATE INDEX IF NOT EXISTS idx_keywords_keyword ON keywords ("키워드")')
+            self._db.execute('CREATE INDEX IF NOT EXISTS idx_keywords_project ON keywords ("프로젝트명")')
+            self._db.execute('CREATE INDEX IF NOT EXISTS idx_keywords_date ON keywords ("날짜")')
+    
+    @instrumented('storage.load')
+    def load(self):
+        """삭제 표시되지 않은 행을 저장 순서대로 읽기"""
+        import pandas as pd
+        
+        select_columns = ', '.join(f'"{col}"' for col in SHEET_COLUMNS)
+        with self._lock:
+            tombstone_count = self._db.execute(
+                'SELECT COUNT(*) FROM keywords WHERE "삭제여부" = ?', (TOMBSTONE,)
+            ).fetchone()[0]
+            df = pd.read_sql_query(
+                f'SELECT {select_columns} FROM keywords WHERE "삭제여부" != ? ORDER BY rowid',
+                self._db, params=(TOMBSTONE,)
+            )
+        count('sqlite.reads')
+        count('sqlite.rows_read', len(df))
+        
+        df.attrs['tombstone_count'] = tombstone_count
+        return df
+    
+    @instrumented('storage.append')
+    def append(self, rows):
+        """새 행 추가"""
+        placeholders = ', '.join('?' for _ in SHEET_COLUMNS)
+        with self._lock, self._db:
+            self._db.executemany(
+                f"INSERT INTO keywords VALUES ({placeholders})",
+                [to_sheet_row(row) for row in rows]
+            )
+        count('sqlite.writes')
+        count('sqlite.rows_written', len(rows))
+        return self.location
+    
+    @instrumented('storage.patch')
+    def patch(self, edits):
+        """{ID: {컬럼: 값}} 수정을 한 트랜잭션으로 반영, 찾지 못한 ID 목록 반환"""
+        missing = []
+        with self._lock, self._db:
+            for row_id, changes in edits.items():
+                unknown = set(changes) - set(SHEET_COLUMNS)
+                if unknown:
+                    raise StorageError(f"알 수 없는 컬럼: {', '.join(sorted(unknown))}")
+                if not changes:
+                    continue
+                
+                assignments = ', '.join(f'"{col}" = ?' for col in changes)
+                cursor = self._db.execute(
+                    f'UPDATE keywords SET {assignments} WHERE "ID" = ?',
+                    [*map(to_sheet_value, changes.values()), row_id]
+                )
+                if cursor.rowcount == 0:
+                    missing.append(row_id)
+        count('sqlite.writes')
+        count('sqlite.rows_written', len(edits) - len(missing))
+        return missing
+    
+    @instrumented('storage.compact')
+    def compact(self):
+        """삭제 표시된 행 제거"""
+        with self._lock, self._db:
+            cursor = self._db.execute('DELETE FROM keywords WHERE "삭제여부" = ?', (TOMBSTONE,))
+        count('sqlite.writes')
+        count('sqlite.rows_written', cursor.rowcount)
+        return cursor.rowcount
@@ -0,0 +1,180 @@
+"""키워드 수정 쓰기 지연 큐"""
+
+import threading
+import time
+from collections import deque
+
+from keyword_core.storage import TOMBSTONE, is_transient_error
+
+# 보관할 반영 포기 수정 수 (오래된 것부터 버림)
+DROPPED_LIMIT = 100
+
+# 실패가 이어질 때 다시 시도하기까지 최대 간격(초)
+MAX_RETRY_INTERVAL = 60.0
+
+class WriteBehindQueue:
+    """키워드 수정 사항을 모아 두었다가 백그라운드에서 일괄 반영하는 쓰기 지연 큐
+    
+    같은 행에 대한 수정은 하나로 합쳐지고, flush_fn({ID: {컬럼: 값}})으로 batch_size 행씩 반영합니다.
+    flush_fn은 저장소에서 찾지 못한 ID 목록을 돌려줍니다(KeywordStore.patch).
+    할당량 초과(429)·서버 오류·네트워크 오류로 실패한 수정은 큐에 되돌려 두고 점점 긴 간격(최대 60초)으로
+    반영될 때까지 다시 시도합니다. 다시 시도해도 소용없는 영구 오류(없는 컬럼 등)는 한 행씩 다시 반영해 문제 있는
+    행의 수정만 포기합니다(keyword_core.storage.is_transient_error). 포기한 수정과 찾지 못한 행의 수정은
+    dropped_edits()로 화면에 알리고 on_dropped(목록)을 부릅니다(화면에 이미 반영된 수정을 되돌리도록 캐시를 무효화하는 용도).
+    on_drained를 주면 백그라운드 루프가 큐가 빌 때마다 부릅니다(삭제 정리처럼 반영과 겹치면 안 되는 작업용).
+    """
+    
+    def __init__(self, flush_fn, interval, batch_size, on_drained=None, on_dropped=None):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.failures = 0
+        self.last_error = None
+        self._flush_fn = flush_fn
+        self._on_drained = on_drained
+        self._on_dropped = on_dropped
+        self._dropped = deque(maxlen=DROPPED_LIMIT)
+        self._pending = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="keyword-write-behind", daemon=True)
+        self._worker.start()
+    
+    def enqueue(self, row_id, changes):
+        """수정 사항 기록 (즉시 반환, 같은 행의 이전 수정과 합쳐짐)"""
+        with self._lock:
+            self._pending.setdefault(row_id, {}).update(changes)
+    
+    def pending_count(self):
+        """반영 대기 중인 행 수"""
+        with self._lock:
+            return len(self._pending)
+    
+    def pending_edits(self):
+        """반영 중이거나 대기 중인 수정 사항 사본 (시트를 다시 읽은 뒤 덮어씌울 때 사용)"""
+        with self._lock:
+            edits = {row_id: dict(changes) for row_id, changes in self._inflight.items()}
+            for row_id, changes in self._pending.items():
+                edits.setdefault(row_id, {}).update(changes)
+            return edits
+    
+    def dropped_edits(self):
+        """반영하지 못하고 포기한 수정 목록 사본 [{'id', 'changes', 'reason', 'at'}] (오래된 순)"""
+        with self._lock:
+            return list(self._dropped)
+    
+    def clear_dropped(self):
+        """화면에서 확인한 포기 목록 비우기"""
+        with self._lock:
+            self._dropped.clear()
+    
+    def flush(self):
+        """대기 중인 수정을 모두 반영하고 반영한 행 수 반환
+        
+        일시적 오류로 실패하면 남은 수정을 큐에 두고 멈춥니다(다음 주기에 다시 시도).
+        영구 오류인 행과 저장소에서 찾지 못한 행의 수정은 포기합니다.
+        """
+        flushed = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    row_ids = list(self._pending)[:self.batch_size]
+                    batch = {row_id: self._pending.pop(row_id) for row_id in row_ids}
+                    self._inflight = dict(batch)
+                if not batch:
+                    return flushed
+                
+                try:
+                    flushed += self._flush_batch(batch)
+                except Exception as e:
+                    self.failures += 1
+                    self.last_error = str(e)
+                    with self._lock:
+                        for row_id, changes in self._inflight.items():
+                            # 실패한 수정 위에 그 사이 들어온 새 수정을 덮어씀
+                            self._pending[row_id] = {**changes, **self._pending.get(row_id, {})}
+                        self._inflight = {}
+                    return flushed
+                
+                with self._lock:
+                    self._inflight = {}
+                self.failures = 0
+                self.last_error = None
+    
+    def flush_now(self):
+        """화면에서 바로 반영 요청 (flush 후 백그라운드 루프의 대기도 새로 시작), 반영한 행 수 반환
+        
+        실패가 이어져 길어진 대기 중이라도 반영에 성공하면 다음 수정부터는 원래 간격으로 반영됩니다.
+        """
+        flushed = self.flush()
+        if not self.failures:
+            self._wakeup.set()
+        return flushed
+    
+    def _flush_batch(self, batch):
+        """배치 하나를 반영하고 반영한 행 수 반환 (일시적 오류는 그대로 올림)
+        
+        영구 오류가 나면 어느 행 때문인지 모르므로 한 행씩 다시 반영해 문제 있는 행만 포기합니다.
+        반영을 마치거나 포기한 행은 반영 중 목록(_inflight)에서 빼므로, 도중에 일시적 오류가 나면 남은 행만 큐로 돌아갑니다.
+        """
+        try:
+            missing = self._flush_fn(batch) or []
+        except Exception as e:
+            if is_transient_error(e):
+                raise
+            if len(batch) == 1:
+                self._drop(batch, f"반영할 수 없는 수정: {e}")
+                return 0
+            flushed = 0
+            for row_id, changes in list(batch.items()):
+                flushed += self._flush_batch({row_id: changes})
+                with self._lock:
+                    self._inflight.pop(row_id, None)
+            return flushed
+        
+        # 다른 사용자가 지우거나 정리한 행의 수정 (이미 정리된 행의 삭제 표시는 반영된 것으로 봄)
+        conflicts = {
+            row_id: batch[row_id] for row_id in missing
+            if row_id in batch and batch[row_id].get('삭제여부') != TOMBSTONE
+        }
+        if conflicts:
+            self._drop(conflicts, "저장소에서 행을 찾을 수 없음 (다른 사용자가 삭제했거나 정리됨)")
+        return len(batch) - len(conflicts)
+    
+    def _drop(self, edits, reason):
+        """수정을 포기 목록에 기록하고 on_dropped 호출 (반영 중 목록에서도 뺌)"""
+        dropped_at = time.time()
+        entries = [{'id': row_id, 'changes': dict(changes), 'reason': reason, 'at': dropped_at}
+                   for row_id, changes in edits.items()]
+        with self._lock:
+            self._dropped.extend(entries)
+            for row_id in edits:
+                self._inflight.pop(row_id, None)
+        if self._on_dropped is not None:
+            self._on_dropped(entries)
+    
+    def run_if_drained(self, func):
+        """대기 중이거나 반영 중인 수정이 없을 때만 func()를 실행하고 결과 반환 (남은 수정이 있으면 None)
+        
+        실행하는 동안에는 flush가 기다리므로 func 안의 저장소 작업이 수정 반영과 겹치지 않습니다.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._pending or self._inflight:
+                    return None
+            return func()
+    
+    def _run(self):
+        """백그라운드 반영 루프 (실패가 이어지면 최대 MAX_RETRY_INTERVAL초까지 간격을 늘림)"""
+        while True:
+            self._wakeup.wait(timeout=min(MAX_RETRY_INTERVAL, self.interval * (2 ** min(self.failures, 16))))
+            self._wakeup.clear()
+            if self.pending_count():
+                self.flush()
+            if self._on_drained is not None and not self.failures:
+                try:
+                    self.run_if_drained(self._on_drained)
+                except Exception as e:
+                    # 다음 주기에 다시 시도
+                    self.last_error = str(e)
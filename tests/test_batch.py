@@ -0,0 +1,67 @@
+"""배치 추출의 입력 펼치기, 파일 순서, 배치 전체 중복 제거 검사"""
+
+import zipfile
+
+import pytest
+
+from keyword_core.batch import collect_sources, main, run_batch
+
+def page(*keywords):
+    return ''.join(f'<span class="keyword">{keyword}</span>' for keyword in keywords)
+
+@pytest.fixture
+def exports(tmp_path):
+    """b.html, a.html, 하위 폴더의 c.htm, 두 페이지가 든 zip, HTML이 아닌 파일"""
+    (tmp_path / 'b.html').write_text(page('캠핑 의자', 'Tent'), encoding='utf-8')
+    (tmp_path / 'a.html').write_text(page('캠핑의자', '등산화'), encoding='cp949')
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'c.htm').write_text(page('tent', '침낭'), encoding='utf-8')
+    with zipfile.ZipFile(tmp_path / 'week.zip', 'w') as zf:
+        zf.writestr('z2.html', page('버너'))
+        zf.writestr('z1.html', page('TENT', '랜턴'))
+        zf.writestr('notes.txt', '키워드 아님')
+    (tmp_path / 'notes.txt').write_text('키워드 아님', encoding='utf-8')
+    return tmp_path
+
+def names(sources, root):
+    return [source.name.replace(str(root), '').replace('\\', '/') for source in sources]
+
+def test_collect_sources_expands_folders_zips_and_globs_in_order(exports):
+    sources = collect_sources([str(exports), str(exports / 'b.html'), str(exports / '*.zip')])
+    
+    assert names(sources, exports) == ['/a.html', '/b.html', '/sub/c.htm', '/week.zip!z1.html', '/week.zip!z2.html']
+
+def test_collect_sources_rejects_missing_input(exports):
+    with pytest.raises(FileNotFoundError):
+        collect_sources([str(exports / '없는폴더' / '*.html')])
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_run_batch_keeps_the_first_file_for_each_keyword(exports, workers):
+    sources = collect_sources([str(exports)])
+    
+    results, summary = run_batch(sources, existing_keywords=['등산화'], workers=workers, limit=0)
+    
+    assert [(keyword, name.replace(str(exports), '').replace('\\', '/')) for keyword, name in results] == [
+        ('캠핑의자', '/a.html'),
+        ('Tent', '/b.html'),
+        ('침낭', '/sub/c.htm'),
+        ('랜턴', '/week.zip!z1.html'),
+        ('버너', '/week.zip!z2.html'),
+    ]
+    assert summary == {
+        'files': 5, 'failed_files': 0, 'total_found': 9, 'duplicates_removed': 1,
+        'batch_duplicates': 3, 'new_keywords': 5
+    }
+
+def test_main_writes_jsonl(exports, capsys):
+    output = exports / 'out.jsonl'
+    
+    code = main([str(exports / 'b.html'), str(exports / 'sub'), '-o', str(output), '--workers', '1'])
+    
+    assert code == 0
+    assert output.read_text(encoding='utf-8').splitlines() == [
+        '{"키워드": "캠핑 의자", "출처": "%s"}' % (exports / 'b.html'),
+        '{"키워드": "Tent", "출처": "%s"}' % (exports / 'b.html'),
+        '{"키워드": "침낭", "출처": "%s"}' % (exports / 'sub' / 'c.htm'),
+    ]
+    assert '새 키워드 3개' in capsys.readouterr().err
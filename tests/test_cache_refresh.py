@@ -0,0 +1,103 @@
+"""공유 캐시 다시 읽기와 쓰기 지연 큐 반영이 겹칠 때 우리 쪽 수정이 되돌아가지 않는지 검사"""
+
+import threading
+
+from keyword_core.cache import SheetCache, load_with_edits
+from keyword_core.fake_sheets import FakeSheetsConnection
+from keyword_core.storage import SHEET_COLUMNS, TOMBSTONE, GSheetsStore, new_keyword_rows, to_sheet_row
+from keyword_core.write_queue import WriteBehindQueue
+
+def make_setup():
+    rows = new_keyword_rows('프로젝트', ['aa', 'bb'])
+    conn = FakeSheetsConnection(worksheets={'키워드관리': [list(SHEET_COLUMNS)] + [to_sheet_row(row) for row in rows]})
+    store = GSheetsStore(conn)
+    # 백그라운드 주기 반영은 사실상 끄고 flush()로만 반영
+    queue = WriteBehindQueue(store.patch, interval=3600, batch_size=10)
+    cache = SheetCache(ttl=3600)
+    cache.get(lambda: load_with_edits(store.load, queue.pending_edits))
+    return store, queue, cache, rows[0]['ID']
+
+def cached_value(cache, row_id, column):
+    df = cache.get(lambda: None)
+    return df.loc[df['ID'] == row_id, column].tolist()
+
+def test_refresh_racing_a_flush_keeps_our_edit():
+    store, queue, cache, row_id = make_setup()
+    queue.enqueue(row_id, {'사용여부': True})
+    cache.apply_changes(row_id, {'사용여부': True})
+    
+    loaded = threading.Event()
+    flushed = threading.Event()
+    
+    def load_then_wait():
+        # 반영 전의 시트를 읽은 뒤, 읽기가 끝나기 전에 반영이 끝나도록 기다림
+        df = store.load()
+        loaded.set()
+        flushed.wait(5)
+        return df
+    
+    refresh = threading.Thread(
+        target=cache._refresh, args=(lambda: load_with_edits(load_then_wait, queue.pending_edits), cache.version)
+    )
+    refresh.start()
+    loaded.wait(5)
+    assert queue.flush() == 1
+    flushed.set()
+    refresh.join()
+    
+    assert queue.pending_edits() == {}
+    assert cached_value(cache, row_id, '사용여부') == [True]
+    assert store.load().set_index('ID').at[row_id, '사용여부'] == '✅'
+
+def test_edit_queued_during_refresh_is_applied_on_top():
+    store, queue, cache, row_id = make_setup()
+    
+    def load_then_edit():
+        df = store.load()
+        queue.enqueue(row_id, {'메모': '읽는 도중 수정'})
+        return df
+    
+    cache._refresh(lambda: load_with_edits(load_then_edit, queue.pending_edits), cache.version)
+    
+    assert cached_value(cache, row_id, '메모') == ['읽는 도중 수정']
+
+def loaded_cache(keywords):
+    rows = new_keyword_rows('프로젝트', keywords)
+    conn = FakeSheetsConnection(worksheets={'키워드관리': [list(SHEET_COLUMNS)] + [to_sheet_row(row) for row in rows]})
+    cache = SheetCache(ttl=3600)
+    cache.get(GSheetsStore(conn).load)
+    return cache, [row['ID'] for row in rows]
+
+def test_deleted_last_row_label_is_not_reused():
+    cache, row_ids = loaded_cache(['aa', 'bb'])
+    cache.search_index()
+    cache.apply_changes(row_ids[-1], {'삭제여부': TOMBSTONE})
+    new_row = new_keyword_rows('프로젝트', ['cc'])[0]
+    cache.add_rows([new_row])
+    
+    # 지운 행에 대한 늦은 수정과 두 번째 삭제가 새 행을 건드리면 안 됨
+    cache.apply_changes(row_ids[-1], {'메모': '늦게 온 수정'})
+    cache.discard(row_ids[-1])
+    
+    df = cache.get(lambda: None)
+    assert list(df['ID']) == [row_ids[0], new_row['ID']]
+    assert df['메모'].tolist() == ['', '']
+    assert cache.stats.total == 2
+    assert cache.tombstone_count == 1
+    assert 'cc' in cache.keyword_index and 'bb' not in cache.keyword_index
+    assert df.loc[cache.search_index().search('cc'), 'ID'].tolist() == [new_row['ID']]
+
+def test_labels_keep_increasing_after_deletes():
+    cache, row_ids = loaded_cache(['aa', 'bb', 'cc'])
+    for row_id in row_ids:
+        cache.discard(row_id)
+    first = new_keyword_rows('프로젝트', ['dd'])
+    second = new_keyword_rows('프로젝트', ['ee'])
+    cache.add_rows(first)
+    cache.discard(first[0]['ID'])
+    cache.add_rows(second)
+    
+    df = cache.get(lambda: None)
+    assert df.index.is_unique
+    assert list(df['ID']) == [second[0]['ID']]
+    assert list(df.index) == [len(row_ids) + 1]
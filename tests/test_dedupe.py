@@ -0,0 +1,65 @@
+"""정규화 키 기준 중복 검사(normalize_keyword, KeywordIndex) 검사"""
+
+import pickle
+
+import pandas as pd
+import pytest
+
+from keyword_core.dedupe import KeywordIndex, as_keyword_index, normalize_keyword
+
+@pytest.mark.parametrize('left, right', [
+    ('다이어트 식단', '다이어트식단'),
+    ('ＤＩＥＴ', 'diet'),
+    ('Diet\u3000Plan', 'dietplan'),
+    (' 캠핑\t의자\u00a0', '캠핑의자'),
+    ('STRASSE', 'straße'),
+    ('㎏ 단위', 'kg단위'),
+])
+def test_variants_share_a_normalized_key(left, right):
+    assert normalize_keyword(left) == normalize_keyword(right)
+
+def test_different_keywords_keep_different_keys():
+    assert normalize_keyword('캠핑 의자') != normalize_keyword('캠핑 의자 추천')
+    assert normalize_keyword('가방') != normalize_keyword('가빙')
+
+def test_index_matches_variants_and_returns_the_stored_spelling():
+    index = KeywordIndex(['다이어트 식단', 'Camping'])
+    
+    assert 'ＣＡＭＰＩＮＧ' in index
+    assert '다이어트식단' in index
+    assert '다이어트' not in index
+    assert index.match(' camping ') == 'Camping'
+    assert index.match('') is None and None not in index
+    assert len(index) == 2
+
+def test_discard_by_row_id_keeps_keys_other_rows_still_use():
+    index = KeywordIndex()
+    index.add('캠핑 의자', 'r1')
+    index.add('캠핑의자', 'r2')
+    index.add('캠핑의자', 'r2')  # 같은 행을 두 번 더해도 한 번으로 셈
+    
+    index.discard('r1')
+    assert '캠핑 의자' in index
+    
+    index.discard('r2')
+    index.discard('r2')
+    assert '캠핑 의자' not in index and len(index) == 0
+
+def test_from_frame_reads_numeric_and_blank_keyword_cells():
+    df = pd.DataFrame({'키워드': ['텐트', 2024.0, float('nan'), ' '], 'ID': ['a', 'b', 'c', 'd']})
+    
+    index = KeywordIndex.from_frame(df)
+    
+    assert '2024' in index and '텐트' in index
+    assert len(index) == 2
+    index.discard('b')
+    assert '2024' not in index
+
+def test_index_survives_pickling_for_worker_processes():
+    index = as_keyword_index(['Tent'])
+    
+    copy = pickle.loads(pickle.dumps(index))
+    copy.add('침낭', 'x')
+    
+    assert as_keyword_index(copy) is copy
+    assert 'TENT' in copy and '침낭' in copy and '침낭' not in index
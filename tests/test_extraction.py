@@ -0,0 +1,61 @@
+"""스트리밍 추출이 기존 BeautifulSoup 방식과 같은 태그와 결과를 내는지 검사"""
+
+import pytest
+
+from benchmarks.bench_extraction import legacy_extract, legacy_tag_texts
+from benchmarks.generators import make_keyword_page
+from keyword_core.extraction import dedupe_keywords, extract_keywords, iter_tag_texts
+
+# BeautifulSoup html.parser 트리 규칙이 갈리는 경우들
+EDGE_CASES = [
+    '<div class="keyword">  캠핑 <b>의자</b> </div><span class="keyword-blur">여름&nbsp;캠핑</span>',
+    '<td class="end-board-td-blur">1,234<br>회</td><td class="end-board-td-blur"><img src="x">노트북</td>',
+    '<p class="keyword">안 닫힌 <i>태그<p class="keyword">다음 문단</p>',
+    '<div class="keyword">바깥<span class="keyword">안쪽</span></div>',
+    '<span class="keyword"><!-- 주석 -->주석 뒤</span><script>var s = "<span class=\'keyword\'>x</span>";</script>',
+    '<style>.keyword{}</style><template><span class="keyword">템플릿</span></template>',
+    '<ul><li class="keyword">하나<li class="keyword">둘</ul><span class="KEYWORD">대문자</span>',
+    '<span class="keyword highlight">여러 클래스</span><span class="keywords">비슷한 클래스</span>',
+    '<div class="keyword">끝나지 않은 문서',
+]
+
+@pytest.mark.parametrize('html', EDGE_CASES)
+def test_tag_texts_match_beautifulsoup(html):
+    assert list(iter_tag_texts(html)) == legacy_tag_texts(html)
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_generated_page_matches_beautifulsoup(seed):
+    existing = ['다이어트 식단', '캠핑']
+    html = make_keyword_page(0.1, duplicate_ratio=0.3, seed=seed, existing_keywords=existing)
+    texts = legacy_tag_texts(html)
+    
+    assert list(iter_tag_texts(html)) == texts
+    assert extract_keywords(html, existing) == dedupe_keywords(texts, existing)
+
+def test_matches_baseline_result_without_normalized_duplicates():
+    # 정규화해야 같아지는 중복이 없으면 기존 방식과 키워드 목록·추출 정보까지 같음
+    html = make_keyword_page(0.05, duplicate_ratio=0.0, seed=3)
+    legacy_keywords, legacy_info = legacy_extract(html)
+    keywords, info = extract_keywords(html)
+    
+    assert keywords == legacy_keywords
+    assert {key: info[key] for key in legacy_info} == legacy_info
+
+class _TrickleReader:
+    """요청한 크기와 상관없이 몇 글자씩만 돌려주는 파일 객체 (태그·엔티티 중간에서 조각이 끊기도록)"""
+    
+    def __init__(self, text, size=7):
+        self._text = text
+        self._size = size
+        self._position = 0
+    
+    def read(self, size=-1):
+        chunk = self._text[self._position:self._position + self._size]
+        self._position += len(chunk)
+        return chunk
+
+def test_chunk_boundaries_do_not_change_the_result():
+    html = ''.join(EDGE_CASES) + make_keyword_page(0.02, seed=4)
+    
+    assert list(iter_tag_texts(_TrickleReader(html))) == legacy_tag_texts(html)
+    assert extract_keywords(_TrickleReader(html)) == extract_keywords(html)
@@ -0,0 +1,90 @@
+"""가짜 구글시트 연결이 실제 연결(gspread_dataframe.get_as_dataframe)과 같은 DataFrame을 돌려주는지 검사"""
+
+import pandas as pd
+import pytest
+
+from keyword_core.fake_sheets import FakeSheetsConnection, RateLimitError
+
+GRIDS = [
+    [['키워드', 'ID', '메모', '날짜'], ['a', 'x1', '', '2024-01-01 00:00:00'], [], ['b', 'x2', 'm', '3'],
+     ['', '', '', ''], ['c', '123', '', '']],
+    [['키워드', '', 'ID'], ['a', '', '1'], ['', '', '']],
+]
+
+class _Worksheet:
+    """get_as_dataframe가 쓰는 만큼만 흉내 낸 gspread 워크시트 (시트 크기는 기본 26열)"""
+    
+    def __init__(self, grid):
+        self.title = 'k'
+        self.row_count = len(grid)
+        self.col_count = 26
+        self.spreadsheet = self
+        self._grid = grid
+    
+    def values_get(self, *args, **kwargs):
+        return {'values': [list(line) for line in self._grid]}
+
+@pytest.mark.parametrize('options', [{}, {'dtype': {'ID': str}}])
+@pytest.mark.parametrize('grid', GRIDS)
+def test_read_matches_get_as_dataframe(grid, options):
+    gspread_dataframe = pytest.importorskip('gspread_dataframe')
+    expected = gspread_dataframe.get_as_dataframe(_Worksheet(grid), evaluate_formulas=True, **options)
+    
+    df = FakeSheetsConnection(worksheets={'k': grid}).read(worksheet='k', **options)
+    
+    pd.testing.assert_frame_equal(df, expected)
+
+def test_read_keeps_sheet_row_offsets_as_index():
+    grid = GRIDS[0]
+    df = FakeSheetsConnection(worksheets={'k': grid}).read(worksheet='k')
+    assert list(df.index) == [0, 2, 4]
+
+def test_read_empty_sheet_raises_like_the_real_connection():
+    with pytest.raises(pd.errors.EmptyDataError):
+        FakeSheetsConnection(worksheets={'k': []}).read(worksheet='k')
+
+class _Clock:
+    """실제로 기다리지 않고 sleep 만큼 시간만 흐르는 시계"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.now += seconds
+
+def test_latency_and_rate_limit_follow_the_clock():
+    clock = _Clock()
+    conn = FakeSheetsConnection(
+        worksheets={'k': [['키워드'], ['a']]}, latency={'row_values': 0.5}, row_latency=0.1,
+        rate_limit=2, rate_window=10, clock=clock, sleep=clock.sleep,
+    )
+    worksheet = conn.client._select_worksheet(worksheet='k')
+    assert clock.now == 0
+    
+    assert worksheet.row_values(2) == ['a']
+    assert clock.now == pytest.approx(0.6)
+    with pytest.raises(RateLimitError):
+        worksheet.row_values(1)
+    assert conn.rejected == 1
+    
+    clock.now = 10.0
+    assert worksheet.row_values(1) == ['키워드']
+    # 거절된 호출도 호출 수에 셈 (열기도 할당량을 씀)
+    assert conn.calls == {'open': 1, 'row_values': 3}
+
+def test_fail_next_and_consistency_delay():
+    clock = _Clock()
+    conn = FakeSheetsConnection(worksheets={'k': [['키워드']]}, consistency_delay=2, clock=clock, sleep=clock.sleep)
+    worksheet = conn.client._select_worksheet(worksheet='k')
+    conn.fail_next(1)
+    with pytest.raises(RateLimitError):
+        worksheet.append_rows([['a']])
+    
+    worksheet.append_rows([['a']])
+    # 쓰기는 consistency_delay가 지나야 읽기에 보임
+    assert worksheet.col_values(1) == ['키워드']
+    clock.now = 2.0
+    assert worksheet.col_values(1) == ['키워드', 'a']
@@ -0,0 +1,104 @@
+"""관리 화면 필터 엔진 검사: 조건 컴파일, 단순 pandas 필터와 같은 결과, 버전별 마스크 캐시"""
+
+import itertools
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from benchmarks.generators import make_keyword_table
+from keyword_core.filters import DATE_RANGES, FilterEngine, compile_filters
+from keyword_core.frame import set_typed_value, to_typed_frame
+
+TODAY = datetime(2024, 6, 30, 18, 0, 0)
+
+def test_compile_filters():
+    assert compile_filters() == ()
+    assert compile_filters('캠핑', '프로젝트01', '사용함(✅)', '미작성(❌)', '작성함(✅)', '최근 3일', today=TODAY) == (
+        ('search', None, '캠핑'),
+        ('eq', '프로젝트명', '프로젝트01'),
+        ('eq', '사용여부', True),
+        ('eq', '티스토리작성', False),
+        ('eq', '블로그스팟작성', True),
+        ('since', '날짜', '2024-06-28'),
+    )
+
+@pytest.mark.parametrize('date, since', [('오늘', '2024-06-30'), ('최근 3일', '2024-06-28'),
+                                         ('최근 일주일', '2024-06-24'), ('최근 한달', '2024-06-01')])
+def test_date_ranges_include_today(date, since):
+    assert compile_filters(date=date, today=TODAY) == (('since', '날짜', since),)
+    # 같은 날이면 시각과 상관없이 같은 조건 (마스크 재사용)
+    assert compile_filters(date=date, today=TODAY.replace(hour=0)) == compile_filters(date=date, today=TODAY)
+
+def expected_rows(df, search='', project='전체', usage='전체', tistory='전체', date='전체'):
+    """조건을 pandas로 하나씩 적용한 기존 방식의 결과 라벨"""
+    result = df
+    if search:
+        hit = pd.Series(False, index=result.index)
+        for column in ('키워드', '프로젝트명', '메모'):
+            hit |= result[column].astype(object).str.contains(search, case=False, na=False, regex=False)
+        result = result[hit]
+    if project != '전체':
+        result = result[result['프로젝트명'] == project]
+    if usage != '전체':
+        result = result[result['사용여부'] == (usage == '사용함(✅)')]
+    if tistory != '전체':
+        result = result[result['티스토리작성'] == (tistory == '작성함(✅)')]
+    if date != '전체':
+        start = datetime.combine((TODAY - timedelta(days=DATE_RANGES[date] - 1)).date(), datetime.min.time())
+        result = result[pd.to_datetime(result['날짜']) >= start]
+    return list(result.index)
+
+@pytest.fixture(scope='module')
+def table():
+    return to_typed_frame(make_keyword_table(3000, seed=21, now=TODAY, days=60))
+
+def test_masks_match_plain_pandas_filters(table):
+    engine = FilterEngine()
+    choices = itertools.product(['', '다이어트'], ['전체', '프로젝트02'], ['전체', '사용함(✅)', '미사용(❌)'],
+                                ['전체', '미작성(❌)'], ['전체', *DATE_RANGES])
+    
+    for search, project, usage, tistory, date in choices:
+        conditions = compile_filters(search, project, usage, tistory, date=date, today=TODAY)
+        result, _ = engine.apply(table, 1, conditions)
+        assert list(result.index) == expected_rows(table, search, project, usage, tistory, date), conditions
+    assert engine.hits > engine.misses
+
+def test_string_dates_filter_like_typed_dates(table):
+    raw = make_keyword_table(3000, seed=21, now=TODAY, days=60)
+    engine = FilterEngine()
+    
+    for date in DATE_RANGES:
+        conditions = compile_filters(date=date, today=TODAY)
+        assert list(engine.apply(raw, 1, conditions)[0].index) == list(engine.apply(table, 1, conditions)[0].index)
+
+def test_masks_are_reused_within_a_version_and_rebuilt_after_it_changes():
+    df = to_typed_frame(make_keyword_table(200, seed=22))
+    engine = FilterEngine()
+    conditions = compile_filters(usage='사용함(✅)')
+    
+    used = engine.mask(df, 1, conditions).sum()
+    engine.mask(df, 1, conditions)
+    assert (engine.hits, engine.misses) == (1, 1)
+    
+    label = df.index[~df['사용여부'].to_numpy(dtype=bool)][0]
+    set_typed_value(df, label, '사용여부', True)
+    assert engine.mask(df, 1, conditions).sum() == used  # 같은 버전이면 캐시 그대로
+    assert engine.mask(df, 2, conditions).sum() == used + 1
+    assert engine.misses == 2
+
+def test_sorting_and_summary(table):
+    engine = FilterEngine()
+    conditions = compile_filters(project='프로젝트01')
+    
+    result, mask = engine.apply(table, 1, conditions, sort_option='키워드명 순')
+    
+    expected = table[table['프로젝트명'] == '프로젝트01'].sort_values('키워드', kind='stable')
+    assert list(result.index) == list(expected.index)
+    assert engine.summary(table, 1, mask) == {
+        'total': len(expected),
+        'used': int(expected['사용여부'].sum()),
+        'unused': int((~expected['사용여부'].astype(bool)).sum()),
+        'tistory': int(expected['티스토리작성'].sum()),
+        'blogspot': int(expected['블로그스팟작성'].sum()),
+    }
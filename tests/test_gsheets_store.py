@@ -0,0 +1,247 @@
+"""GSheetsStore를 가짜 구글시트 연결로 검사"""
+
+import threading
+
+import pytest
+
+from keyword_core.fake_sheets import FakeSheetsConnection
+from keyword_core.instrumentation import METRICS
+from keyword_core.storage import (
+    SHEET_COLUMNS, TOMBSTONE, GSheetsStore, StorageError, new_keyword_id, new_keyword_rows, to_sheet_row
+)
+
+SHEET = '키워드관리'
+
+def make_store(grid, **options):
+    conn = FakeSheetsConnection(worksheets={SHEET: grid}, **options)
+    return GSheetsStore(conn), conn
+
+def sheet_rows(conn):
+    """헤더 기준 {컬럼: 값} 행 목록 (빈 행은 None)"""
+    values = conn.worksheet_values(SHEET)
+    header = values[0]
+    return [dict(zip(header, line + [''] * (len(header) - len(line)))) if any(line) else None for line in values[1:]]
+
+def seeded_store(keywords, tombstoned=(), **options):
+    """키워드 행들이 들어 있는 시트의 저장소, 연결, {키워드: ID} (tombstoned 위치의 행은 삭제 표시)"""
+    rows = new_keyword_rows('프로젝트', keywords)
+    for position in tombstoned:
+        rows[position]['삭제여부'] = TOMBSTONE
+    store, conn = make_store([list(SHEET_COLUMNS)] + [to_sheet_row(row) for row in rows], **options)
+    return store, conn, {row['키워드']: row['ID'] for row in rows}
+
+def test_append_writes_header_on_empty_sheet_and_appends_after_data():
+    store, conn = make_store([])
+    store.append(new_keyword_rows('p', ['aa']))
+    store.append(new_keyword_rows('p', ['bb', 'cc']))
+    
+    values = conn.worksheet_values(SHEET)
+    assert values[0] == SHEET_COLUMNS
+    assert [line[SHEET_COLUMNS.index('키워드')] for line in values[1:]] == ['aa', 'bb', 'cc']
+    assert list(store.load()['키워드']) == ['aa', 'bb', 'cc']
+
+def test_append_sends_only_new_rows_and_reuses_the_worksheet():
+    rows = new_keyword_rows('p', [f'키워드{i}' for i in range(50)])
+    store, conn = make_store([list(SHEET_COLUMNS)] + [to_sheet_row(row) for row in rows])
+    store.append(new_keyword_rows('p', ['처음']))
+    conn.calls.clear()
+    
+    store.append(new_keyword_rows('p', ['다음']))
+    
+    # 시트를 다시 열거나 전체를 읽지 않고 헤더 한 줄 읽기 + 행 추가 한 번
+    assert conn.calls == {'row_values': 1, 'append_rows': 1}
+    assert sheet_rows(conn)[-1]['키워드'] == '다음'
+
+def test_opening_the_worksheet_is_timed_and_counted():
+    store, conn = make_store([list(SHEET_COLUMNS)])
+    # 첫 후보 시트 이름이 없어 두 번째 이름에서 찾음
+    conn._book['Sheet1'] = conn._book.pop(SHEET)
+    
+    with METRICS.run('test') as record:
+        store.append(new_keyword_rows('p', ['aa']))
+        store.append(new_keyword_rows('p', ['bb']))
+    
+    assert record.counters['sheets.opens'] == conn.calls['open'] == 2
+    assert record.spans['sheets.open'][0] == 2
+    assert record.counters['sheets.reads'] == 2 + conn.calls['row_values']
+
+def test_append_finds_the_sheet_again_after_it_disappears():
+    store, conn = make_store([list(SHEET_COLUMNS)])
+    store.append(new_keyword_rows('p', ['aa']))
+    # 다른 사용자가 키워드 시트 이름을 바꿈
+    conn._book['Sheet1'] = conn._book.pop(SHEET)
+    
+    store.append(new_keyword_rows('p', ['bb']))
+    
+    assert store.location == 'Sheet1'
+    assert [line[SHEET_COLUMNS.index('키워드')] for line in conn.worksheet_values('Sheet1')[1:]] == ['aa', 'bb']
+
+def test_patch_writes_only_changed_cells():
+    store, conn, ids = seeded_store(['aa', 'bb', 'cc'])
+    store.load()
+    conn.calls.clear()
+    
+    assert store.patch({ids['bb']: {'메모': '메모', '사용여부': False}, ids['cc']: {'티스토리작성': True}}) == []
+    
+    assert conn.calls['batch_update'] == 1
+    assert conn.calls['read'] == 0
+    rows = {row['키워드']: row for row in sheet_rows(conn)}
+    assert (rows['bb']['메모'], rows['bb']['사용여부']) == ('메모', '❌')
+    assert rows['cc']['티스토리작성'] == '✅'
+    assert (rows['aa']['메모'], rows['aa']['티스토리작성']) == ('', '❌')
+
+def test_patch_without_changes_writes_nothing():
+    store, conn, ids = seeded_store(['aa'])
+    store.patch({ids['aa']: {'메모': '같은 값'}})
+    conn.calls.clear()
+    
+    assert store.patch({ids['aa']: {'메모': '같은 값', '사용여부': False}}) == []
+    assert conn.calls['batch_update'] == 0
+
+def test_patch_returns_ids_not_on_the_sheet():
+    store, conn, ids = seeded_store(['aa'])
+    
+    assert store.patch({'없는ID': {'메모': 'x'}, ids['aa']: {'메모': 'y'}}) == ['없는ID']
+    assert sheet_rows(conn)[0]['메모'] == 'y'
+
+def test_patch_with_unknown_column_raises_without_writing():
+    store, conn, ids = seeded_store(['aa'])
+    
+    with pytest.raises(StorageError, match="알 수 없는 컬럼: 없는컬럼"):
+        store.patch({ids['aa']: {'메모': 'x', '없는컬럼': 'y'}})
+    assert conn.calls['batch_update'] == 0
+
+def test_patch_without_row_writes_raises():
+    class ReadOnlyConnection:
+        def read(self, worksheet=None, ttl=None):
+            raise FileNotFoundError(worksheet)
+    
+    with pytest.raises(StorageError, match="행 단위 쓰기"):
+        GSheetsStore(ReadOnlyConnection()).patch({'id': {'메모': 'x'}})
+
+def test_new_ids_never_look_like_numbers():
+    for _ in range(2000):
+        row_id = new_keyword_id()
+        assert len(row_id) == 12
+        with pytest.raises(ValueError):
+            float(row_id)
+
+def test_numeric_looking_ids_are_read_as_text():
+    header = list(SHEET_COLUMNS)
+    id_col = header.index('ID')
+    grid = [header]
+    for keyword, row_id in [('aa', '012345678901'), ('bb', '123e45678901'), ('cc', '123456789012')]:
+        row = to_sheet_row(new_keyword_rows('p', [keyword])[0])
+        row[id_col] = row_id
+        grid.append(row)
+    store, conn = make_store(grid)
+    
+    df = store.load()
+    
+    assert list(df['ID']) == ['012345678901', '123e45678901', '123456789012']
+    assert store.patch({'012345678901': {'메모': 'x'}, '123e45678901': {'메모': 'y'}}) == []
+    assert [row['메모'] for row in sheet_rows(conn)] == ['x', 'y', '']
+
+def test_load_backfills_ids_on_the_right_rows_around_blank_rows():
+    header = ['날짜', '프로젝트명', '키워드', '사용여부', '메모']
+    store, conn = make_store([
+        header,
+        ['2024-01-01 00:00:00', 'p', 'aa', '❌', ''],
+        [],
+        ['2024-01-01 00:00:00', 'p', 'bb', '❌', ''],
+        ['', '', '', '', ''],
+        ['2024-01-01 00:00:00', 'p', 'cc', '❌', ''],
+    ])
+    
+    df = store.load()
+    
+    rows = sheet_rows(conn)
+    assert rows[1] is None and rows[3] is None
+    ids_on_sheet = {row['키워드']: row['ID'] for row in rows if row}
+    assert dict(zip(df['키워드'], df['ID'])) == ids_on_sheet
+    assert len(set(ids_on_sheet.values())) == 3 and all(ids_on_sheet.values())
+
+def test_patch_after_blank_rows_writes_the_target_row():
+    store, conn, ids = seeded_store(['aa', 'bb', 'cc'])
+    # 사람이 bb 행의 값을 지워 빈 행이 됨
+    conn.client._select_worksheet(worksheet=SHEET).update(range_name='A3', values=[[''] * len(SHEET_COLUMNS)])
+    store.load()
+    
+    missing = store.patch({ids['cc']: {'메모': 'cc 메모', '사용여부': True}, ids['bb']: {'메모': 'x'}})
+    
+    assert missing == [ids['bb']]
+    rows = [row for row in sheet_rows(conn) if row]
+    assert [(row['키워드'], row['메모'], row['사용여부']) for row in rows] == [('aa', '', '❌'), ('cc', 'cc 메모', '✅')]
+
+def test_patch_finds_rows_moved_by_someone_else():
+    store, conn, ids = seeded_store(['aa', 'bb', 'cc'])
+    store.patch({ids['aa']: {'메모': '처음'}})
+    # 다른 사용자가 aa 행을 지워 아래 행들이 한 칸씩 올라감
+    conn.client._select_worksheet(worksheet=SHEET).delete_rows(2)
+    
+    assert store.patch({ids['cc']: {'메모': 'cc 메모'}}) == []
+    
+    rows = {row['키워드']: row for row in sheet_rows(conn)}
+    assert (rows['bb']['메모'], rows['cc']['메모']) == ('', 'cc 메모')
+
+def test_load_filters_tombstones_without_compacting():
+    store, conn, ids = seeded_store(['aa', 'bb', 'cc'], tombstoned=[1])
+    
+    df = store.load()
+    
+    assert list(df['키워드']) == ['aa', 'cc']
+    assert df.attrs['tombstone_count'] == 1
+    assert len(conn.worksheet_values(SHEET)) == 4
+    assert conn.calls['update_sheet'] == 0
+
+def test_compact_removes_tombstones_and_later_patches_still_find_rows():
+    store, conn, ids = seeded_store(['aa', 'bb', 'cc', 'dd'], tombstoned=[0, 2])
+    store.patch({ids['dd']: {'메모': '전'}})
+    
+    assert store.compact() == 2
+    assert store.compact() == 0
+    assert store.patch({ids['dd']: {'메모': '후'}}) == []
+    
+    assert [(row['키워드'], row['메모']) for row in sheet_rows(conn)] == [('bb', ''), ('dd', '후')]
+
+def test_concurrent_patch_append_and_compact_keep_every_write_on_its_row():
+    keywords = [f'키워드{i}' for i in range(30)]
+    # 정리의 다시 쓰기가 오래 걸려, 잠금이 없으면 그 사이의 행 단위 쓰기가 덮어써지거나 엉뚱한 행에 들어감
+    latency = {'read': 0.01, 'update_sheet': 0.2, 'open': 0.002, 'row_values': 0.002, 'col_values': 0.002,
+               'batch_get': 0.002, 'batch_update': 0.002, 'append_rows': 0.002}
+    store, conn, ids = seeded_store(keywords, tombstoned=range(1, 30, 2), latency=latency)
+    store.load()
+    live = keywords[0::2]
+    errors = []
+    
+    def run(func):
+        try:
+            func()
+        except Exception as e:
+            errors.append(e)
+    
+    def patch_memos():
+        for keyword in live:
+            store.patch({ids[keyword]: {'메모': f'{keyword} 메모'}})
+    
+    def patch_used():
+        for keyword in reversed(live):
+            store.patch({ids[keyword]: {'사용여부': True}})
+    
+    def append_some():
+        for i in range(5):
+            store.append(new_keyword_rows('추가', [f'새키워드{i}']))
+    
+    threads = [threading.Thread(target=run, args=(func,)) for func in (patch_memos, store.compact, append_some, patch_used)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    rows = [row for row in sheet_rows(conn) if row]
+    by_keyword = {row['키워드']: row for row in rows}
+    assert len(by_keyword) == len(rows) == len(live) + 5
+    assert all((by_keyword[keyword]['메모'], by_keyword[keyword]['사용여부']) == (f'{keyword} 메모', '✅') for keyword in live)
+    assert all((by_keyword[f'새키워드{i}']['메모'], by_keyword[f'새키워드{i}']['사용여부']) == ('', '❌') for i in range(5))
+    assert not any(row['삭제여부'] == TOMBSTONE for row in rows)
@@ -0,0 +1,11 @@
+"""짧은 부하 테스트 회귀 검사 (가짜 구글시트, 빈 행이 낀 시트에서 세션 2개)"""
+
+from benchmarks.load_test import assert_thresholds, run_load_test
+
+def test_short_load_test_on_fake_sheets():
+    report = run_load_test(sessions=2, rows=200, blank_rows=10, select_count=2, page_kb=10,
+                           flush_interval=0.2, timeout=60)
+    
+    assert report['latency_ms']['overall']['count'] > 0
+    # 세션 흐름 오류와 저장소 검사(수정/삭제가 제 행에 들어갔는지) 문제가 하나도 없어야 함
+    assert_thresholds(report, max_p95_ms=5000, max_reads_per_session=10, max_errors=0)
@@ -0,0 +1,74 @@
+"""추출 프로필: 선택자 컴파일, 값 규칙, 자동 감지 검사"""
+
+import pytest
+
+from keyword_core.extraction import extract_keywords
+from keyword_core.profiles import ExtractionProfile, SimpleSelector, compile_selectors, load_profiles
+
+def matches(selector, tag, **attrs):
+    attrs = {name.rstrip('_'): value for name, value in attrs.items()}
+    return SimpleSelector(selector).matches(tag, attrs, frozenset(attrs.get('class', '').split()))
+
+def test_selector_is_compiled_into_tag_classes_id_and_attributes():
+    selector = SimpleSelector(' TD.kw.blur#main[data-keyword][href^="/search"] ')
+    
+    assert selector.text == 'TD.kw.blur#main[data-keyword][href^="/search"]'
+    assert selector.tag == 'td'
+    assert selector.classes == {'kw', 'blur'}
+    assert selector.element_id == 'main'
+    assert selector.attributes == [('data-keyword', None, None), ('href', '^=', '/search')]
+
+@pytest.mark.parametrize('selector', ['div span.keyword', 'ul > li', 'li:nth-child(2)', '', '.'])
+def test_unsupported_selectors_are_rejected(selector):
+    with pytest.raises(ValueError):
+        compile_selectors(selector)
+
+@pytest.mark.parametrize('selector, tag, attrs, expected', [
+    ('.keyword', 'span', {'class_': 'keyword highlight'}, True),
+    ('.keyword', 'span', {'class_': 'keywords'}, False),
+    ('span.a.b', 'span', {'class_': 'b a'}, True),
+    ('span.a.b', 'div', {'class_': 'a b'}, False),
+    ('#main', 'div', {'id': 'main'}, True),
+    ('[data-kw]', 'td', {'data-kw': ''}, True),
+    ('a[href^="/search"]', 'a', {'href': '/search?q=x'}, True),
+    ('a[href$=".html"]', 'a', {'href': '/page.htm'}, False),
+    ('a[href*=query]', 'a', {'href': '/x?query=1'}, True),
+    ('[rel~=tag]', 'a', {'rel': 'nofollow tag'}, True),
+    ('[lang|=ko]', 'p', {'lang': 'ko-KR'}, True),
+    ('[lang|=ko]', 'p', {'lang': 'kor'}, False),
+])
+def test_selector_matching(selector, tag, attrs, expected):
+    assert matches(selector, tag, **attrs) is expected
+
+def test_profile_rules_and_attribute_source():
+    profile = ExtractionProfile('tags', selectors='a.tag', source='data-keyword', min_length=2, max_length=5,
+                                stopwords=['광고'], limit=2)
+    html = ''.join(f'<a class="tag" data-keyword="{value}">무시</a>' for value in ['가', '광고', '여섯글자넘음', '캠핑', '텐트', '침낭'])
+    
+    keywords, info = extract_keywords(html, profile=profile)
+    
+    assert keywords == ['캠핑', '텐트']
+    assert info == {'total_found': 6, 'duplicates_removed': 0, 'new_keywords': 3, 'profile': 'tags'}
+
+def test_auto_picks_the_profile_with_the_most_valid_keywords():
+    profiles = load_profiles({
+        'cells': {'selectors': 'td.kw'},
+        'links': {'selectors': 'a[data-kw]', 'source': 'data-kw'},
+    })
+    html = '<td class="kw">캠핑</td><a data-kw="텐트"></a><a data-kw="침낭"></a><span class="keyword">x</span>'
+    
+    keywords, info = extract_keywords(html, profile='auto', profiles=profiles)
+    
+    assert (keywords, info['profile']) == (['텐트', '침낭'], 'links')
+    # 같은 개수면 앞쪽 프로필
+    _, info = extract_keywords('<td class="kw">캠핑</td><a data-kw="텐트"></a>', profile='auto', profiles=profiles)
+    assert info['profile'] == 'cells'
+
+def test_load_profiles_validates_names_and_options():
+    assert list(load_profiles({'custom': {'selectors': '.kw'}})) == ['default', 'custom']
+    with pytest.raises(ValueError, match='auto'):
+        load_profiles({'auto': {'selectors': '.kw'}})
+    with pytest.raises(ValueError, match='알 수 없는 항목'):
+        load_profiles({'custom': {'selectors': '.kw', 'selector': '.kw'}})
+    with pytest.raises(ValueError, match='알 수 없는 추출 프로필'):
+        extract_keywords('', profile='없는프로필')
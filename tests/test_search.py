@@ -0,0 +1,74 @@
+"""통합 검색 역색인이 str.contains(검색어, case=False, regex=False) 결과와 같은지 검사 (추가/수정/삭제 후 포함)"""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.generators import make_keyword_table
+from keyword_core.frame import to_typed_frame
+from keyword_core.search import SEARCH_COLUMNS, SearchIndex
+
+def contains_labels(df, query):
+    """기존 방식: 세 필드 중 하나라도 검색어를 포함하는 행"""
+    mask = np.zeros(len(df), dtype=bool)
+    for column in SEARCH_COLUMNS:
+        mask |= df[column].str.contains(query, case=False, na=False, regex=False).to_numpy(dtype=bool)
+    return sorted(df.index[mask])
+
+def queries_for(df, seed):
+    """행 값에서 잘라 낸 부분 문자열(대소문자 섞음) + 필드 경계를 넘는 문자열 + 없는 문자열"""
+    rng = random.Random(seed)
+    queries = ['', 'BEST', 'Diy', '2', '다', '주 작', '없는검색어', 'best 다이어트', 'x']
+    for _ in range(60):
+        text = str(df[rng.choice(SEARCH_COLUMNS)].iloc[rng.randrange(len(df))])
+        if text:
+            start = rng.randrange(len(text))
+            query = text[start:start + rng.randint(1, 5)]
+            queries.append(query.upper() if rng.random() < 0.3 else query)
+    row = df.iloc[0]
+    # 키워드 끝과 프로젝트명 앞을 이은 검색어는 어느 필드에도 없으므로 찾지 않아야 함
+    queries.append(str(row['키워드'])[-2:] + str(row['프로젝트명'])[:2])
+    return queries
+
+@pytest.fixture
+def table():
+    return to_typed_frame(make_keyword_table(2000, seed=11))
+
+def test_search_matches_str_contains(table):
+    index = SearchIndex.from_frame(table)
+    
+    for query in queries_for(table, seed=1):
+        assert sorted(index.search(query)) == contains_labels(table, query), query
+
+def test_search_matches_str_contains_after_add_update_discard(table):
+    index = SearchIndex.from_frame(table)
+    
+    # 추가: 새 라벨로 행 추가
+    new_rows = to_typed_frame(make_keyword_table(50, seed=12)).set_axis(range(5000, 5050))
+    new_rows.loc[5000, '키워드'] = 'NEW Keyword 추가됨'
+    table = pd.concat([table, new_rows])
+    for label in new_rows.index:
+        index.add(label, [table.at[label, column] for column in SEARCH_COLUMNS])
+    # 수정: 기존 행의 키워드와 메모 변경
+    for label in table.index[:30]:
+        table.at[label, '키워드'] = f'바뀐 키워드 {label}'
+        table.at[label, '메모'] = 'Memo 수정'
+        index.add(label, [table.at[label, column] for column in SEARCH_COLUMNS])
+    # 삭제: 일부 행 제거
+    removed = list(table.index[30:80]) + [5001]
+    table = table.drop(index=removed)
+    for label in removed:
+        index.discard(label)
+    
+    assert len(index) == len(table)
+    for query in queries_for(table, seed=2) + ['바뀐', 'memo 수정', 'new keyword', '키워드 1']:
+        assert sorted(index.search(query)) == contains_labels(table, query), query
+
+def test_non_text_values_are_not_searched():
+    df = pd.DataFrame({'키워드': ['캠핑', None, 2024], '프로젝트명': ['p', 'p', 'p'], '메모': [float('nan'), '', '2024']})
+    index = SearchIndex.from_frame(df)
+    
+    for query in ['캠핑', '2024', 'nan', 'none', 'p']:
+        assert sorted(index.search(query)) == contains_labels(df, query), query
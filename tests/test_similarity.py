@@ -0,0 +1,67 @@
+"""유사 키워드 인덱스(MinHash/LSH) 검사: 임계값, 정확한 중복 제외, 추가/삭제, 전수 비교 대비 재현율"""
+
+from benchmarks.generators import make_keywords
+from keyword_core.dedupe import normalize_keyword
+from keyword_core.similarity import NearDuplicateIndex, find_near_duplicates, jaccard, shingles
+
+def similarity(left, right):
+    return jaccard(shingles(normalize_keyword(left)), shingles(normalize_keyword(right)))
+
+def test_shingles_and_jaccard():
+    assert shingles('다이어트') == {'다이', '이어', '어트'}
+    assert shingles('가') == {'가'} and shingles('') == frozenset()
+    assert jaccard(shingles('abcd'), shingles('abce')) == 0.5
+    assert jaccard(frozenset(), shingles('ab')) == 0.0
+
+def test_query_applies_the_threshold_and_skips_exact_duplicates():
+    index = NearDuplicateIndex(['다이어트 식단표', '캠핑 의자 추천', '다이어트식단표'])
+    
+    assert index.query('다이어트 식단표 추천', threshold=0.5) == [('다이어트 식단표', similarity('다이어트 식단표 추천', '다이어트 식단표'))]
+    assert index.query('다이어트 식단표 추천', threshold=0.9) == []
+    # 정규화 키가 같은 것은 정확한 중복 검사(KeywordIndex)가 맡음
+    assert index.query('다이어트식단표', threshold=0.1) == []
+    assert index.best_match('캠핑의자추천템') == ('캠핑 의자 추천', similarity('캠핑의자추천템', '캠핑 의자 추천'))
+
+def test_discard_by_row_id():
+    index = NearDuplicateIndex()
+    index.add('캠핑 의자 추천', 'r1')
+    index.add('캠핑의자 추천', 'r2')
+    
+    index.discard('r1')
+    assert index.best_match('캠핑 의자 추천템') is not None
+    index.discard('r2')
+    assert index.best_match('캠핑 의자 추천템') is None and len(index) == 0
+
+def test_bulk_and_single_adds_build_the_same_index():
+    keywords = make_keywords(300, seed=5)
+    bulk = NearDuplicateIndex()
+    bulk.add_many((keyword, f'r{i}') for i, keyword in enumerate(keywords))
+    single = NearDuplicateIndex()
+    for i, keyword in enumerate(keywords):
+        single.add(keyword, f'r{i}')
+    
+    assert bulk._buckets == single._buckets
+
+def test_lsh_finds_nearly_every_close_pair_without_false_matches():
+    stored = make_keywords(400, seed=7)
+    index = NearDuplicateIndex(stored)
+    queries = [keyword + ' 추천' for keyword in stored[:150]] + make_keywords(100, seed=8)
+    
+    expected = found = 0
+    for query in queries:
+        key = normalize_keyword(query)
+        matches = dict(index.query(query, threshold=0.5, limit=len(stored)))
+        close = {keyword for keyword in stored if normalize_keyword(keyword) != key and similarity(query, keyword) >= 0.65}
+        assert all(similarity(query, keyword) >= 0.5 for keyword in matches)
+        expected += len(close)
+        found += len(close & set(matches))
+    
+    assert expected and found / expected >= 0.95
+
+def test_find_near_duplicates():
+    index = NearDuplicateIndex(['다이어트 식단표'])
+    
+    assert find_near_duplicates(['다이어트 식단표 추천', '캠핑'], index) == {
+        '다이어트 식단표 추천': ('다이어트 식단표', similarity('다이어트 식단표 추천', '다이어트 식단표'))
+    }
+    assert find_near_duplicates(['다이어트 식단표 추천'], NearDuplicateIndex()) == {}
@@ -0,0 +1,61 @@
+"""SQLiteStore 읽기/추가/수정/정리 왕복 검사"""
+
+import pytest
+
+from keyword_core.storage import TOMBSTONE, SQLiteStore, StorageError, new_keyword_rows
+
+def seeded_store(path=':memory:', keywords=('aa', 'bb', 'cc')):
+    store = SQLiteStore(str(path))
+    rows = new_keyword_rows('프로젝트', keywords)
+    store.append(rows)
+    return store, {row['키워드']: row['ID'] for row in rows}
+
+def test_load_returns_appended_rows_in_order_as_sheet_values():
+    store, ids = seeded_store()
+    
+    df = store.load()
+    
+    assert list(df['키워드']) == ['aa', 'bb', 'cc']
+    assert list(df['ID']) == [ids['aa'], ids['bb'], ids['cc']]
+    assert set(df['사용여부']) == {'❌'}
+    assert df.attrs['tombstone_count'] == 0
+
+def test_patch_updates_rows_and_reports_unknown_ids():
+    store, ids = seeded_store()
+    
+    missing = store.patch({ids['bb']: {'사용여부': True, '메모': '메모'}, '없는ID': {'메모': 'x'}})
+    
+    assert missing == ['없는ID']
+    row = store.load().set_index('키워드').loc['bb']
+    assert (row['사용여부'], row['메모']) == ('✅', '메모')
+
+def test_patch_with_unknown_column_changes_nothing():
+    store, ids = seeded_store()
+    
+    with pytest.raises(StorageError, match="알 수 없는 컬럼"):
+        store.patch({ids['aa']: {'메모': 'x'}, ids['bb']: {'없는컬럼': 'y'}})
+    
+    assert set(store.load()['메모']) == {''}
+
+def test_tombstones_are_hidden_until_compacted():
+    store, ids = seeded_store()
+    store.patch({ids['aa']: {'삭제여부': TOMBSTONE}, ids['cc']: {'삭제여부': TOMBSTONE}})
+    
+    df = store.load()
+    assert list(df['키워드']) == ['bb']
+    assert df.attrs['tombstone_count'] == 2
+    
+    assert store.compact() == 2
+    assert store.compact() == 0
+    assert store.load().attrs['tombstone_count'] == 0
+    assert store.patch({ids['aa']: {'메모': 'x'}}) == [ids['aa']]
+
+def test_rows_persist_across_reopening_the_file(tmp_path):
+    path = tmp_path / 'keywords.db'
+    store, ids = seeded_store(path)
+    store.patch({ids['cc']: {'메모': '남아 있음'}})
+    
+    reopened = SQLiteStore(str(path))
+    
+    assert reopened.location == 'keywords.db'
+    assert list(reopened.load()['메모']) == ['', '', '남아 있음']
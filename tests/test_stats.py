@@ -0,0 +1,71 @@
+"""프로젝트 × 상태 집계 검사: 저장/수정/삭제를 하나씩 반영한 값이 전체를 다시 센 값과 같은지"""
+
+import random
+
+from benchmarks.generators import make_keyword_table
+from keyword_core.cache import SheetCache
+from keyword_core.frame import STATUS_COLUMNS
+from keyword_core.stats import KeywordStats
+from keyword_core.storage import TOMBSTONE, new_keyword_rows
+
+def recount(df):
+    return KeywordStats.from_frame(df)
+
+def assert_same(stats, df):
+    expected = recount(df)
+    assert stats.total == expected.total == len(df)
+    assert stats.by_project() == expected.by_project()
+    for statuses in ({}, {'사용여부': True}, {'사용여부': False, '티스토리작성': True}):
+        assert stats.summary(**statuses) == expected.summary(**statuses)
+
+def test_summary_counts_sheet_and_typed_values():
+    stats = KeywordStats()
+    stats.add({'프로젝트명': 'a', '사용여부': '✅', '티스토리작성': True, '블로그스팟작성': '❌'})
+    stats.add({'프로젝트명': 'a', '사용여부': False})
+    stats.add({'프로젝트명': None, '사용여부': True, '블로그스팟작성': True})
+    
+    assert stats.summary() == {'total': 3, 'used': 2, 'unused': 1, 'tistory': 1, 'blogspot': 1}
+    assert stats.summary('a', 사용여부=True) == {'total': 1, 'used': 1, 'unused': 0, 'tistory': 1, 'blogspot': 0}
+    assert list(stats.by_project()) == ['', 'a']
+    
+    stats.update({'프로젝트명': 'a', '사용여부': False}, {'프로젝트명': 'b', '사용여부': False})
+    stats.remove({'프로젝트명': None, '사용여부': True, '블로그스팟작성': True})
+    assert stats.by_project() == {
+        'a': {'total': 1, 'used': 1, 'unused': 0, 'tistory': 1, 'blogspot': 0},
+        'b': {'total': 1, 'used': 0, 'unused': 1, 'tistory': 0, 'blogspot': 0},
+    }
+
+def test_cache_counts_match_a_recount_after_saves_edits_and_deletes():
+    rng = random.Random(31)
+    cache = SheetCache(ttl=3600)
+    cache.get(lambda: make_keyword_table(500, seed=31))
+    
+    for step in range(300):
+        df = cache.get(lambda: None)
+        row_ids = list(df['ID'])
+        action = rng.random()
+        if action < 0.2:
+            cache.add_rows(new_keyword_rows(f'프로젝트{rng.randint(1, 12):02d}', [f'새 키워드 {step}']))
+        elif action < 0.35:
+            cache.apply_changes(rng.choice(row_ids), {'삭제여부': TOMBSTONE})
+        else:
+            changes = {column: rng.random() < 0.5 for column in rng.sample(STATUS_COLUMNS, rng.randint(1, 3))}
+            if rng.random() < 0.2:
+                changes['프로젝트명'] = f'프로젝트{rng.randint(1, 12):02d}'
+            cache.apply_changes(rng.choice(row_ids), changes)
+        if step % 50 == 0:
+            assert_same(cache.stats, cache.get(lambda: None))
+    
+    assert_same(cache.stats, cache.get(lambda: None))
+
+def test_from_frame_handles_missing_status_columns():
+    df = make_keyword_table(50, seed=32).drop(columns=['블로그스팟작성'])
+    
+    stats = KeywordStats.from_frame(df)
+    
+    one_by_one = KeywordStats()
+    for row in df.to_dict('records'):
+        one_by_one.add(row)
+    
+    assert stats.summary()['total'] == 50 and stats.summary()['blogspot'] == 0
+    assert stats.by_project() == one_by_one.by_project()
@@ -0,0 +1,131 @@
+"""쓰기 지연 큐의 재시도(일시적 오류)와 포기(영구 오류·찾지 못한 행) 검사"""
+
+import threading
+import time
+
+from keyword_core.fake_sheets import FakeSheetsConnection, RateLimitError
+from keyword_core.storage import (
+    SHEET_COLUMNS, TOMBSTONE, GSheetsStore, StorageError, is_transient_error, new_keyword_rows, to_sheet_row
+)
+from keyword_core.write_queue import WriteBehindQueue
+
+def make_queue(flush_fn, **options):
+    # 백그라운드 주기 반영은 사실상 끄고 flush()로만 반영
+    return WriteBehindQueue(flush_fn, interval=3600, batch_size=10, **options)
+
+def test_transient_errors_are_classified():
+    class APIError(Exception):
+        def __init__(self, status_code):
+            super().__init__(f"status {status_code}")
+            self.response = type('Response', (), {'status_code': status_code})()
+    
+    assert is_transient_error(RateLimitError("APIError: [429]: Quota exceeded"))
+    assert is_transient_error(APIError(503))
+    assert is_transient_error(ConnectionResetError())
+    assert is_transient_error(Exception("APIError: [500]: Internal error"))
+    assert not is_transient_error(APIError(404))
+    assert not is_transient_error(StorageError("알 수 없는 컬럼: 없는컬럼"))
+    assert not is_transient_error(KeyError('ID'))
+
+def test_quota_errors_are_retried_until_they_succeed():
+    rows = new_keyword_rows('p', ['aa'])
+    conn = FakeSheetsConnection(worksheets={'키워드관리': [list(SHEET_COLUMNS)] + [to_sheet_row(row) for row in rows]})
+    dropped = []
+    queue = make_queue(GSheetsStore(conn).patch, on_dropped=dropped.extend)
+    queue.enqueue(rows[0]['ID'], {'메모': '할당량이 풀리면 반영'})
+    conn.fail_next(20)
+    
+    for _ in range(20):
+        assert queue.flush() == 0
+    assert queue.failures == 20 and '429' in queue.last_error
+    assert queue.pending_edits() == {rows[0]['ID']: {'메모': '할당량이 풀리면 반영'}}
+    
+    assert queue.flush() == 1
+    assert (queue.failures, queue.last_error, dropped) == (0, None, [])
+    assert conn.worksheet_values('키워드관리')[1][SHEET_COLUMNS.index('메모')] == '할당량이 풀리면 반영'
+
+def test_edits_queued_during_a_failed_flush_win_over_the_failed_ones():
+    queue = None
+    
+    def flush_fn(batch):
+        queue.enqueue('a', {'메모': '새 값'})
+        raise RateLimitError("APIError: [429]")
+    
+    queue = make_queue(flush_fn)
+    queue.enqueue('a', {'메모': '옛 값', '사용여부': True})
+    queue.flush()
+    
+    assert queue.pending_edits() == {'a': {'메모': '새 값', '사용여부': True}}
+
+def test_permanent_error_drops_only_the_bad_row():
+    applied = {}
+    
+    def flush_fn(batch):
+        if any('없는컬럼' in changes for changes in batch.values()):
+            raise StorageError("알 수 없는 컬럼: 없는컬럼")
+        applied.update(batch)
+        return []
+    
+    dropped = []
+    queue = make_queue(flush_fn, on_dropped=dropped.extend)
+    queue.enqueue('a', {'메모': 'x'})
+    queue.enqueue('b', {'없는컬럼': 'y'})
+    queue.enqueue('c', {'메모': 'z'})
+    
+    assert queue.flush() == 2
+    assert applied == {'a': {'메모': 'x'}, 'c': {'메모': 'z'}}
+    assert [entry['id'] for entry in queue.dropped_edits()] == ['b']
+    assert '없는컬럼' in queue.dropped_edits()[0]['reason']
+    assert dropped == queue.dropped_edits()
+    assert queue.pending_edits() == {} and queue.failures == 0
+    
+    queue.clear_dropped()
+    assert queue.dropped_edits() == []
+
+def test_missing_rows_are_reported_except_tombstones():
+    queue = make_queue(lambda batch: ['a', 'b'])
+    queue.enqueue('a', {'메모': 'x'})
+    queue.enqueue('b', {'삭제여부': TOMBSTONE})
+    queue.enqueue('c', {'메모': 'y'})
+    
+    assert queue.flush() == 2
+    assert [entry['id'] for entry in queue.dropped_edits()] == ['a']
+    assert queue.pending_edits() == {}
+
+def test_run_if_drained_waits_for_an_empty_queue():
+    queue = make_queue(lambda batch: [])
+    queue.enqueue('a', {'메모': 'x'})
+    
+    assert queue.run_if_drained(lambda: 'ran') is None
+    queue.flush()
+    assert queue.run_if_drained(lambda: 'ran') == 'ran'
+
+def test_flush_now_ends_the_background_backoff():
+    failing = threading.Event()
+    failing.set()
+    flushed = []
+    
+    def flush_fn(batch):
+        if failing.is_set():
+            raise RateLimitError("APIError: [429]")
+        flushed.append(batch)
+        return []
+    
+    queue = WriteBehindQueue(flush_fn, interval=0.05, batch_size=10)
+    queue.enqueue('a', {'메모': 'x'})
+    for _ in range(10):
+        queue.flush()
+    # 백그라운드 루프도 한 번 더 실패하고 나면 최대 간격(60초)만큼 기다림
+    deadline = time.monotonic() + 2
+    while queue.failures < 11 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert queue.failures == 11
+    
+    failing.clear()
+    assert queue.flush_now() == 1
+    queue.enqueue('b', {'메모': 'y'})
+    
+    deadline = time.monotonic() + 2
+    while len(flushed) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert flushed == [{'a': {'메모': 'x'}}, {'b': {'메모': 'y'}}]